@@ -16,7 +16,6 @@ from typing import Optional
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
 
 # Load environment variables
 from dotenv import load_dotenv  # noqa: E402
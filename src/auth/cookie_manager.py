@@ -8,10 +8,19 @@ from typing import Optional, cast
 
 from src.utils.logging import get_logger
 
+# ijson is optional; without it large cookie files are parsed with json like small ones
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without ijson installed
+    ijson = None
+
 logger = get_logger(__name__)
 
 # Required cookies for Facebook authentication
-REQUIRED_COOKIES = ["c_user", "xs"]
+REQUIRED_COOKIES = frozenset({"c_user", "xs"})
+
+# Cookie files larger than this stream only the "cookies" array (needs ijson)
+STREAM_THRESHOLD_BYTES = 256 * 1024
 
 
 class CookieManager:
@@ -25,7 +34,34 @@ class CookieManager:
             cookie_path: Path to cookies.json file
         """
         self.cookie_path = cookie_path
-        self.cookies_data: Optional[dict] = None
+        self._cookies_data: Optional[dict] = None
+        self._by_name: Optional[dict[str, Optional[str]]] = None
+        self._origins_pending = False
+
+    @property
+    def cookies_data(self) -> Optional[dict]:
+        """Loaded cookie data in Playwright storage state format, or None."""
+        return self._cookies_data
+
+    @cookies_data.setter
+    def cookies_data(self, value: Optional[dict]) -> None:
+        # Any reassignment invalidates the name -> value index
+        self._cookies_data = value
+        self._by_name = None
+        self._origins_pending = False
+
+    @staticmethod
+    def _index_cookies(cookies: dict) -> dict[str, Optional[str]]:
+        """
+        Build a cookie name -> value lookup.
+
+        Args:
+            cookies: Cookie data dictionary with a "cookies" list
+
+        Returns:
+            Dictionary mapping each cookie name to its value (first occurrence wins)
+        """
+        return {cookie.get("name"): cookie.get("value") for cookie in reversed(cookies["cookies"])}
 
     def load_cookies(self) -> dict:
         """
@@ -46,8 +82,13 @@ class CookieManager:
             )
 
         try:
-            with open(self.cookie_path, encoding="utf-8") as f:
-                self.cookies_data = json.load(f)
+            streamed = self._stream_cookies()
+            if streamed is not None:
+                self.cookies_data = {"cookies": streamed, "origins": []}
+                self._origins_pending = True
+            else:
+                with open(self.cookie_path, encoding="utf-8") as f:
+                    self.cookies_data = json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Invalid JSON format in cookie file: {self.cookie_path}\n"
@@ -65,9 +106,46 @@ class CookieManager:
                 'Expected structure: {"cookies": [{"name": ..., "value": ..., "domain": ..., "path": ...}], "origins": []}'
             )
 
+        self._by_name = self._index_cookies(self.cookies_data)
+
         logger.info(f"Successfully loaded cookies from {self.cookie_path}")
         return self.cookies_data
 
+    def _stream_cookies(self) -> Optional[list]:
+        """
+        Stream the "cookies" array out of a large cookie file with ijson.
+
+        Large Playwright storage-state exports are mostly "origins" data, which
+        is only needed by get_storage_state and is loaded there on demand.
+
+        Returns:
+            List of cookie dicts, or None if the file should be parsed with json
+            (ijson unavailable, file under STREAM_THRESHOLD_BYTES, or no cookies
+            found, so that full parsing reports format errors as before)
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        if ijson is None or self.cookie_path.stat().st_size <= STREAM_THRESHOLD_BYTES:
+            return None
+
+        try:
+            with open(self.cookie_path, "rb") as f:
+                cookies = list(ijson.items(f, "cookies.item", use_float=True))
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+        return cookies or None
+
+    def _load_origins(self) -> None:
+        """Stream the "origins" array into cookies_data after a streamed load."""
+        if not self._origins_pending or self.cookies_data is None:
+            return
+
+        with open(self.cookie_path, "rb") as f:
+            self.cookies_data["origins"] = list(ijson.items(f, "origins.item", use_float=True))
+        self._origins_pending = False
+
     def validate_cookie_format(self, cookies: dict) -> bool:
         """
         Validate that cookies match Playwright storage state format.
@@ -118,20 +196,21 @@ class CookieManager:
             cookies: Cookie data dictionary (uses self.cookies_data if None)
 
         Returns:
-            Tuple of (all_present: bool, missing_cookies: list[str])
+            Tuple of (all_present: bool, missing_cookies: list[str]), with
+            missing cookie names sorted alphabetically
         """
         if cookies is None:
             cookies = self.cookies_data
 
         if cookies is None:
             logger.warning("No cookie data available for validation")
-            return False, REQUIRED_COOKIES.copy()
+            return False, sorted(REQUIRED_COOKIES)
 
         if "cookies" not in cookies:
-            return False, REQUIRED_COOKIES.copy()
+            return False, sorted(REQUIRED_COOKIES)
 
         cookie_names = {cookie.get("name") for cookie in cookies["cookies"]}
-        missing = [name for name in REQUIRED_COOKIES if name not in cookie_names]
+        missing = sorted(REQUIRED_COOKIES - cookie_names)
 
         if missing:
             logger.warning(f"Missing required cookies: {missing}")
@@ -157,9 +236,16 @@ class CookieManager:
         if cookies is None or "cookies" not in cookies:
             return None
 
-        for cookie in cookies["cookies"]:
-            if cookie.get("name") == name:
-                return cast(Optional[str], cookie.get("value"))
+        if cookies is self.cookies_data:
+            # Loaded cookies are looked up through the name index
+            if self._by_name is None:
+                self._by_name = self._index_cookies(cookies)
+            if name in self._by_name:
+                return self._by_name[name]
+        else:
+            for cookie in cookies["cookies"]:
+                if cookie.get("name") == name:
+                    return cast(Optional[str], cookie.get("value"))
 
         logger.debug(f"Cookie '{name}' not found")
         return None
@@ -184,4 +270,5 @@ class CookieManager:
                 f"Missing required cookies: {missing}\nPlease re-export your Facebook cookies."
             )
 
+        self._load_origins()
         return self.cookies_data
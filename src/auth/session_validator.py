@@ -2,6 +2,8 @@
 Session validation module for verifying Facebook authentication status.
 """
 
+import re
+
 from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
@@ -12,6 +14,18 @@ logger = get_logger(__name__)
 # Facebook mbasic base URL
 MBASIC_URL = "https://mbasic.facebook.com"
 
+# URL fragments that mean we landed on a login page (covers www.facebook.com/login)
+_LOGIN_URL_RE = re.compile(r"login|checkpoint", re.IGNORECASE)
+
+# URL fragments that mean Facebook is asking for a 2FA/checkpoint step
+_CHALLENGE_URL_RE = re.compile(r"checkpoint|two-factor|2fa", re.IGNORECASE)
+
+# Page text that indicates a 2FA challenge
+_CHALLENGE_TEXT_RE = re.compile(
+    r"two-factor|two factor|security code|verification code|enter code|checkpoint",
+    re.IGNORECASE,
+)
+
 
 class SessionValidator:
     """Validates Facebook session by checking for login redirects and session indicators."""
@@ -77,11 +91,10 @@ class SessionValidator:
         Returns:
             True if redirected to login, False otherwise
         """
-        current_url = page.url.lower()
+        current_url = page.url
 
         # Check URL for login indicators
-        login_indicators = ["login", "checkpoint", "www.facebook.com/login"]
-        if any(indicator in current_url for indicator in login_indicators):
+        if _LOGIN_URL_RE.search(current_url):
             logger.debug(f"Login redirect detected in URL: {current_url}")
             return True
 
@@ -165,27 +178,16 @@ class SessionValidator:
         Returns:
             True if 2FA challenge detected, False otherwise
         """
-        current_url = page.url.lower()
+        current_url = page.url
 
         # Check URL for checkpoint/2FA indicators
-        checkpoint_indicators = ["checkpoint", "two-factor", "2fa"]
-        if any(indicator in current_url for indicator in checkpoint_indicators):
+        if _CHALLENGE_URL_RE.search(current_url):
             logger.debug(f"2FA checkpoint detected in URL: {current_url}")
             return True
 
         # Check page content for 2FA-related text
         try:
-            page_content = page.content().lower()
-            challenge_texts = [
-                "two-factor",
-                "two factor",
-                "security code",
-                "verification code",
-                "enter code",
-                "checkpoint",
-            ]
-
-            if any(text in page_content for text in challenge_texts):
+            if _CHALLENGE_TEXT_RE.search(page.content()):
                 logger.debug("2FA challenge text detected in page content")
                 return True
         except Exception as e:
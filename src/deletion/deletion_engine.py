@@ -2,8 +2,9 @@
 Deletion engine for orchestrating item extraction, handler selection, and deletion.
 """
 
+import re
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
@@ -19,6 +20,9 @@ from src.utils.state_manager import StateManager
 
 logger = get_logger(__name__)
 
+# Handler failure messages worth retrying
+_TRANSIENT_RE = re.compile(r"timeout|network", re.IGNORECASE)
+
 
 class DeletionEngine:
     """Orchestrates deletion of items from Activity Log pages."""
@@ -69,6 +73,39 @@ class DeletionEngine:
             f"target_date={self.target_date.date()}"
         )
 
+    @property
+    def handlers(self) -> tuple[DeletionHandler, ...]:
+        """Handlers in priority order."""
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, handlers: Sequence[DeletionHandler]) -> None:
+        """
+        Set the handlers and rebuild the item-type dispatch table.
+
+        The table narrows each item type to the handlers that may accept it:
+        those whose own class declares the type in HANDLED_TYPES, plus every
+        handler that declares none (inherited HANDLED_TYPES do not count, so a
+        subclass is always consulted). Candidates are still asked through
+        can_handle() in list order. Handlers are stored as a tuple so the
+        table cannot drift from them.
+
+        Args:
+            handlers: Handlers in priority order
+        """
+        self._handlers = tuple(handlers)
+        typed: list[tuple[DeletionHandler, tuple[str, ...]]] = []
+        for handler in self._handlers:
+            # Read from the class itself so subclasses and test doubles count as untyped
+            typed.append((handler, vars(type(handler)).get("HANDLED_TYPES", ())))
+
+        self._untyped_handlers = tuple(handler for handler, types in typed if not types)
+        self._handler_map: Dict[str, tuple[DeletionHandler, ...]] = {}
+        for item_type in {item_type for _, types in typed for item_type in types}:
+            self._handler_map[item_type] = tuple(
+                handler for handler, types in typed if not types or item_type in types
+            )
+
     def process_page(self, page: Optional[Page] = None) -> Dict[str, Any]:
         """
         Process all deletable items on the current page.
@@ -190,7 +227,7 @@ class DeletionEngine:
                 if success:
                     return True, message
                 # If deletion failed but not due to transient error, don't retry
-                if "timeout" not in message.lower() and "network" not in message.lower():
+                if not _TRANSIENT_RE.search(message):
                     return False, message
                 last_error = message
             except PlaywrightTimeoutError as e:
@@ -215,7 +252,8 @@ class DeletionEngine:
         Returns:
             DeletionHandler instance or None if no handler found
         """
-        for handler in self.handlers:
+        candidates = self._handler_map.get(item.get("type", ""), self._untyped_handlers)
+        for handler in candidates:
             try:
                 if handler.can_handle(item):
                     self.logger.debug(f"Selected handler: {type(handler).__name__}")
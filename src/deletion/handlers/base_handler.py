@@ -16,6 +16,11 @@ logger = get_logger(__name__)
 class DeletionHandler(ABC):
     """Abstract base class for content-specific deletion handlers."""
 
+    # Item types this handler deletes; DeletionEngine only offers it those
+    # types, still through can_handle(). Handlers that leave it empty, or only
+    # inherit it, are offered every item.
+    HANDLED_TYPES: tuple[str, ...] = ()
+
     def __init__(self, timeout: int = 30000):
         """
         Initialize deletion handler.
@@ -16,6 +16,8 @@ logger = get_logger(__name__)
 class CommentDeletionHandler(DeletionHandler):
     """Handler for deleting Facebook comments."""
 
+    HANDLED_TYPES = ("comment",)
+
     def can_handle(self, item: dict) -> bool:
         """
         Check if this handler can process the item.
@@ -26,7 +28,7 @@ class CommentDeletionHandler(DeletionHandler):
         Returns:
             True if item is a comment, False otherwise
         """
-        return item.get("type") == "comment"
+        return item.get("type") in self.HANDLED_TYPES
 
     def delete(self, page: Page, item: dict) -> tuple[bool, str]:
         """
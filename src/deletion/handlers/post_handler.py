@@ -16,6 +16,8 @@ logger = get_logger(__name__)
 class PostDeletionHandler(DeletionHandler):
     """Handler for deleting standard Facebook posts."""
 
+    HANDLED_TYPES = ("post",)
+
     def can_handle(self, item: dict) -> bool:
         """
         Check if this handler can process the item.
@@ -26,7 +28,7 @@ class PostDeletionHandler(DeletionHandler):
         Returns:
             True if item is a post, False otherwise
         """
-        return item.get("type") == "post"
+        return item.get("type") in self.HANDLED_TYPES
 
     def delete(self, page: Page, item: dict) -> tuple[bool, str]:
         """
@@ -16,6 +16,8 @@ logger = get_logger(__name__)
 class ReactionRemovalHandler(DeletionHandler):
     """Handler for removing Facebook likes and reactions."""
 
+    HANDLED_TYPES = ("reaction",)
+
     def can_handle(self, item: dict) -> bool:
         """
         Check if this handler can process the item.
@@ -26,7 +28,7 @@ class ReactionRemovalHandler(DeletionHandler):
         Returns:
             True if item is a reaction, False otherwise
         """
-        return item.get("type") == "reaction"
+        return item.get("type") in self.HANDLED_TYPES
 
     def delete(self, page: Page, item: dict) -> tuple[bool, str]:
         """
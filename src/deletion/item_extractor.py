@@ -2,6 +2,7 @@
 Item extractor for parsing Activity Log pages and extracting deletable items.
 """
 
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, cast
 
@@ -12,6 +13,40 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Delete/unlike link selectors, in priority order
+DELETE_LINK_SELECTORS = (
+    'a:has-text("Delete")',
+    'a:has-text("Remove")',
+    'a:has-text("Unlike")',
+    'a:has-text("Remove reaction")',
+    'a[href*="delete"]',
+    'a[href*="remove"]',
+    'a[href*="unlike"]',
+    'button:has-text("Delete")',
+)
+
+# All of the above as one selector list, so the item is queried once
+_DELETE_LINK_SELECTOR = ", ".join(DELETE_LINK_SELECTORS)
+
+# Element attributes that carry an item ID, checked in order
+_ID_ATTRS = ("id", "data-id")
+
+# Item ID in a delete link href, e.g. delete.php?id=123
+_DELETE_ID_RE = re.compile(r"[?&]id=(\d+)")
+
+# Date-like text in an item, in priority order: "November 3", "2 years ago", "Today"
+_DATE_TEXT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}",
+        r"\d{1,2}\s+(years?|months?|days?|hours?)\s+ago",
+        r"(Today|Yesterday)",
+    )
+)
+
+# Item types removed through their unlike link, so no delete link is needed
+_NO_DELETE_LINK_TYPES = frozenset({"reaction"})
+
 
 class ItemExtractor:
     """Extracts deletable items from Activity Log pages."""
@@ -116,6 +151,12 @@ class ItemExtractor:
             if date_string:
                 date_parsed = self.date_parser.parse_facebook_date(date_string)
 
+            # Items on or after the target date are dropped by extract_items anyway,
+            # so skip the remaining DOM queries for them
+            if date_parsed and date_parsed >= self.target_date:
+                logger.debug(f"Skipping item after target date: {date_string}")
+                return None
+
             # Determine item type
             item_type = self._determine_item_type(element)
 
@@ -180,19 +221,10 @@ class ItemExtractor:
         # Fallback: look for date-like text in the element
         try:
             text = element.text_content()
-            if text:
-                # Look for common date patterns
-                import re
-
-                # Patterns like "November 3, 2020" or "2 years ago"
-                date_patterns = [
-                    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}",
-                    r"\d{1,2}\s+(years?|months?|days?|hours?)\s+ago",
-                    r"(Today|Yesterday)",
-                ]
-
-                for pattern in date_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
+            # Blank text cannot contain a date; skip the pattern scans
+            if text and not text.isspace():
+                for pattern in _DATE_TEXT_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         return match.group(0)
         except Exception:
@@ -247,18 +279,22 @@ class ItemExtractor:
         Returns:
             Locator for delete link or None
         """
-        delete_selectors = [
-            'a:has-text("Delete")',
-            'a:has-text("Remove")',
-            'a:has-text("Unlike")',
-            'a:has-text("Remove reaction")',
-            'a[href*="delete"]',
-            'a[href*="remove"]',
-            'a[href*="unlike"]',
-            'button:has-text("Delete")',
-        ]
+        # One query for all selectors; a single visible match needs no ranking
+        try:
+            matches = element.locator(_DELETE_LINK_SELECTOR)
+            match_count = matches.count()
+            if match_count == 0:
+                return None
+            if match_count == 1:
+                link = matches.first
+                if link.is_visible():
+                    return link
+        except Exception:
+            pass
 
-        for selector in delete_selectors:
+        # Several matches come back in document order, and a lone match may be
+        # hidden (or the query failed): try selectors one by one in priority order
+        for selector in DELETE_LINK_SELECTORS:
             try:
                 link = element.locator(selector).first
                 if link.count() > 0 and link.is_visible():
@@ -279,15 +315,11 @@ class ItemExtractor:
             Item ID string or None
         """
         try:
-            # Try ID attribute
-            item_id = element.get_attribute("id")
-            if item_id:
-                return cast(Optional[str], item_id)
-
-            # Try data attributes
-            data_id = element.get_attribute("data-id")
-            if data_id:
-                return cast(Optional[str], data_id)
+            # Try ID and data attributes
+            for attr in _ID_ATTRS:
+                item_id = element.get_attribute(attr)
+                if item_id:
+                    return cast(Optional[str], item_id)
 
             # Try extracting from href if delete link exists
             delete_link = self._find_delete_link(element)
@@ -295,9 +327,7 @@ class ItemExtractor:
                 href = delete_link.get_attribute("href")
                 if href:
                     # Extract ID from URL if present
-                    import re
-
-                    match = re.search(r"[?&]id=(\d+)", href)
+                    match = _DELETE_ID_RE.search(href)
                     if match:
                         return match.group(1)
 
@@ -317,11 +347,12 @@ class ItemExtractor:
             True if item appears deletable, False otherwise
         """
         # Must have a type
-        if not item.get("type"):
+        item_type = item.get("type")
+        if not item_type:
             return False
 
-        # Must have either a delete link or be a reaction (which may have unlike link)
-        if not item.get("delete_link") and item.get("type") != "reaction":
-            return False
+        # Reactions may only have an unlike link; everything else needs a delete link
+        if item_type in _NO_DELETE_LINK_TYPES:
+            return True
 
-        return True
+        return bool(item.get("delete_link"))
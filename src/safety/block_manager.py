@@ -77,6 +77,18 @@ class BlockManager:
         """
         Determine if script should continue after a block.
 
+        Returns:
+            True if can continue, False if should wait
+        """
+        return self._should_continue_at(datetime.now())
+
+    def _should_continue_at(self, now: datetime) -> bool:
+        """
+        Determine if script should continue after a block, as of a given time.
+
+        Args:
+            now: Current time (read once by the caller)
+
         Returns:
             True if can continue, False if should wait
         """
@@ -86,7 +98,6 @@ class BlockManager:
         if self.last_block_time is None:
             return True
 
-        now = datetime.now()
         hours_since_block = (now - self.last_block_time).total_seconds() / 3600
 
         if hours_since_block < self.block_wait_hours:
@@ -100,6 +111,20 @@ class BlockManager:
         logger.info(f"Block wait period expired ({hours_since_block:.1f} hours)")
         return True
 
+    def compute_multipliers(self) -> tuple[float, float]:
+        """
+        Compute the backoff multipliers for the current block count.
+
+        Returns:
+            Tuple of (mean_delay multiplier, std_dev multiplier); (1.0, 1.0) if
+            no block has been detected
+        """
+        if self.block_count == 0:
+            return 1.0, 1.0
+
+        # Mean grows exponentially with each block; variance widens by 20%
+        return self.backoff_multiplier**self.block_count, 1.2
+
     def apply_backoff(self, rate_limiter: RateLimiter) -> None:
         """
         Apply exponential backoff to rate limiter delays.
@@ -110,19 +135,18 @@ class BlockManager:
         if self.block_count == 0:
             return
 
-        # Calculate backoff multiplier
-        backoff_factor = self.backoff_multiplier**self.block_count
+        mean_factor, std_dev_factor = self.compute_multipliers()
 
         # Store original values for logging
         old_mean = rate_limiter.mean_delay
         old_std_dev = rate_limiter.std_dev
 
         # Apply backoff
-        rate_limiter.mean_delay *= backoff_factor
-        rate_limiter.std_dev *= 1.2  # Increase variance by 20%
+        rate_limiter.mean_delay *= mean_factor
+        rate_limiter.std_dev *= std_dev_factor
 
         logger.warning(
-            f"Applied backoff (block_count={self.block_count}, factor={backoff_factor:.2f}): "
+            f"Applied backoff (block_count={self.block_count}, factor={mean_factor:.2f}): "
             f"mean_delay {old_mean:.2f}s -> {rate_limiter.mean_delay:.2f}s, "
             f"std_dev {old_std_dev:.2f}s -> {rate_limiter.std_dev:.2f}s"
         )
@@ -141,9 +165,10 @@ class BlockManager:
         Returns:
             Dictionary with block information
         """
+        now = datetime.now()
         hours_since_block = None
         if self.last_block_time:
-            hours_since_block = (datetime.now() - self.last_block_time).total_seconds() / 3600
+            hours_since_block = (now - self.last_block_time).total_seconds() / 3600
 
         return {
             "block_detected": self.block_detected,
@@ -151,5 +176,5 @@ class BlockManager:
             "hours_since_block": hours_since_block,
             "block_count": self.block_count,
             "block_wait_hours": self.block_wait_hours,
-            "can_continue": self.should_continue(),
+            "can_continue": self._should_continue_at(now),
         }
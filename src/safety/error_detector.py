@@ -2,6 +2,7 @@
 Error detector for Facebook error messages indicating blocks or throttling.
 """
 
+import re
 from typing import Optional
 
 from playwright.sync_api import Page
@@ -10,6 +11,29 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# URL fragments that indicate an error/block page
+_ERROR_URL_RE = re.compile(
+    r"error|blocked|unavailable|restricted|checkpoint|security", re.IGNORECASE
+)
+
+
+def _compile_indicators(indicators: list) -> tuple[re.Pattern, dict]:
+    """
+    Build the content matcher for a list of error indicators.
+
+    Args:
+        indicators: Indicator strings, in priority order
+
+    Returns:
+        Tuple of (case-insensitive alternation pattern, casefolded text -> index
+        of the indicator in the list; the first listed wins for duplicates)
+    """
+    priority_by_text = {}
+    for index in reversed(range(len(indicators))):
+        priority_by_text[indicators[index].casefold()] = index
+    pattern = re.compile("|".join(re.escape(indicator) for indicator in indicators), re.IGNORECASE)
+    return pattern, priority_by_text
+
 
 class ErrorDetector:
     """Detects Facebook error messages indicating blocks or throttling."""
@@ -27,6 +51,11 @@ class ErrorDetector:
         "Unable to complete",
     ]
 
+    # Built once for the default indicators; instances with extra indicators
+    # compile their own. One alternation scans page content in a single pass
+    # instead of one substring search per indicator.
+    _INDICATOR_RE, _INDICATOR_PRIORITY = _compile_indicators(ERROR_INDICATORS)
+
     def __init__(self, additional_indicators: Optional[list] = None):
         """
         Initialize ErrorDetector.
@@ -35,13 +64,19 @@ class ErrorDetector:
             additional_indicators: Optional list of additional error indicators
         """
         self.indicators = self.ERROR_INDICATORS.copy()
+        self._indicator_re = self._INDICATOR_RE
+        self._indicator_priority = self._INDICATOR_PRIORITY
         if additional_indicators:
             self.indicators.extend(additional_indicators)
+            self._indicator_re, self._indicator_priority = _compile_indicators(self.indicators)
 
     def check_for_errors(self, page: Page) -> tuple[bool, Optional[str]]:
         """
         Check page for error messages.
 
+        When several indicators appear, the one listed first in the indicators
+        is reported, wherever it sits in the page.
+
         Args:
             page: Playwright Page object
 
@@ -56,12 +91,19 @@ class ErrorDetector:
 
         # Check page content
         try:
-            content = page.content().lower()
-
-            for indicator in self.indicators:
-                if indicator.lower() in content:
-                    logger.warning(f"Error detected in page content: '{indicator}'")
-                    return True, f"Error message detected: '{indicator}'"
+            # IGNORECASE matches may not casefold back to a known key; skip those
+            matches = self._indicator_re.finditer(page.content())
+            priorities = [
+                priority
+                for priority in (
+                    self._indicator_priority.get(match.group(0).casefold()) for match in matches
+                )
+                if priority is not None
+            ]
+            if priorities:
+                indicator = self.indicators[min(priorities)]
+                logger.warning(f"Error detected in page content: '{indicator}'")
+                return True, f"Error message detected: '{indicator}'"
 
         except Exception as e:
             logger.debug(f"Error checking page content: {e}")
@@ -80,19 +122,4 @@ class ErrorDetector:
         Returns:
             True if error indicators found in URL, False otherwise
         """
-        url_lower = url.lower()
-
-        error_url_patterns = [
-            "error",
-            "blocked",
-            "unavailable",
-            "restricted",
-            "checkpoint",
-            "security",
-        ]
-
-        for pattern in error_url_patterns:
-            if pattern in url_lower:
-                return True
-
-        return False
+        return _ERROR_URL_RE.search(url) is not None
@@ -2,6 +2,7 @@
 Rate limiter to enforce maximum deletion rate per hour.
 """
 
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -36,7 +37,8 @@ class RateLimiter:
         self.std_dev = std_dev or settings.DELAY_STD_DEV
         self.min_delay = min_delay or settings.MIN_DELAY_SECONDS
 
-        self.action_times: list[datetime] = []
+        # Oldest first; expired entries are popped from the left
+        self.action_times: deque[datetime] = deque()
         self.deleted_count = 0
 
         logger.info(
@@ -44,6 +46,17 @@ class RateLimiter:
             f"mean_delay={self.mean_delay}s, std_dev={self.std_dev}s"
         )
 
+    def _prune(self, now: datetime) -> None:
+        """
+        Drop actions older than one hour.
+
+        Args:
+            now: Current time
+        """
+        cutoff_time = now - timedelta(hours=1)
+        while self.action_times and self.action_times[0] <= cutoff_time:
+            self.action_times.popleft()
+
     def check_rate_limit(self) -> bool:
         """
         Check if hourly rate limit has been exceeded.
@@ -51,11 +64,8 @@ class RateLimiter:
         Returns:
             True if under limit, False if limit exceeded
         """
-        now = datetime.now()
-
         # Remove actions older than 1 hour
-        cutoff_time = now - timedelta(hours=1)
-        self.action_times = [t for t in self.action_times if t > cutoff_time]
+        self._prune(datetime.now())
 
         current_count = len(self.action_times)
 
@@ -104,13 +114,11 @@ class RateLimiter:
         Returns:
             Dictionary with statistics
         """
-        now = datetime.now()
-        cutoff_time = now - timedelta(hours=1)
-        recent_actions = [t for t in self.action_times if t > cutoff_time]
+        self._prune(datetime.now())
 
         return {
             "max_per_hour": self.max_per_hour,
-            "actions_last_hour": len(recent_actions),
+            "actions_last_hour": len(self.action_times),
             "total_actions": self.deleted_count,
             "mean_delay": self.mean_delay,
             "std_dev": self.std_dev,
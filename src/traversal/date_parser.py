@@ -3,7 +3,9 @@ Date parser for Facebook fuzzy date strings.
 """
 
 import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, cast
 
 import dateparser  # type: ignore[import-untyped]
@@ -12,6 +14,67 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# "X <unit>(s) ago", tried in this order
+_RELATIVE_PATTERNS = (
+    (re.compile(r"(\d+)\s+years?\s+ago"), "years"),
+    (re.compile(r"(\d+)\s+months?\s+ago"), "months"),
+    (re.compile(r"(\d+)\s+weeks?\s+ago"), "weeks"),
+    (re.compile(r"(\d+)\s+days?\s+ago"), "days"),
+    (re.compile(r"(\d+)\s+hours?\s+ago"), "hours"),
+)
+
+# Time of day suffix, e.g. "at 4:00pm" (matched against lowercased text)
+_TIME_RE = re.compile(r"at\s+(\d{1,2}):(\d{2})\s*(am|pm)")
+
+# "November 3, 2020" / "Nov 3, 2020", then "November 3" / "Nov 3"
+_MONTH_DAY_YEAR_RE = re.compile(r"(\w+)\s+(\d+),\s*(\d{4})")
+_MONTH_DAY_RE = re.compile(r"(\w+)\s+(\d+)")
+
+# Full and abbreviated month names
+_MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "sept": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+
+@lru_cache(maxsize=1)
+def _now_for_second(epoch_second: int) -> datetime:
+    """
+    Return datetime.now(), computed once per wall-clock second.
+
+    Relative dates are day-granular, so parsing a page of rows can share one
+    reference time instead of building a datetime per row.
+
+    Args:
+        epoch_second: int(time.time()); a new value starts a new cache entry
+
+    Returns:
+        Local time at the first call within that second
+    """
+    return datetime.now()
+
 
 class DateParser:
     """Parses fuzzy date strings from Facebook into datetime objects."""
@@ -46,7 +109,7 @@ class DateParser:
         date_string = date_string.strip()
 
         if reference_date is None:
-            reference_date = datetime.now()
+            reference_date = _now_for_second(int(time.time()))
 
         # Try relative date parsing first
         parsed = self._parse_relative_date(date_string, reference_date)
@@ -102,16 +165,8 @@ class DateParser:
             return yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Pattern: "X years/months/days ago"
-        patterns = [
-            (r"(\d+)\s+years?\s+ago", "years"),
-            (r"(\d+)\s+months?\s+ago", "months"),
-            (r"(\d+)\s+weeks?\s+ago", "weeks"),
-            (r"(\d+)\s+days?\s+ago", "days"),
-            (r"(\d+)\s+hours?\s+ago", "hours"),
-        ]
-
-        for pattern, unit in patterns:
-            match = re.search(pattern, date_string_lower)
+        for pattern, unit in _RELATIVE_PATTERNS:
+            match = pattern.search(date_string_lower)
             if match:
                 value = int(match.group(1))
 
@@ -132,7 +187,7 @@ class DateParser:
                 parsed = reference_date - delta
 
                 # Extract time if present (e.g., "2 years ago at 4:00pm")
-                time_match = re.search(r"at\s+(\d{1,2}):(\d{2})\s*(am|pm)", date_string_lower)
+                time_match = _TIME_RE.search(date_string_lower)
                 if time_match:
                     hour = int(time_match.group(1))
                     minute = int(time_match.group(2))
@@ -164,7 +219,7 @@ class DateParser:
             Parsed datetime or None
         """
         # Extract time if present (will apply later)
-        time_match = re.search(r"at\s+(\d{1,2}):(\d{2})\s*(am|pm)", date_string.lower())
+        time_match = _TIME_RE.search(date_string.lower())
         date_str_without_time = date_string
         if time_match:
             # Remove time from original string (case-sensitive) by finding the position
@@ -245,60 +300,30 @@ class DateParser:
         """
         date_string_lower = date_string.lower().strip()
 
-        # Month names mapping
-        months = {
-            "january": 1,
-            "february": 2,
-            "march": 3,
-            "april": 4,
-            "may": 5,
-            "june": 6,
-            "july": 7,
-            "august": 8,
-            "september": 9,
-            "october": 10,
-            "november": 11,
-            "december": 12,
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "sept": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-
         # Pattern 1: "November 3, 2020" or "Nov 3, 2020"
-        pattern1 = r"(\w+)\s+(\d+),\s*(\d{4})"
-        match = re.match(pattern1, date_string_lower)
+        match = _MONTH_DAY_YEAR_RE.match(date_string_lower)
         if match:
             month_name = match.group(1)
             day = int(match.group(2))
             year = int(match.group(3))
 
-            if month_name in months:
+            if month_name in _MONTHS:
                 try:
-                    return datetime(year, months[month_name], day, 0, 0, 0)
+                    return datetime(year, _MONTHS[month_name], day, 0, 0, 0)
                 except ValueError:
                     pass
 
         # Pattern 2: "November 3" or "Nov 3" (no year)
-        pattern2 = r"(\w+)\s+(\d+)"
-        match = re.match(pattern2, date_string_lower)
+        match = _MONTH_DAY_RE.match(date_string_lower)
         if match:
             month_name = match.group(1)
             day = int(match.group(2))
 
-            if month_name in months:
+            if month_name in _MONTHS:
                 # Use reference year, but if date is in future, use previous year
                 year = reference_date.year
                 try:
-                    parsed = datetime(year, months[month_name], day, 0, 0, 0)
+                    parsed = datetime(year, _MONTHS[month_name], day, 0, 0, 0)
                     if parsed > reference_date:
                         parsed = parsed.replace(year=year - 1)
                     return parsed
@@ -3,7 +3,7 @@ Traversal engine for navigating Facebook Activity Log by year and month.
 """
 
 from datetime import datetime
-from typing import Generator, Optional
+from typing import Generator, Optional, cast
 
 from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
@@ -67,6 +67,26 @@ class TraversalEngine:
             f"start_year={self.start_year}, target_year={self.target_year}, min_year={self.min_year}"
         )
 
+    @staticmethod
+    def compute_start_year(resume_state: Optional[dict], start_year: Optional[int] = None) -> int:
+        """
+        Resolve the year traversal starts from, without needing a page.
+
+        Args:
+            resume_state: Optional state dictionary with current_year, current_month
+            start_year: Configured starting year (defaults to settings.START_YEAR)
+
+        Returns:
+            The resume year if the state records a position at or before
+            start_year, otherwise start_year
+        """
+        start_year = start_year or settings.START_YEAR
+        if resume_state and resume_state.get("current_year") and resume_state.get("current_month"):
+            resume_year = cast(int, resume_state["current_year"])
+            if resume_year <= start_year:
+                return resume_year
+        return start_year
+
     def _apply_resume_state(self, state: dict) -> None:
         """
         Apply resume state to adjust traversal starting point.
@@ -79,12 +99,13 @@ class TraversalEngine:
             resume_month = state["current_month"]
 
             # Adjust start_year to resume position
-            if resume_year <= self.start_year:
-                self.start_year = resume_year
+            configured_start_year = self.start_year
+            self.start_year = self.compute_start_year(state, configured_start_year)
+            if self.start_year == resume_year:
                 self.logger.info(f"Resuming from {resume_year}-{resume_month:02d}")
             else:
                 self.logger.warning(
-                    f"Resume year {resume_year} is after start_year {self.start_year}, "
+                    f"Resume year {resume_year} is after start_year {configured_start_year}, "
                     "starting from configured start_year"
                 )
 
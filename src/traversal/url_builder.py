@@ -47,16 +47,16 @@ class URLBuilder:
         """
         self._validate_year(year)
 
-        params = [f"log_filter=year_{year}"]
+        # Appended directly onto the per-instance base_url; no parameter list to join
+        url = f"{self.base_url}?log_filter=year_{year}"
 
         if month is not None:
             self._validate_month(month)
-            params.append(f"month={month}")
+            url += f"&month={month}"
 
         if category is not None:
-            params.append(f"log_filter={category}")
+            url += f"&log_filter={category}"
 
-        url = f"{self.base_url}?{'&'.join(params)}"
         logger.debug(f"Built URL: {url}")
         return url
 
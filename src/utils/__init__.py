@@ -3,7 +3,7 @@ Utility modules: logging, state management, etc.
 """
 
 from src.utils.logging import get_logger, setup_logging
-from src.utils.state_manager import StateManager
+from src.utils.state_manager import FileStorage, StateManager
 from src.utils.statistics import StatisticsReporter
 
-__all__ = ["setup_logging", "get_logger", "StateManager", "StatisticsReporter"]
+__all__ = ["setup_logging", "get_logger", "FileStorage", "StateManager", "StatisticsReporter"]
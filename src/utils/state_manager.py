@@ -2,32 +2,145 @@
 Progress state manager for saving and loading operation state.
 """
 
+import copy
 import json
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Hashable, Optional, cast
 
 from src.utils.logging import get_logger
 
+# orjson is an optional speedup; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 
+def _dumps(state: Dict[str, Any]) -> bytes:
+    """
+    Serialize state to indented UTF-8 JSON.
+
+    Args:
+        state: State dictionary to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FileStorage:
+    """Stores the progress document in a file, replacing it atomically on write."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize FileStorage.
+
+        Args:
+            path: Path to progress JSON file (its directory is created)
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def version(self) -> Hashable:
+        """
+        Get a key that changes whenever the stored document does.
+
+        Returns:
+            (st_mtime_ns, st_size) of the file
+
+        Raises:
+            FileNotFoundError: If nothing is stored
+        """
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_bytes(self) -> bytes:
+        """
+        Read the stored document.
+
+        Returns:
+            Encoded JSON document
+
+        Raises:
+            FileNotFoundError: If nothing is stored
+        """
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def write_bytes(self, data: bytes) -> None:
+        """
+        Replace the stored document, keeping the previous one as a .bak file.
+
+        Args:
+            data: Encoded JSON document
+        """
+        # Create backup if file exists
+        if self.path.exists():
+            backup_path = self.path.with_suffix(".json.bak")
+            shutil.copy2(self.path, backup_path)
+            logger.debug(f"Created backup: {backup_path}")
+
+        # Write to temp file first in a single write (atomic write)
+        temp_path = self.path.with_suffix(".json.tmp")
+        temp_path.write_bytes(data)
+
+        # Atomic rename (os.replace)
+        temp_path.replace(self.path)
+
+    def unlink(self) -> None:
+        """
+        Delete the stored document.
+
+        Raises:
+            FileNotFoundError: If nothing is stored
+        """
+        self.path.unlink()
+
+
 class StateManager:
     """Manages progress state persistence for resumable operations."""
 
-    def __init__(self, progress_path: Path):
+    def __init__(self, progress_path: Path, storage: Optional[FileStorage] = None):
         """
         Initialize StateManager.
 
         Args:
             progress_path: Path to progress JSON file
+            storage: Where the progress document is kept (defaults to
+                FileStorage(progress_path)); tests pass an in-memory stand-in
         """
         self.progress_path = progress_path
+        self.storage = storage if storage is not None else FileStorage(progress_path)
         self._state: Optional[Dict[str, Any]] = None
 
-        # Ensure directory exists
-        self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+        # Last parsed progress document, keyed by storage.version()
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[Hashable] = None
 
         logger.info(f"StateManager initialized with path: {self.progress_path}")
 
@@ -43,6 +156,18 @@ class StateManager:
 
         return self._state
 
+    def peek(self, key: str) -> Any:
+        """
+        Read a single state field without copying the state.
+
+        Args:
+            key: State field name
+
+        Returns:
+            Field value, or None if the field is not set
+        """
+        return self.get_state().get(key)
+
     def save_state(self, state: Optional[Dict[str, Any]] = None) -> None:
         """
         Save progress state to JSON file.
@@ -57,20 +182,10 @@ class StateManager:
         state["last_updated"] = datetime.now().isoformat()
 
         try:
-            # Create backup if file exists
-            if self.progress_path.exists():
-                backup_path = self.progress_path.with_suffix(".json.bak")
-                shutil.copy2(self.progress_path, backup_path)
-                logger.debug(f"Created backup: {backup_path}")
-
-            # Write to temp file first (atomic write)
-            temp_path = self.progress_path.with_suffix(".json.tmp")
-
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
-
-            # Atomic rename
-            temp_path.replace(self.progress_path)
+            # Serialize up front so an unserializable state touches no files
+            data = _dumps(state)
+            self.storage.write_bytes(data)
+            self._cache_key = None
 
             # Update in-memory state
             self._state = state.copy()
@@ -88,16 +203,21 @@ class StateManager:
         Returns:
             State dictionary or None if file doesn't exist or is corrupted
         """
-        if not self.progress_path.exists():
-            logger.debug("Progress file does not exist, using default state")
-            return None
-
         try:
-            with open(self.progress_path, encoding="utf-8") as f:
-                state = json.load(f)
+            # Reuse the last parse if the file is unchanged since
+            cache_key = self.storage.version()
+            if cache_key == self._cache_key and self._cache is not None:
+                state = copy.deepcopy(self._cache)
+                self._state = state
+                logger.debug(f"State loaded from cache for {self.progress_path}")
+                return state
+
+            state = _loads(self.storage.read_bytes())
 
             # Validate state structure
             if self._validate_state(state):
+                self._cache = copy.deepcopy(state)
+                self._cache_key = cache_key
                 self._state = state
                 logger.info(f"State loaded from {self.progress_path}")
                 return cast(Dict[str, Any], state)
@@ -105,10 +225,13 @@ class StateManager:
                 logger.warning("Invalid state structure, using default state")
                 return None
 
+        except FileNotFoundError:
+            logger.debug("Progress file does not exist, using default state")
+            return None
         except json.JSONDecodeError as e:
             logger.error(f"Corrupted JSON in progress file: {e}")
             return None
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             logger.error(f"Failed to load state: {e}")
             return None
 
@@ -126,14 +249,16 @@ class StateManager:
     def clear_state(self) -> None:
         """Clear progress state (delete file)."""
         try:
-            if self.progress_path.exists():
-                self.progress_path.unlink()
-                logger.info("Progress state cleared")
-
-            self._state = None
-
-        except Exception as e:
+            self.storage.unlink()
+            logger.info("Progress state cleared")
+        except FileNotFoundError:
+            logger.debug("No progress state to clear")
+        except OSError as e:
             logger.error(f"Failed to clear state: {e}")
+            return
+
+        self._state = None
+        self._cache_key = None
 
     def _default_state(self) -> Dict[str, Any]:
         """
@@ -5,20 +5,22 @@ This conftest.py is shared by both unit and integration tests.
 It registers pytest markers and provides common fixtures.
 """
 import sys
+import time
 from pathlib import Path
+from unittest.mock import MagicMixin, MagicProxy, NonCallableMock, create_autospec
 
 import pytest  # noqa: E402
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
 
 # Expose fixtures from test fixture modules
 # Note: pytest_plugins must be defined at the top level (root conftest)
 pytest_plugins = [
     "tests.unit.fixtures.mock_cookies",
     "tests.unit.fixtures.mock_pages",
+    "tests.unit.fixtures.mock_state",
 ]
 
 
@@ -30,3 +32,210 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: Slow tests (may take significant time)")
     config.addinivalue_line("markers", "requires_network: Tests that require network access")
     config.addinivalue_line("markers", "requires_browser: Tests that require browser automation")
+    config.addinivalue_line("markers", "real_sleep: Tests that need time.sleep to actually wait")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_progress_path(tmp_path_factory):
+    """
+    Point settings.PROGRESS_PATH at a per-session temporary file.
+
+    DeletionEngine falls back to StateManager(settings.PROGRESS_PATH) when no
+    state manager is injected. Without this, tests would share data/progress.json
+    with real runs and, under pytest-xdist, with each other (tmp_path_factory
+    is per worker).
+    """
+    from config import settings
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(settings, "PROGRESS_PATH", tmp_path_factory.mktemp("data") / "progress.json")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(request, monkeypatch):
+    """
+    Replace time.sleep with a fake that records the requested durations.
+
+    RateLimiter.wait_before_action sleeps for several seconds per deletion via
+    src.stealth.behavior. Tests can request this fixture to assert on the
+    recorded delays. Tests that need a real delay opt out with
+    @pytest.mark.real_sleep.
+
+    Returns:
+        List of durations passed to time.sleep, in call order
+    """
+    recorded: list = []
+    if request.node.get_closest_marker("real_sleep"):
+        return recorded
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    return recorded
+
+
+def _copy_mock(template, old_parent=None, new_parent=None):
+    """
+    Copy a mock together with the child mocks attached to it.
+
+    copy.copy alone shares the children, so every copy would hand out the same
+    child mocks and record their calls on the template. Children (kept both in
+    _mock_children and, for autospec'd methods, as instance attributes) are
+    copied recursively and re-parented onto the copy instead.
+
+    Each mock has its own class holding its signature check and magic methods.
+    The copy gets a new class directly under the same base, as Mock expects
+    when it builds return values from type(mock).__mro__[1].
+
+    Args:
+        template: Mock to copy
+        old_parent: Mock the template is attached to, if any
+        new_parent: Copy that the returned mock is attached to instead
+
+    Returns:
+        Mock sharing no child mocks with the template
+    """
+    template_cls = type(template)
+    mock = NonCallableMock.__new__(template_cls.__mro__[1])
+    for name, value in template_cls.__dict__.items():
+        if name not in ("__dict__", "__weakref__") and not isinstance(value, MagicProxy):
+            setattr(type(mock), name, value)
+
+    copies: dict = {}
+
+    def copy_child(value):
+        # Identity checks only: comparing MagicMocks with == creates magic-method children
+        if not isinstance(value, NonCallableMock) or (
+            value._mock_parent is not template and value._mock_new_parent is not template
+        ):
+            return value
+        if id(value) not in copies:
+            copies[id(value)] = _copy_mock(value, template, mock)
+        return copies[id(value)]
+
+    state = mock.__dict__
+    for name, value in list(template.__dict__.items()):
+        state[name] = copy_child(value)
+    state["_mock_children"] = {
+        name: copy_child(child) for name, child in template._mock_children.items()
+    }
+    for attr in ("_mock_parent", "_mock_new_parent"):
+        if old_parent is not None and state[attr] is old_parent:
+            state[attr] = new_parent
+    if isinstance(mock, MagicMixin):
+        mock._mock_set_magics()
+    return mock
+
+
+def _fresh_copy(template):
+    """
+    Return an independent copy of an autospec'd template with all configuration cleared.
+
+    Copies share no child mocks with the template or each other, so several
+    copies can be configured differently within one test.
+
+    Args:
+        template: Mock created by create_autospec
+
+    Returns:
+        Mock with the template's spec and no configured behaviour
+    """
+    mock = _copy_mock(template)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _page_template():
+    """
+    Autospec'd Playwright Page, built once per session.
+
+    create_autospec walks the whole Page API and is ~40x slower than copying
+    the result, so tests receive copies via the mock_page fixture.
+    """
+    from playwright.sync_api import Page
+
+    return create_autospec(Page, instance=True)
+
+
+@pytest.fixture(scope="session")
+def _locator_template():
+    """Autospec'd Playwright Locator, built once per session."""
+    from playwright.sync_api import Locator
+
+    return create_autospec(Locator, instance=True)
+
+
+@pytest.fixture
+def mock_locator(_locator_template):
+    """
+    Create a mock Playwright Locator that matches no elements.
+
+    Tests can override count() or any other method as needed.
+    """
+    locator = _fresh_copy(_locator_template)
+    locator.count.return_value = 0
+    return locator
+
+
+@pytest.fixture
+def mock_page(_page_template, mock_locator):
+    """
+    Create a mock Playwright Page on the Activity Log.
+
+    Includes:
+    - url: "https://mbasic.facebook.com/testuser/allactivity"
+    - locator(): Returns the mock_locator fixture
+
+    Unit tests get a more fully configured page from tests/unit/conftest.py.
+    """
+    page = _fresh_copy(_page_template)
+    page.url = "https://mbasic.facebook.com/testuser/allactivity"
+    page.locator.return_value = mock_locator
+    return page
+
+
+@pytest.fixture(scope="session")
+def _handler_template():
+    """Autospec'd DeletionHandler, built once per session."""
+    from src.deletion.handlers.base_handler import DeletionHandler
+
+    return create_autospec(DeletionHandler, instance=True)
+
+
+@pytest.fixture
+def mock_handler_factory(_handler_template):
+    """
+    Return a factory for independent mock DeletionHandlers that accept every item.
+
+    For tests that need several handlers; each call returns a new mock.
+    """
+
+    def make_handler():
+        handler = _fresh_copy(_handler_template)
+        handler.can_handle.return_value = True
+        return handler
+
+    return make_handler
+
+
+@pytest.fixture
+def mock_handler(mock_handler_factory):
+    """
+    Create a mock DeletionHandler that accepts every item.
+
+    Tests configure delete() as needed. Misspelt handler methods raise
+    AttributeError instead of silently returning a Mock.
+    """
+    return mock_handler_factory()
+
+
+@pytest.fixture
+def state_manager(tmp_path):
+    """
+    Create a StateManager backed by progress.json in the test's temporary directory.
+
+    The file is not created until the first save.
+    """
+    from src.utils.state_manager import StateManager
+
+    return StateManager(tmp_path / "progress.json")
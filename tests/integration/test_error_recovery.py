@@ -2,15 +2,23 @@
 Integration tests for error recovery mechanisms.
 """
 import json
-from unittest.mock import MagicMock, Mock, patch
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from src.deletion.deletion_engine import DeletionEngine
-from src.safety.block_manager import BlockManager
 from src.safety.error_detector import ErrorDetector
 from src.utils.state_manager import StateManager
 
+ALLACTIVITY_URL = "https://mbasic.facebook.com/testuser/allactivity"
+BLOCKED_URL = "https://mbasic.facebook.com/blocked"
+
+# Shared read-only item; nothing in the deletion path mutates items
+MOCK_ITEM = MappingProxyType({"type": "post", "date_string": "2020-01-01", "id": "item1"})
+
 
 @pytest.mark.integration
 class TestErrorRecovery:
@@ -18,15 +26,13 @@ class TestErrorRecovery:
 
     def test_error_recovery_transient_errors(self, tmp_path):
         """Test error recovery with transient errors."""
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock handler's delete() method to raise transient errors then succeed
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_handler = Mock()
+        mock_handler = Mock(spec=["delete"])
         # First two calls raise transient error, third succeeds
         mock_handler.delete.side_effect = [
             PlaywrightTimeoutError("Timeout"),
@@ -35,11 +41,8 @@ class TestErrorRecovery:
         ]
         deletion_engine._select_handler = Mock(return_value=mock_handler)
 
-        # Create a mock item
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-
         # Attempt deletion (should retry and succeed)
-        result, message = deletion_engine.delete_item(mock_page, mock_item, max_retries=3)
+        result, message = deletion_engine.delete_item(mock_page, MOCK_ITEM, max_retries=3)
 
         # Verify successful recovery after retry
         assert result is True
@@ -47,21 +50,18 @@ class TestErrorRecovery:
 
     def test_error_recovery_persistent_errors(self, tmp_path):
         """Test error recovery with persistent errors."""
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock handler's delete() to always raise exceptions
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_handler = Mock()
+        mock_handler = Mock(spec=["delete"])
         mock_handler.delete.side_effect = PlaywrightTimeoutError("Persistent timeout")
         deletion_engine._select_handler = Mock(return_value=mock_handler)
 
         # Mock item extractor to return items
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-        deletion_engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        deletion_engine.item_extractor.extract_items = Mock(return_value=[MOCK_ITEM])
 
         # Process page - should continue despite persistent errors
         page_stats = deletion_engine.process_page(mock_page)
@@ -75,15 +75,13 @@ class TestErrorRecovery:
 
     def test_error_recovery_transient_errors_logged(self, tmp_path):
         """Test transient errors are logged but don't stop workflow."""
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock handler's delete() with transient errors that recover
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_handler = Mock()
+        mock_handler = Mock(spec=["delete"])
         # First two calls raise transient error, third succeeds
         mock_handler.delete.side_effect = [
             PlaywrightTimeoutError("Transient timeout"),
@@ -92,8 +90,7 @@ class TestErrorRecovery:
         ]
         deletion_engine._select_handler = Mock(return_value=mock_handler)
 
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-        deletion_engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        deletion_engine.item_extractor.extract_items = Mock(return_value=[MOCK_ITEM])
 
         # Process page
         page_stats = deletion_engine.process_page(mock_page)
@@ -107,13 +104,13 @@ class TestErrorRecovery:
 
     def test_error_recovery_block_detection(self, tmp_path):
         """Test error recovery with block detection."""
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/blocked"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = BLOCKED_URL
 
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock ErrorDetector to detect block
-        mock_error_detector = Mock()
+        mock_error_detector = Mock(spec=ErrorDetector)
         mock_error_detector.check_for_errors.return_value = (True, "Action Blocked")
         deletion_engine.error_detector = mock_error_detector
 
@@ -130,14 +127,14 @@ class TestErrorRecovery:
     def test_error_recovery_block_info_saved_to_state(self, tmp_path):
         """Test block information is saved to state."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/blocked"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = BLOCKED_URL
 
         state_manager = StateManager(progress_path)
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock error detector to detect block
-        mock_error_detector = Mock()
+        mock_error_detector = Mock(spec=ErrorDetector)
         mock_error_detector.check_for_errors.return_value = (True, "Action Blocked")
         deletion_engine.error_detector = mock_error_detector
 
@@ -158,21 +155,20 @@ class TestErrorRecovery:
     def test_error_recovery_workflow_saves_state_before_stopping(self, tmp_path):
         """Test workflow saves state before stopping on block."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         state_manager = StateManager(progress_path)
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Set up block
-        mock_error_detector = Mock()
+        mock_error_detector = Mock(spec=ErrorDetector)
         mock_error_detector.check_for_errors.return_value = (True, "Action Blocked")
         deletion_engine.error_detector = mock_error_detector
         deletion_engine.block_manager.check_and_handle_block(mock_page, mock_error_detector)
 
         # Mock items on page
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-        deletion_engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        deletion_engine.item_extractor.extract_items = Mock(return_value=[MOCK_ITEM])
 
         # Process page - should detect block and stop
         deletion_engine.process_page(mock_page)
@@ -194,22 +190,19 @@ class TestErrorRecovery:
     def test_state_saving_on_errors(self, tmp_path):
         """Test state saving on errors."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         state_manager = StateManager(progress_path)
         deletion_engine = DeletionEngine(page=mock_page)
 
         # Mock handler's delete() to fail
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_handler = Mock()
+        mock_handler = Mock(spec=["delete"])
         mock_handler.delete.side_effect = PlaywrightTimeoutError("Deletion failed")
         deletion_engine._select_handler = Mock(return_value=mock_handler)
 
         # Process page with errors
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-        deletion_engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        deletion_engine.item_extractor.extract_items = Mock(return_value=[MOCK_ITEM])
 
         page_stats = deletion_engine.process_page(mock_page)
 
@@ -230,8 +223,8 @@ class TestErrorRecovery:
     def test_state_includes_current_position_on_error(self, tmp_path):
         """Test state includes current position when error occurred."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity?year=2020&month=9"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = f"{ALLACTIVITY_URL}?year=2020&month=9"
 
         state_manager = StateManager(progress_path)
 
@@ -252,8 +245,8 @@ class TestErrorRecovery:
     def test_state_can_resume_after_error_recovery(self, tmp_path):
         """Test state can be used to resume after error recovery."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         state_manager = StateManager(progress_path)
 
@@ -276,8 +269,8 @@ class TestErrorRecovery:
     def test_errors_encountered_counter_incremented(self, tmp_path):
         """Test errors_encountered counter is incremented."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         state_manager = StateManager(progress_path)
         deletion_engine = DeletionEngine(page=mock_page)
@@ -287,15 +280,12 @@ class TestErrorRecovery:
         initial_errors = initial_state.get("errors_encountered", 0)
 
         # Mock handler's delete() to fail
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_handler = Mock()
+        mock_handler = Mock(spec=["delete"])
         mock_handler.delete.side_effect = PlaywrightTimeoutError("Error")
         deletion_engine._select_handler = Mock(return_value=mock_handler)
 
         # Process page with errors
-        mock_item = {"type": "post", "date_string": "2020-01-01", "id": "item1"}
-        deletion_engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        deletion_engine.item_extractor.extract_items = Mock(return_value=[MOCK_ITEM])
 
         page_stats = deletion_engine.process_page(mock_page)
 
@@ -306,11 +296,33 @@ class TestErrorRecovery:
         final_state = state_manager.get_state()
         assert final_state["errors_encountered"] > initial_errors
 
-    def test_state_saved_atomically_on_error(self, tmp_path):
+    def test_state_saved_atomically_on_error(self, tmp_path, mocker):
+        """Test each state update is committed by exactly one atomic rename."""
+        progress_path = tmp_path / "progress.json"
+        state_manager = StateManager(progress_path)
+
+        # Path.replace (not os.replace) so the spy also sees the rename on
+        # Python versions whose pathlib binds os.replace at import time
+        replace_spy = mocker.spy(Path, "replace")
+
+        state_manager.update_state(
+            current_year=2020,
+            current_month=10,
+            total_deleted=100,
+            errors_encountered=5,
+        )
+
+        assert replace_spy.call_count == 1
+        temp_path, target_path = replace_spy.call_args[0]
+        assert temp_path == progress_path.with_suffix(".json.tmp")
+        assert target_path == progress_path
+
+    @pytest.mark.slow
+    def test_state_saved_atomically_on_error_roundtrip(self, tmp_path):
         """Test state is saved atomically (no corruption on error)."""
         progress_path = tmp_path / "progress.json"
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
 
         state_manager = StateManager(progress_path)
 
@@ -1,15 +1,72 @@
 """
 Integration tests for full cleanup workflow.
 """
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from src.auth.browser_manager import BrowserManager
-from src.deletion.deletion_engine import DeletionEngine
-from src.traversal.traversal_engine import TraversalEngine
-from src.utils.state_manager import StateManager
-from src.utils.statistics import StatisticsReporter
+# src.* imports live inside the fixtures below so that collecting or
+# deselecting this module (e.g. -m "not integration") does not pay for
+# importing the engines and Playwright.
+
+ALLACTIVITY_URL = "https://mbasic.facebook.com/testuser/allactivity"
+
+
+def _run_workflow(
+    traversal_engine,
+    deletion_engine,
+    state_manager,
+    stats_reporter,
+    pages,
+    deletion_stats,
+    flush_every=None,
+):
+    """
+    Drive the main page loop over mocked traversal and deletion results.
+
+    Args:
+        traversal_engine: TraversalEngine whose traverse_years is replaced
+        deletion_engine: DeletionEngine whose process_page is replaced
+        state_manager: StateManager updated after each page
+        stats_reporter: StatisticsReporter aggregating page stats
+        pages: List of page dicts (year, month, page_number) to yield
+        deletion_stats: List of stats dicts returned by process_page, one per page
+        flush_every: Save state to disk every N pages (and once at the end) instead
+            of after every page; None keeps the per-page write of main.py
+
+    Returns:
+        List of state snapshots taken after each processed page
+    """
+    page = deletion_engine.page
+    page_infos = tuple({**page_data, "page": page} for page_data in pages)
+
+    traversal_engine.traverse_years = lambda: iter(page_infos)
+    # Plain callable: no test asserts on process_page calls
+    page_stats_iter = iter(deletion_stats)
+    deletion_engine.process_page = lambda page=None: next(page_stats_iter)
+
+    snapshots = []
+    for page_number, page_info in enumerate(traversal_engine.traverse_years(), 1):
+        page_stats = deletion_engine.process_page(page_info["page"])
+        stats_reporter.update_from_page_stats(page_stats)
+        updates = {
+            "current_year": page_info["year"],
+            "current_month": page_info["month"],
+            "total_deleted": stats_reporter.stats["total_deleted"],
+            "errors_encountered": stats_reporter.stats["errors_encountered"],
+        }
+        if flush_every is None:
+            state_manager.update_state(**updates)
+        else:
+            state_manager.get_state().update(updates)
+            if page_number % flush_every == 0:
+                state_manager.save_state()
+        snapshots.append(dict(state_manager.get_state()))
+
+    if flush_every is not None and len(snapshots) % flush_every:
+        state_manager.save_state()
+
+    return snapshots
 
 
 @pytest.mark.integration
@@ -21,8 +78,8 @@ class TestFullWorkflow:
         """Create mock browser, context, and page."""
         mock_browser = Mock()
         mock_context = Mock()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/testuser/allactivity"
+        mock_page = Mock(spec=["url"])
+        mock_page.url = ALLACTIVITY_URL
         mock_context.new_page.return_value = mock_page
         mock_browser.new_context.return_value = mock_context
         return mock_browser, mock_context, mock_page
@@ -30,6 +87,8 @@ class TestFullWorkflow:
     @pytest.fixture
     def mock_browser_manager(self, mock_browser_components):
         """Create mocked BrowserManager."""
+        from src.auth.browser_manager import BrowserManager
+
         mock_browser, mock_context, mock_page = mock_browser_components
 
         with patch.object(BrowserManager, "create_authenticated_browser") as mock_create:
@@ -37,17 +96,45 @@ class TestFullWorkflow:
             manager = BrowserManager()
             yield manager, mock_browser, mock_context, mock_page
 
-    def test_complete_workflow_mocked_browser(self, tmp_path, mock_browser_manager):
-        """Test complete workflow with mocked browser."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
+    @pytest.fixture
+    def progress_path(self, tmp_path):
+        """Progress file path inside the test's temporary directory."""
+        return tmp_path / "progress.json"
+
+    @pytest.fixture
+    def state_manager(self, progress_path):
+        """Create StateManager backed by progress_path."""
+        from src.utils.state_manager import StateManager
+
+        return StateManager(progress_path)
+
+    @pytest.fixture
+    def stats_reporter(self):
+        """Create a fresh StatisticsReporter."""
+        from src.utils.statistics import StatisticsReporter
 
-        # Initialize components
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-        traversal_engine = TraversalEngine(page=mock_page, username="testuser")
-        deletion_engine = DeletionEngine(page=mock_page)
+        return StatisticsReporter()
 
+    @pytest.fixture
+    def traversal_engine(self, mock_browser_manager):
+        """Create TraversalEngine on the mocked page."""
+        from src.traversal.traversal_engine import TraversalEngine
+
+        mock_page = mock_browser_manager[3]
+        return TraversalEngine(page=mock_page, username="testuser")
+
+    @pytest.fixture
+    def deletion_engine(self, mock_browser_manager):
+        """Create DeletionEngine on the mocked page."""
+        from src.deletion.deletion_engine import DeletionEngine
+
+        mock_page = mock_browser_manager[3]
+        return DeletionEngine(page=mock_page)
+
+    def test_complete_workflow_mocked_browser(
+        self, mock_browser_manager, state_manager, stats_reporter, traversal_engine, deletion_engine
+    ):
+        """Test complete workflow with mocked browser."""
         # Verify all components are initialized
         assert state_manager is not None
         assert stats_reporter is not None
@@ -59,56 +146,25 @@ class TestFullWorkflow:
         assert deletion_engine.error_detector is not None
         assert deletion_engine.block_manager is not None
 
-    def test_workflow_executes_without_errors(self, tmp_path, mock_browser_manager):
+    def test_workflow_executes_without_errors(
+        self, state_manager, stats_reporter, traversal_engine, deletion_engine
+    ):
         """Test workflow executes without errors."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-        traversal_engine = TraversalEngine(page=mock_page, username="testuser")
-        deletion_engine = DeletionEngine(page=mock_page)
-
-        # Mock traversal to yield one page
-        def mock_traverse():
-            yield {
-                "year": 2020,
-                "month": 11,
-                "page_number": 1,
-                "page": mock_page,
-            }
-
-        traversal_engine.traverse_years = mock_traverse
-
-        # Mock deletion engine to return success stats
-        deletion_engine.process_page = Mock(
-            return_value={"deleted": 5, "failed": 0, "skipped": 0, "errors": []}
+        _run_workflow(
+            traversal_engine,
+            deletion_engine,
+            state_manager,
+            stats_reporter,
+            pages=[{"year": 2020, "month": 11, "page_number": 1}],
+            deletion_stats=[{"deleted": 5, "failed": 0, "skipped": 0, "errors": []}],
         )
 
-        # Execute workflow
-        for page_info in traversal_engine.traverse_years():
-            page_stats = deletion_engine.process_page(page_info["page"])
-            stats_reporter.update_from_page_stats(page_stats)
-
-            # Update state
-            state_manager.update_state(
-                current_year=page_info["year"],
-                current_month=page_info["month"],
-                total_deleted=stats_reporter.stats["total_deleted"],
-            )
-
         # Verify workflow completed
         assert stats_reporter.stats["total_deleted"] == 5
         assert stats_reporter.stats["total_failed"] == 0
 
-    def test_state_saved_during_execution(self, tmp_path, mock_browser_manager):
+    def test_state_saved_during_execution(self, progress_path, state_manager, stats_reporter):
         """Test state is saved during execution."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-
         # Execute workflow and save state
         stats_reporter.update_from_page_stats(
             {"deleted": 10, "failed": 1, "skipped": 0, "errors": []}
@@ -129,12 +185,8 @@ class TestFullWorkflow:
         assert loaded_state["current_month"] == 10
         assert loaded_state["total_deleted"] == 10
 
-    def test_statistics_collected(self, tmp_path, mock_browser_manager):
+    def test_statistics_collected(self, stats_reporter):
         """Test statistics are collected."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-
-        stats_reporter = StatisticsReporter()
-
         # Process multiple pages
         page_stats1 = {"deleted": 5, "failed": 0, "skipped": 1, "errors": []}
         page_stats2 = {"deleted": 3, "failed": 1, "skipped": 0, "errors": [{"error": "test error"}]}
@@ -148,66 +200,78 @@ class TestFullWorkflow:
         assert stats_reporter.stats["total_skipped"] == 1
         assert stats_reporter.stats["errors_encountered"] == 1
 
-    def test_workflow_multiple_pages(self, tmp_path, mock_browser_manager):
-        """Test workflow with multiple pages."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-        traversal_engine = TraversalEngine(page=mock_page, username="testuser")
-        deletion_engine = DeletionEngine(page=mock_page)
-
-        # Mock traversal to yield multiple pages
-        pages_data = [
-            {"year": 2020, "month": 12, "page_number": 1},
-            {"year": 2020, "month": 11, "page_number": 1},
-            {"year": 2019, "month": 12, "page_number": 1},
-        ]
-
-        def mock_traverse():
-            for page_data in pages_data:
-                yield {**page_data, "page": mock_page}
-
-        traversal_engine.traverse_years = mock_traverse
-
-        # Mock deletion engine with different stats for each page
-        deletion_stats = [
-            {"deleted": 5, "failed": 0, "skipped": 0, "errors": []},
-            {"deleted": 3, "failed": 1, "skipped": 1, "errors": []},
-            {"deleted": 2, "failed": 0, "skipped": 0, "errors": []},
-        ]
-        deletion_engine.process_page = Mock(side_effect=deletion_stats)
-
-        # Execute workflow
-        pages_processed = 0
-        for page_info in traversal_engine.traverse_years():
-            page_stats = deletion_engine.process_page(page_info["page"])
-            stats_reporter.update_from_page_stats(page_stats)
-            state_manager.update_state(
-                current_year=page_info["year"],
-                current_month=page_info["month"],
-                total_deleted=stats_reporter.stats["total_deleted"],
-            )
-            pages_processed += 1
-
-        # Verify all pages processed
-        assert pages_processed == 3
-        assert stats_reporter.stats["total_deleted"] == 10  # 5 + 3 + 2
-        assert stats_reporter.stats["total_failed"] == 1
-        assert stats_reporter.stats["total_skipped"] == 1
-
-        # Verify state reflects last processed page
-        final_state = state_manager.get_state()
-        assert final_state["current_year"] == 2019
-        assert final_state["current_month"] == 12
+    @pytest.mark.parametrize(
+        "pages_data,deletion_stats,expected",
+        [
+            pytest.param(
+                [
+                    {"year": 2020, "month": 12, "page_number": 1},
+                    {"year": 2020, "month": 11, "page_number": 1},
+                ],
+                [
+                    {"deleted": 5, "failed": 0, "skipped": 0, "errors": []},
+                    {"deleted": 5, "failed": 0, "skipped": 0, "errors": []},
+                ],
+                {"total_deleted": 10, "total_failed": 0, "total_skipped": 0},
+                id="uniform_stats",
+            ),
+            pytest.param(
+                [
+                    {"year": 2020, "month": 12, "page_number": 1},
+                    {"year": 2020, "month": 11, "page_number": 1},
+                    {"year": 2019, "month": 12, "page_number": 1},
+                ],
+                [
+                    {"deleted": 5, "failed": 0, "skipped": 0, "errors": []},
+                    {"deleted": 3, "failed": 1, "skipped": 1, "errors": []},
+                    {"deleted": 2, "failed": 0, "skipped": 0, "errors": []},
+                ],
+                {"total_deleted": 10, "total_failed": 1, "total_skipped": 1},
+                id="varied_stats",
+            ),
+        ],
+    )
+    def test_workflow_multiple_pages(
+        self,
+        state_manager,
+        stats_reporter,
+        traversal_engine,
+        deletion_engine,
+        pages_data,
+        deletion_stats,
+        expected,
+    ):
+        """Test workflow with multiple pages updates stats and state for each page."""
+        snapshots = _run_workflow(
+            traversal_engine,
+            deletion_engine,
+            state_manager,
+            stats_reporter,
+            pages_data,
+            deletion_stats,
+            flush_every=len(pages_data),
+        )
 
-    def test_workflow_statistics_aggregate_across_pages(self, tmp_path, mock_browser_manager):
+        # Verify all pages processed and statistics aggregated
+        assert len(snapshots) == len(pages_data)
+        for key, value in expected.items():
+            assert stats_reporter.stats[key] == value
+
+        # Verify state after each page
+        total_deleted = 0
+        for page_data, page_stats, state in zip(pages_data, deletion_stats, snapshots):
+            total_deleted += page_stats["deleted"]
+            assert state["current_year"] == page_data["year"]
+            assert state["current_month"] == page_data["month"]
+            assert state["total_deleted"] == total_deleted
+
+        # Verify the single flush persisted the last processed page
+        final_state = state_manager.load_state()
+        assert final_state["current_year"] == pages_data[-1]["year"]
+        assert final_state["current_month"] == pages_data[-1]["month"]
+
+    def test_workflow_statistics_aggregate_across_pages(self, stats_reporter):
         """Test statistics aggregate correctly across pages."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-
-        stats_reporter = StatisticsReporter()
-
         # Simulate processing multiple pages with various stats
         page_stats_list = [
             {"deleted": 10, "failed": 0, "skipped": 2, "errors": []},
@@ -229,48 +293,29 @@ class TestFullWorkflow:
         assert stats_reporter.stats["total_skipped"] == 3  # 2 + 0 + 1
         assert stats_reporter.stats["errors_encountered"] == 3  # Count of all errors
 
-    def test_workflow_with_errors_and_recovery(self, tmp_path, mock_browser_manager):
+    def test_workflow_with_errors_and_recovery(
+        self, state_manager, stats_reporter, traversal_engine, deletion_engine
+    ):
         """Test workflow with errors and recovery."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-        traversal_engine = TraversalEngine(page=mock_page, username="testuser")
-        deletion_engine = DeletionEngine(page=mock_page)
-
-        # Mock traversal
-        def mock_traverse():
-            yield {"year": 2020, "month": 10, "page_number": 1, "page": mock_page}
-
-        traversal_engine.traverse_years = mock_traverse
-
-        # Mock deletion engine to return error stats
-        deletion_engine.process_page = Mock(
-            return_value={
-                "deleted": 3,
-                "failed": 2,
-                "skipped": 1,
-                "errors": [
-                    {"error": "Transient error", "item": "item1"},
-                    {"error": "Another error", "item": "item2"},
-                ],
-            }
+        _run_workflow(
+            traversal_engine,
+            deletion_engine,
+            state_manager,
+            stats_reporter,
+            pages=[{"year": 2020, "month": 10, "page_number": 1}],
+            deletion_stats=[
+                {
+                    "deleted": 3,
+                    "failed": 2,
+                    "skipped": 1,
+                    "errors": [
+                        {"error": "Transient error", "item": "item1"},
+                        {"error": "Another error", "item": "item2"},
+                    ],
+                }
+            ],
         )
 
-        # Execute workflow
-        for page_info in traversal_engine.traverse_years():
-            page_stats = deletion_engine.process_page(page_info["page"])
-            stats_reporter.update_from_page_stats(page_stats)
-
-            # Update state with errors
-            state_manager.update_state(
-                current_year=page_info["year"],
-                current_month=page_info["month"],
-                total_deleted=stats_reporter.stats["total_deleted"],
-                errors_encountered=stats_reporter.stats["errors_encountered"],
-            )
-
         # Verify errors are tracked
         assert stats_reporter.stats["total_deleted"] == 3
         assert stats_reporter.stats["total_failed"] == 2
@@ -280,63 +325,15 @@ class TestFullWorkflow:
         state = state_manager.get_state()
         assert state["errors_encountered"] == 2
 
-    def test_workflow_state_updates_correctly(self, tmp_path, mock_browser_manager):
-        """Test state updates correctly for each page."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
-        state_manager = StateManager(progress_path)
-        stats_reporter = StatisticsReporter()
-        traversal_engine = TraversalEngine(page=mock_page, username="testuser")
-        deletion_engine = DeletionEngine(page=mock_page)
-
-        # Mock traversal with multiple pages
-        pages_data = [
-            {"year": 2020, "month": 12, "page_number": 1},
-            {"year": 2020, "month": 11, "page_number": 1},
-        ]
-
-        def mock_traverse():
-            for page_data in pages_data:
-                yield {**page_data, "page": mock_page}
-
-        traversal_engine.traverse_years = mock_traverse
-
-        deletion_engine.process_page = Mock(
-            return_value={"deleted": 5, "failed": 0, "skipped": 0, "errors": []}
-        )
-
-        # Process pages and verify state updates
-        for idx, page_info in enumerate(traversal_engine.traverse_years()):
-            page_stats = deletion_engine.process_page(page_info["page"])
-            stats_reporter.update_from_page_stats(page_stats)
-
-            state_manager.update_state(
-                current_year=page_info["year"],
-                current_month=page_info["month"],
-                total_deleted=stats_reporter.stats["total_deleted"],
-            )
-
-            # Verify state after each page
-            state = state_manager.get_state()
-            assert state["current_year"] == page_info["year"]
-            assert state["current_month"] == page_info["month"]
-            assert state["total_deleted"] == 5 * (idx + 1)
-
-    def test_statistics_updated_from_state_on_resume(self, tmp_path, mock_browser_manager):
+    def test_statistics_updated_from_state_on_resume(self, state_manager, stats_reporter):
         """Test stats are updated from state on resume."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-        progress_path = tmp_path / "progress.json"
-
         # Create initial state with statistics
-        state_manager = StateManager(progress_path)
         initial_state = state_manager.get_state()
         initial_state["total_deleted"] = 100
         initial_state["errors_encountered"] = 5
         state_manager.save_state(initial_state)
 
-        # Create new stats reporter and load from state
-        stats_reporter = StatisticsReporter()
+        # Load stats reporter from state
         loaded_state = state_manager.load_state()
         stats_reporter.update_from_state(loaded_state)
 
@@ -344,12 +341,8 @@ class TestFullWorkflow:
         assert stats_reporter.stats["total_deleted"] == 100
         assert stats_reporter.stats["errors_encountered"] == 5
 
-    def test_final_statistics_report_generated(self, tmp_path, mock_browser_manager):
+    def test_final_statistics_report_generated(self, stats_reporter):
         """Test final statistics report is generated correctly."""
-        manager, mock_browser, mock_context, mock_page = mock_browser_manager
-
-        stats_reporter = StatisticsReporter()
-
         # Update stats
         stats_reporter.update_from_page_stats(
             {"deleted": 50, "failed": 3, "skipped": 2, "errors": []}
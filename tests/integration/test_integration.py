@@ -1,14 +1,12 @@
 """
 Integration tests for complete cleanup workflow.
 """
-from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+import time
 
 import pytest
 
 from src.deletion.deletion_engine import DeletionEngine
 from src.traversal.traversal_engine import TraversalEngine
-from src.utils.state_manager import StateManager
 from src.utils.statistics import StatisticsReporter
 
 
@@ -16,9 +14,8 @@ from src.utils.statistics import StatisticsReporter
 class TestIntegration:
     """Test complete integration workflow."""
 
-    def test_traversal_with_resume(self):
+    def test_traversal_with_resume(self, mock_page):
         """Test TraversalEngine with resume state."""
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com/test/allactivity"
 
         resume_state = {
@@ -31,9 +28,8 @@ class TestIntegration:
 
         assert engine.start_year == 2019  # Should adjust to resume year
 
-    def test_deletion_engine_integration(self):
+    def test_deletion_engine_integration(self, mock_page):
         """Test DeletionEngine with all safety mechanisms."""
-        mock_page = Mock()
         engine = DeletionEngine(page=mock_page)
 
         # Verify all safety mechanisms are initialized
@@ -55,46 +51,6 @@ class TestIntegration:
         assert reporter.stats["total_failed"] == 1
         assert reporter.stats["errors_encountered"] == 1
 
-    def test_state_manager_save_load(self, tmp_path):
-        """Test state manager save and load cycle."""
-        progress_path = tmp_path / "progress.json"
-        manager = StateManager(progress_path)
-
-        # Save state
-        state = manager.get_state()
-        state["current_year"] = 2019
-        state["current_month"] = 11
-        state["total_deleted"] = 100
-        manager.save_state(state)
-
-        # Load state
-        loaded = manager.load_state()
-        assert loaded is not None
-        assert loaded["current_year"] == 2019
-        assert loaded["total_deleted"] == 100
-
-
-class TestResume:
-    """Test resume functionality."""
-
-    def test_resume_from_state(self, tmp_path):
-        """Test resuming from saved state."""
-        progress_path = tmp_path / "progress.json"
-        manager = StateManager(progress_path)
-
-        # Create resume state
-        state = manager.get_state()
-        state["current_year"] = 2019
-        state["current_month"] = 6
-        state["total_deleted"] = 50
-        manager.save_state(state)
-
-        # Load and verify
-        loaded = manager.load_state()
-        assert loaded["current_year"] == 2019
-        assert loaded["current_month"] == 6
-        assert loaded["total_deleted"] == 50
-
 
 class TestErrorRecovery:
     """Test error recovery mechanisms."""
@@ -110,7 +66,21 @@ class TestErrorRecovery:
 
         assert limiter.check_rate_limit() is False
 
-    def test_block_detection(self):
+    @pytest.mark.slow
+    @pytest.mark.real_sleep
+    def test_rate_limiter_wait_really_sleeps(self):
+        """Test RateLimiter.wait_before_action blocks for the real delay."""
+        from src.safety.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(mean_delay=0.1, std_dev=0.01, min_delay=0.1)
+
+        start = time.monotonic()
+        assert limiter.wait_before_action() is True
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.1
+
+    def test_block_detection(self, mock_page):
         """Test block detection and handling."""
         from src.safety.block_manager import BlockManager
         from src.safety.error_detector import ErrorDetector
@@ -118,7 +88,6 @@ class TestErrorRecovery:
         manager = BlockManager()
         detector = ErrorDetector()
 
-        mock_page = Mock()
         mock_page.url = "https://facebook.com/error"
         mock_page.content.return_value = "Action Blocked"
 
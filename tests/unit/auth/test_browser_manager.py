@@ -2,7 +2,7 @@
 Tests for BrowserManager class.
 """
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
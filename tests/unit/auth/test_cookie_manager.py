@@ -21,13 +21,9 @@ class TestCookieManager:
         assert manager.cookie_path == cookie_file
         assert manager.cookies_data is None
 
-    def test_load_cookies_success(self, temp_cookie_file, valid_cookie_data):
+    def test_load_cookies_success(self, cookie_file_on_disk, valid_cookie_data):
         """Test successful cookie loading."""
-        # Write valid cookie data
-        with open(temp_cookie_file, "w") as f:
-            json.dump(valid_cookie_data, f)
-
-        manager = CookieManager(temp_cookie_file)
+        manager = CookieManager(cookie_file_on_disk)
         cookies = manager.load_cookies()
 
         assert cookies == valid_cookie_data
@@ -55,27 +51,21 @@ class TestCookieManager:
 
         assert "invalid json" in str(exc_info.value).lower()
 
-    def test_validate_cookie_format_valid(self, valid_cookie_data):
-        """Test validation of valid cookie format."""
+    @pytest.mark.parametrize(
+        "cookie_fixture,expected",
+        [
+            pytest.param("valid_cookie_data", True, id="valid"),
+            pytest.param("invalid_cookie_data_wrong_structure", False, id="missing_cookies_key"),
+            pytest.param("invalid_cookie_data_not_list", False, id="cookies_not_list"),
+            pytest.param("invalid_cookie_data", False, id="missing_fields"),
+        ],
+    )
+    def test_validate_cookie_format(self, request, cookie_fixture, expected):
+        """Test cookie format validation for valid and malformed data."""
         manager = CookieManager(Path("dummy"))
-        assert manager.validate_cookie_format(valid_cookie_data) is True
+        cookie_data = request.getfixturevalue(cookie_fixture)
 
-    def test_validate_cookie_format_missing_cookies_key(self):
-        """Test validation with missing cookies key."""
-        manager = CookieManager(Path("dummy"))
-        invalid_data = {"origins": []}
-        assert manager.validate_cookie_format(invalid_data) is False
-
-    def test_validate_cookie_format_cookies_not_list(self):
-        """Test validation when cookies is not a list."""
-        manager = CookieManager(Path("dummy"))
-        invalid_data = {"cookies": "not a list", "origins": []}
-        assert manager.validate_cookie_format(invalid_data) is False
-
-    def test_validate_cookie_format_missing_fields(self, invalid_cookie_data):
-        """Test validation with missing required fields."""
-        manager = CookieManager(Path("dummy"))
-        assert manager.validate_cookie_format(invalid_cookie_data) is False
+        assert manager.validate_cookie_format(cookie_data) is expected
 
     def test_check_required_cookies_all_present(self, valid_cookie_data):
         """Test checking required cookies when all are present."""
@@ -90,17 +80,26 @@ class TestCookieManager:
     def test_check_required_cookies_missing(self, valid_cookie_data):
         """Test checking required cookies when some are missing."""
         manager = CookieManager(Path("dummy"))
-        # Remove required cookie
-        valid_cookie_data["cookies"] = [
-            {"name": "c_user", "value": "123", "domain": ".facebook.com", "path": "/"}
-        ]
-        manager.cookies_data = valid_cookie_data
+        # Remove required cookie (copy: valid_cookie_data is shared across the session)
+        manager.cookies_data = {
+            **valid_cookie_data,
+            "cookies": [{"name": "c_user", "value": "123", "domain": ".facebook.com", "path": "/"}],
+        }
 
         all_present, missing = manager.check_required_cookies()
 
         assert all_present is False
         assert "xs" in missing
 
+    def test_check_required_cookies_no_data(self):
+        """Test all required cookies are reported missing, sorted, when nothing is loaded."""
+        manager = CookieManager(Path("dummy"))
+
+        all_present, missing = manager.check_required_cookies()
+
+        assert all_present is False
+        assert missing == ["c_user", "xs"]
+
     def test_get_cookie_value_found(self, valid_cookie_data):
         """Test getting cookie value when cookie exists."""
         manager = CookieManager(Path("dummy"))
@@ -119,6 +118,20 @@ class TestCookieManager:
 
         assert value is None
 
+    def test_get_cookie_value_after_reassignment(self, valid_cookie_data):
+        """Test reassigning cookies_data refreshes the name lookup."""
+        manager = CookieManager(Path("dummy"))
+        manager.cookies_data = valid_cookie_data
+        assert manager.get_cookie_value("c_user") == "123456789"
+
+        manager.cookies_data = {
+            **valid_cookie_data,
+            "cookies": [{"name": "c_user", "value": "987", "domain": ".facebook.com", "path": "/"}],
+        }
+
+        assert manager.get_cookie_value("c_user") == "987"
+        assert manager.get_cookie_value("xs") is None
+
     def test_get_storage_state_success(self, valid_cookie_data):
         """Test getting storage state with valid cookies."""
         manager = CookieManager(Path("dummy"))
@@ -140,11 +153,11 @@ class TestCookieManager:
     def test_get_storage_state_missing_required(self, valid_cookie_data):
         """Test getting storage state when required cookies missing."""
         manager = CookieManager(Path("dummy"))
-        # Remove required cookie
-        valid_cookie_data["cookies"] = [
-            {"name": "other", "value": "123", "domain": ".facebook.com", "path": "/"}
-        ]
-        manager.cookies_data = valid_cookie_data
+        # Remove required cookie (copy: valid_cookie_data is shared across the session)
+        manager.cookies_data = {
+            **valid_cookie_data,
+            "cookies": [{"name": "other", "value": "123", "domain": ".facebook.com", "path": "/"}],
+        }
 
         with pytest.raises(ValueError) as exc_info:
             manager.get_storage_state()
@@ -152,5 +165,70 @@ class TestCookieManager:
         assert "missing required cookies" in str(exc_info.value).lower()
 
 
+@pytest.mark.unit
+class TestCookieManagerStreaming:
+    """Test streamed loading of large cookie files."""
+
+    @pytest.fixture
+    def storage_state(self, valid_cookie_data):
+        """Cookie data with a non-empty origins section."""
+        return {
+            **valid_cookie_data,
+            "origins": [
+                {
+                    "origin": "https://www.facebook.com",
+                    "localStorage": [{"name": "k", "value": "v"}],
+                }
+            ],
+        }
+
+    @pytest.fixture
+    def stream_all(self, monkeypatch):
+        """Stream every cookie file regardless of size."""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("src.auth.cookie_manager.STREAM_THRESHOLD_BYTES", 0)
+
+    def test_streamed_load_defers_origins(self, stream_all, tmp_path, storage_state):
+        """Test large files load cookies first and origins on get_storage_state."""
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text(json.dumps(storage_state))
+        manager = CookieManager(cookie_file)
+
+        cookies = manager.load_cookies()
+
+        assert cookies["cookies"] == storage_state["cookies"]
+        assert cookies["origins"] == []
+        assert manager.get_cookie_value("xs") == "abc123def456"  # pragma: allowlist secret
+        assert manager.get_storage_state() == storage_state
+
+    def test_streamed_load_invalid_json(self, stream_all, tmp_path):
+        """Test streamed parsing reports invalid JSON like json.load does."""
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text('{"cookies": [{"name": ')
+        manager = CookieManager(cookie_file)
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            manager.load_cookies()
+
+    def test_streamed_load_without_cookies_key(self, stream_all, tmp_path):
+        """Test files without a cookies array still fail format validation."""
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text(json.dumps({"origins": []}))
+        manager = CookieManager(cookie_file)
+
+        with pytest.raises(ValueError, match="Invalid cookie file format"):
+            manager.load_cookies()
+
+    def test_large_file_without_ijson(self, monkeypatch, tmp_path, storage_state):
+        """Test large files fall back to json when ijson is unavailable."""
+        monkeypatch.setattr("src.auth.cookie_manager.STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr("src.auth.cookie_manager.ijson", None)
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text(json.dumps(storage_state))
+        manager = CookieManager(cookie_file)
+
+        assert manager.load_cookies() == storage_state
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,17 +5,30 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.auth.session_validator import SessionValidator
+# SessionValidator imports Playwright; skip the module cleanly where it isn't installed
+PlaywrightTimeoutError = pytest.importorskip("playwright.sync_api").TimeoutError
+
+from src.auth.session_validator import SessionValidator  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """
+    Shared default SessionValidator.
+
+    The validator holds no per-page state, so one instance serves every test.
+    Tests that stub its methods must do so with monkeypatch or patch.object
+    so the stubs are undone afterwards.
+    """
+    return SessionValidator()
 
 
 @pytest.mark.unit
 class TestSessionValidator:
     """Test SessionValidator class."""
 
-    def test_init_default_timeout(self):
+    def test_init_default_timeout(self, validator):
         """Test SessionValidator initialization with default timeout."""
-        validator = SessionValidator()
-
         assert validator.timeout == 30000
 
     def test_init_custom_timeout(self):
@@ -24,54 +37,31 @@ class TestSessionValidator:
 
         assert validator.timeout == 60000
 
-    def test_check_login_redirect_url_contains_login(self):
-        """Test detecting login redirect in URL."""
-        validator = SessionValidator()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/login.php"
-
-        assert validator._check_login_redirect(mock_page) is True
-
-    def test_check_login_redirect_url_contains_checkpoint(self):
-        """Test detecting checkpoint in URL."""
-        validator = SessionValidator()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/checkpoint"
-
-        assert validator._check_login_redirect(mock_page) is True
-
-    def test_check_login_redirect_no_redirect(self):
-        """Test when not redirected to login."""
-        validator = SessionValidator()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com"
-        mock_page.locator.return_value.count.return_value = 0
-
-        assert validator._check_login_redirect(mock_page) is False
-
-    def test_check_login_redirect_login_form_present(self):
-        """Test detecting login form elements."""
-        validator = SessionValidator()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com"
-
-        # Mock locator to return element count > 0
-        mock_locator = Mock()
-        mock_locator.count.return_value = 1
-        mock_page.locator.return_value = mock_locator
-
-        assert validator._check_login_redirect(mock_page) is True
-
-    def test_check_session_indicators_profile_link(self):
+    @pytest.mark.parametrize(
+        "url,locator_count,expected",
+        [
+            pytest.param("https://mbasic.facebook.com/login.php", 0, True, id="url_login"),
+            pytest.param("https://mbasic.facebook.com/checkpoint", 0, True, id="url_checkpoint"),
+            pytest.param("https://www.facebook.com/LOGIN.php", 0, True, id="url_login_uppercase"),
+            pytest.param("https://mbasic.facebook.com", 0, False, id="no_redirect"),
+            pytest.param("https://mbasic.facebook.com", 1, True, id="login_form_present"),
+        ],
+    )
+    def test_check_login_redirect(
+        self, validator, mock_page, mock_locator, url, locator_count, expected
+    ):
+        """Test detecting login redirects by URL and login form elements."""
+        mock_page.url = url
+        mock_locator.count.return_value = locator_count
+
+        assert validator._check_login_redirect(mock_page) is expected
+
+    def test_check_session_indicators_profile_link(self, validator, mock_page, mock_locator):
         """Test _check_session_indicators with profile link present."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
         # Mock locator to find profile link
-        mock_locator = Mock()
         mock_locator.count.return_value = 1
-        mock_page.locator.return_value = mock_locator
 
         # Mock _check_login_redirect to return False
         with patch.object(validator, "_check_login_redirect", return_value=False):
@@ -79,10 +69,8 @@ class TestSessionValidator:
 
             assert result is True
 
-    def test_check_session_indicators_feed_link(self):
+    def test_check_session_indicators_feed_link(self, validator, mock_page):
         """Test _check_session_indicators with feed/home link present."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
         # First selector returns 0, second returns 1 (feed link)
@@ -111,16 +99,11 @@ class TestSessionValidator:
 
             assert result is True
 
-    def test_check_session_indicators_no_indicators(self):
+    def test_check_session_indicators_no_indicators(self, validator, mock_page):
         """Test _check_session_indicators with no indicators present."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
-        # All locators return 0
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
+        # All locators return 0 (mock_locator default)
 
         # Mock _check_login_redirect to return True (on login page)
         with patch.object(validator, "_check_login_redirect", return_value=True):
@@ -128,16 +111,11 @@ class TestSessionValidator:
 
             assert result is False
 
-    def test_check_session_indicators_fallback_not_on_login(self):
+    def test_check_session_indicators_fallback_not_on_login(self, validator, mock_page):
         """Test _check_session_indicators fallback when not on login page."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
-        # All selectors return 0 (no indicators found)
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
+        # All selectors return 0 (no indicators found, mock_locator default)
 
         # Mock _check_login_redirect to return False (not on login)
         # This triggers the fallback check
@@ -147,17 +125,15 @@ class TestSessionValidator:
             # Fallback should return True if not on login page
             assert result is True
 
-    def test_check_session_indicators_exception_handling(self):
+    def test_check_session_indicators_exception_handling(self, validator, mock_page):
         """Test _check_session_indicators handles exceptions gracefully."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
         # Mock locator to raise exception - this will be caught by inner try-except
         # To test the outer exception handler, we need an exception that escapes
         # The _check_login_redirect call is not in a try-except, so if it raises,
         # it will be caught by the outer handler
-        mock_page.locator.return_value.count.return_value = 0  # All selectors return 0
+        # All selectors return 0 (mock_locator default)
         # Mock _check_login_redirect to raise exception to trigger outer exception handler
         with patch.object(
             validator, "_check_login_redirect", side_effect=Exception("Check redirect error")
@@ -167,88 +143,70 @@ class TestSessionValidator:
 
             assert result is False
 
-    def test_detect_2fa_challenge_url(self):
+    def test_detect_2fa_challenge_url(self, validator, mock_page):
         """Test detecting 2FA challenge in URL."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com/checkpoint"
 
         assert validator._detect_2fa_challenge(mock_page) is True
 
-    def test_detect_2fa_challenge_content(self):
+    def test_detect_2fa_challenge_content(self, validator, mock_page):
         """Test detecting 2FA challenge in page content."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
         mock_page.content.return_value = "Enter your two-factor authentication code"
 
         assert validator._detect_2fa_challenge(mock_page) is True
 
-    def test_detect_2fa_challenge_no_challenge(self):
+    def test_detect_2fa_challenge_no_challenge(self, validator, mock_page):
         """Test when no 2FA challenge present."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
         mock_page.content.return_value = "Welcome to Facebook"
 
         assert validator._detect_2fa_challenge(mock_page) is False
 
-    @patch("src.auth.session_validator.SessionValidator._check_login_redirect")
-    @patch("src.auth.session_validator.SessionValidator._detect_2fa_challenge")
-    def test_validate_session_success(self, mock_2fa, mock_login):
+    @pytest.fixture
+    def patched_validator(self, validator, monkeypatch):
+        """
+        SessionValidator whose page checks are stubbed to report a valid session.
+
+        Tests flip the relevant check's return_value to drive validate_session.
+        """
+        monkeypatch.setattr(validator, "_detect_2fa_challenge", Mock(return_value=False))
+        monkeypatch.setattr(validator, "_check_login_redirect", Mock(return_value=False))
+        monkeypatch.setattr(validator, "_check_session_indicators", Mock(return_value=True))
+        return validator
+
+    def test_validate_session_success(self, patched_validator, mock_page):
         """Test successful session validation."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
 
-        mock_2fa.return_value = False
-        mock_login.return_value = False
-
-        # Mock session indicators check
-        with patch.object(validator, "_check_session_indicators", return_value=True):
-            is_valid, message = validator.validate_session(mock_page)
+        is_valid, message = patched_validator.validate_session(mock_page)
 
-            assert is_valid is True
-            assert "valid" in message.lower()
+        assert is_valid is True
+        assert "valid" in message.lower()
 
-    @patch("src.auth.session_validator.SessionValidator._detect_2fa_challenge")
-    def test_validate_session_2fa_challenge(self, mock_2fa):
+    def test_validate_session_2fa_challenge(self, patched_validator, mock_page):
         """Test session validation with 2FA challenge."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
+        patched_validator._detect_2fa_challenge.return_value = True
 
-        mock_2fa.return_value = True
-
-        is_valid, message = validator.validate_session(mock_page)
+        is_valid, message = patched_validator.validate_session(mock_page)
 
         assert is_valid is False
         assert "2fa" in message.lower() or "challenge" in message.lower()
 
-    @patch("src.auth.session_validator.SessionValidator._detect_2fa_challenge")
-    @patch("src.auth.session_validator.SessionValidator._check_login_redirect")
-    def test_validate_session_expired(self, mock_login, mock_2fa):
+    def test_validate_session_expired(self, patched_validator, mock_page):
         """Test session validation with expired session."""
-        validator = SessionValidator()
-        mock_page = Mock()
         mock_page.url = "https://mbasic.facebook.com"
+        patched_validator._check_login_redirect.return_value = True
 
-        mock_2fa.return_value = False
-        mock_login.return_value = True
-
-        is_valid, message = validator.validate_session(mock_page)
+        is_valid, message = patched_validator.validate_session(mock_page)
 
         assert is_valid is False
         assert "expired" in message.lower() or "login" in message.lower()
 
-    def test_validate_session_timeout(self):
+    def test_validate_session_timeout(self, validator, mock_page):
         """Test session validation with timeout."""
-        validator = SessionValidator()
-        mock_page = Mock()
-
         # Mock goto to raise TimeoutError
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
         mock_page.goto.side_effect = PlaywrightTimeoutError("Timeout")
 
         is_valid, message = validator.validate_session(mock_page)
@@ -2,27 +2,24 @@
 Pytest configuration and shared fixtures for unit tests.
 """
 import json
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock
 
-import pytest  # noqa: E402
+import pytest
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+from tests.unit.fixtures.mock_cookies import VALID_COOKIES, storage_state
 
-# Note: pytest_plugins is defined in the root tests/conftest.py
-# to comply with pytest's requirement that it be at the top level
+# Note: the project root is put on sys.path by tests/conftest.py, and
+# pytest_plugins is defined there to comply with pytest's requirement
+# that it be at the top level
 
 
 # Shared fixtures for unit tests
 @pytest.fixture
-def mock_page():
+def mock_page(mock_page, mock_locator):
     """
     Create a mock Playwright Page object.
 
+    Extends the autospec'd mock_page from tests/conftest.py.
     Includes commonly used attributes and methods:
     - url: Page URL (default: "https://mbasic.facebook.com/allactivity")
     - content(): Returns mock HTML content
@@ -32,14 +29,11 @@ def mock_page():
 
     Tests can override any attribute or method as needed.
     """
-    page = MagicMock()
+    page = mock_page
     page.url = "https://mbasic.facebook.com/allactivity"
     page.content.return_value = "<html><body>Mock page content</body></html>"
 
     # Mock locator chain
-    mock_locator = MagicMock()
-    mock_locator.count.return_value = 0
-    mock_locator.first = MagicMock()
     mock_locator.first.is_visible.return_value = False
     mock_locator.first.click.return_value = None
     mock_locator.all.return_value = []
@@ -89,7 +83,7 @@ def mock_browser(mock_context):
     return browser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_cookie_data():
     """
     Valid cookie data structure for testing.
@@ -99,20 +93,31 @@ def valid_cookie_data():
         "cookies": [...],
         "origins": []
     }
+
+    Session-scoped and shared by all tests: do not mutate it. Tests that need
+    different cookies should build a new dict, e.g. {**valid_cookie_data, "cookies": [...]}.
     """
-    return {
-        "cookies": [
-            {"name": "c_user", "value": "123456789", "domain": ".facebook.com", "path": "/"},
-            {
-                "name": "xs",
-                "value": "abc123def456",  # pragma: allowlist secret
-                "domain": ".facebook.com",
-                "path": "/",
-            },
-            {"name": "datr", "value": "xyz789", "domain": ".facebook.com", "path": "/"},
-        ],
-        "origins": [],
-    }
+    return storage_state(VALID_COOKIES)
+
+
+@pytest.fixture(scope="session")
+def cookie_file_on_disk(tmp_path_factory, valid_cookie_data):
+    """
+    Cookie file containing valid_cookie_data, written once per session.
+
+    Shared by all tests: only use it for tests that read the file. Tests that
+    write cookie files should use temp_cookie_file instead.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary directory factory
+        valid_cookie_data: The valid_cookie_data fixture
+
+    Returns:
+        Path object pointing to the cookie file with data
+    """
+    cookie_file = tmp_path_factory.mktemp("cookies") / "cookies.json"
+    cookie_file.write_text(json.dumps(valid_cookie_data), encoding="utf-8")
+    return cookie_file
 
 
 @pytest.fixture
@@ -149,3 +154,59 @@ def temp_progress_file(tmp_path):
     """
     progress_file = tmp_path / "progress.json"
     return progress_file
+
+
+@pytest.fixture(scope="session")
+def error_detector():
+    """
+    Shared ErrorDetector with the default indicators.
+
+    Built once per session since it compiles its indicator pattern at init.
+    Tests needing extra indicators should construct their own.
+    """
+    from src.safety.error_detector import ErrorDetector
+
+    return ErrorDetector()
+
+
+@pytest.fixture(scope="session")
+def url_builder():
+    """Shared URLBuilder for the "testuser" account."""
+    from src.traversal.url_builder import URLBuilder
+
+    return URLBuilder("testuser")
+
+
+@pytest.fixture(scope="session")
+def date_parser():
+    """Shared DateParser with the default (local) timezone."""
+    from src.traversal.date_parser import DateParser
+
+    return DateParser()
+
+
+@pytest.fixture(scope="session")
+def item_extractor():
+    """
+    Shared ItemExtractor with a 2021-01-01 target date.
+
+    Tests that patch its methods use patch.object, which restores them on exit.
+    """
+    from datetime import datetime
+
+    from src.deletion.item_extractor import ItemExtractor
+
+    return ItemExtractor(datetime(2021, 1, 1))
+
+
+@pytest.fixture(scope="session")
+def registered_handlers():
+    """
+    Default deletion handlers from the registry, keyed by class.
+
+    Only for tests that call handler methods without stubbing them; tests that
+    assign Mocks onto a handler should construct their own.
+    """
+    from src.deletion.handlers import get_all_handlers
+
+    return {type(handler): handler for handler in get_all_handlers()}
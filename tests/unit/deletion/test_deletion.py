@@ -2,9 +2,10 @@
 Unit tests for deletion handlers and engine.
 """
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from src.deletion.deletion_engine import DeletionEngine
 from src.deletion.handlers import get_all_handlers
@@ -12,889 +13,621 @@ from src.deletion.handlers.base_handler import DeletionHandler
 from src.deletion.handlers.comment_handler import CommentDeletionHandler
 from src.deletion.handlers.post_handler import PostDeletionHandler
 from src.deletion.handlers.reaction_handler import ReactionRemovalHandler
-from src.deletion.item_extractor import ItemExtractor
+from src.deletion.item_extractor import DELETE_LINK_SELECTORS, ItemExtractor
+from src.utils.state_manager import StateManager
+from tests.unit.fixtures.mock_pages import FakeElement, FakeLocator, locator_mock
+
+pytestmark = pytest.mark.unit
+
+ALLACTIVITY_URL = "https://mbasic.facebook.com/username/allactivity"
+COMMENT_URL = "https://mbasic.facebook.com/comment/123"
+DELETE_URL = "https://mbasic.facebook.com/delete.php"
+
+# Target date of the item_extractor fixture, and item dates either side of it
+TARGET_DATE = datetime(2021, 1, 1)
+BEFORE_TARGET = datetime(2020, 11, 3)
+AFTER_TARGET = datetime(2022, 11, 3)
 
 
-@pytest.mark.unit
 class TestBaseHandler:
     """Test DeletionHandler base class."""
 
+    @pytest.fixture
+    def handler(self, registered_handlers):
+        """Registered PostDeletionHandler; these tests only call its base helpers."""
+        return registered_handlers[PostDeletionHandler]
+
     def test_abstract_methods(self):
         """Test that DeletionHandler is abstract."""
         with pytest.raises(TypeError):
             # Cannot instantiate abstract class
             DeletionHandler()
 
-    def test_wait_for_confirmation_detected(self):
+    def test_wait_for_confirmation_detected(self, handler, mock_page):
         """Test _wait_for_confirmation detects confirmation page."""
-        handler = PostDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/delete.php"
-        mock_page.wait_for_load_state.return_value = None
+        mock_page.url = DELETE_URL
         mock_page.locator.return_value.count.return_value = 1
 
         result = handler._wait_for_confirmation(mock_page)
         assert result is True
 
-    def test_wait_for_confirmation_not_detected(self):
+    def test_wait_for_confirmation_not_detected(self, handler, mock_page):
         """Test _wait_for_confirmation when no confirmation page."""
-        handler = PostDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/allactivity"
-        mock_page.wait_for_load_state.return_value = None
         mock_page.locator.return_value.count.return_value = 0
 
         result = handler._wait_for_confirmation(mock_page)
         assert result is False
 
-    def test_click_confirm_success(self):
+    def test_click_confirm_success(self, handler, mock_page):
         """Test _click_confirm successfully clicks button."""
-        handler = PostDeletionHandler()
-        mock_page = Mock()
-
-        mock_locator = Mock()
-        mock_locator.count.return_value = 1
-        mock_button = Mock()
-        mock_button.is_visible.return_value = True
-        mock_button.click.return_value = None
-        mock_locator.first = mock_button
-        mock_page.locator.return_value = mock_locator
+        button = FakeLocator(matches=1)
+        mock_page.locator.return_value = button
 
         result = handler._click_confirm(mock_page)
         assert result is True
-        mock_button.click.assert_called_once()
+        assert button.clicks == 1
 
-    def test_wait_for_navigation_success(self):
+    def test_wait_for_navigation_success(self, handler, mock_page):
         """Test _wait_for_navigation detects successful navigation."""
-        handler = PostDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/username/allactivity"
-        mock_page.wait_for_load_state.return_value = None
+        mock_page.url = ALLACTIVITY_URL
 
         result = handler._wait_for_navigation(mock_page)
         assert result is True
 
 
-@pytest.mark.unit
 class TestPostDeletionHandler:
     """Test PostDeletionHandler."""
 
-    def test_can_handle_post(self):
-        """Test can_handle returns True for posts."""
-        handler = PostDeletionHandler()
-        item = {"type": "post"}
-        assert handler.can_handle(item) is True
-
-    def test_can_handle_non_post(self):
-        """Test can_handle returns False for non-posts."""
-        handler = PostDeletionHandler()
-        item = {"type": "comment"}
-        assert handler.can_handle(item) is False
-
-    def test_delete_success(self):
+    def test_delete_success(self, mock_page):
         """Test successful post deletion."""
         handler = PostDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/allactivity"
-        mock_page.wait_for_load_state.return_value = None
 
         # Mock delete link
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-        mock_delete_link.click.return_value = None
+        delete_link = FakeLocator(matches=1)
 
         item = {
             "type": "post",
             "item_id": "123",
-            "delete_link": mock_delete_link,
+            "delete_link": delete_link,
         }
 
         # Mock confirmation flow
-        with patch.object(handler, "_wait_for_confirmation", return_value=False):
-            with patch.object(handler, "_wait_for_navigation", return_value=True):
-                success, message = handler.delete(mock_page, item)
-                assert success is True
-                assert "success" in message.lower()
+        handler._wait_for_confirmation = Mock(return_value=False)
+        handler._wait_for_navigation = Mock(return_value=True)
+
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        assert "success" in message.lower()
 
 
-@pytest.mark.unit
 class TestCommentDeletionHandler:
     """Test CommentDeletionHandler."""
 
-    def test_can_handle_comment(self):
-        """Test can_handle returns True for comments."""
-        handler = CommentDeletionHandler()
-        item = {"type": "comment"}
-        assert handler.can_handle(item) is True
+    @pytest.fixture
+    def delete_link(self):
+        """Visible delete link attached to the item."""
+        return FakeLocator(matches=1)
 
-    def test_can_handle_non_comment(self):
-        """Test can_handle returns False for non-comments."""
-        handler = CommentDeletionHandler()
-        item = {"type": "post"}
-        assert handler.can_handle(item) is False
+    @pytest.fixture
+    def item(self, delete_link):
+        """Comment item carrying its delete link."""
+        return {"type": "comment", "item_id": "123", "delete_link": delete_link}
 
-    def test_delete_success_direct_link(self):
-        """Test delete with delete link found directly."""
+    @pytest.fixture
+    def handler(self):
+        """CommentDeletionHandler stubbed for a delete with no confirmation page."""
         handler = CommentDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/allactivity"
-
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-        mock_delete_link.click.return_value = None
-
-        item = {"type": "comment", "item_id": "123", "delete_link": mock_delete_link}
+        handler._wait_for_confirmation = Mock(return_value=False)
+        handler._click_confirm = Mock(return_value=True)
+        handler._wait_for_navigation = Mock(return_value=True)
+        return handler
 
-        with patch.object(handler, "_wait_for_confirmation", return_value=False):
-            with patch.object(handler, "_wait_for_navigation", return_value=True):
-                success, message = handler.delete(mock_page, item)
-                assert success is True
-                assert "success" in message.lower()
-                mock_delete_link.click.assert_called_once()
+    def test_delete_success_direct_link(self, handler, item, delete_link, mock_page):
+        """Test delete with delete link found directly."""
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        assert "success" in message.lower()
+        assert delete_link.clicks == 1
+        handler._click_confirm.assert_not_called()
 
-    def test_delete_success_with_context(self):
+    def test_delete_success_with_context(self, handler, delete_link, mock_page):
         """Test delete with context navigation."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/allactivity"
-
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-        mock_delete_link.click.return_value = None
+        item = {"type": "comment", "item_id": "123", "element": Mock()}
 
-        mock_element = Mock()
-        item = {"type": "comment", "item_id": "123", "element": mock_element}
+        handler._find_delete_link = Mock(side_effect=[None, delete_link])
+        handler._navigate_to_context = Mock(return_value=True)
 
-        with patch.object(handler, "_find_delete_link", side_effect=[None, mock_delete_link]):
-            with patch.object(handler, "_navigate_to_context", return_value=True):
-                with patch.object(handler, "_wait_for_confirmation", return_value=False):
-                    with patch.object(handler, "_wait_for_navigation", return_value=True):
-                        success, message = handler.delete(mock_page, item)
-                        assert success is True
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        assert delete_link.clicks == 1
 
-    def test_delete_with_confirmation(self):
+    def test_delete_with_confirmation(self, handler, item, mock_page):
         """Test delete with confirmation page."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/allactivity"
-
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-        mock_delete_link.click.return_value = None
-
-        item = {"type": "comment", "item_id": "123", "delete_link": mock_delete_link}
+        handler._wait_for_confirmation.return_value = True
 
-        with patch.object(handler, "_find_delete_link", return_value=mock_delete_link):
-            with patch.object(handler, "_wait_for_confirmation", return_value=True):
-                with patch.object(handler, "_click_confirm", return_value=True):
-                    with patch.object(handler, "_wait_for_navigation", return_value=True):
-                        success, message = handler.delete(mock_page, item)
-                        assert success is True
-                        handler._click_confirm.assert_called_once()
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        handler._click_confirm.assert_called_once()
 
-    def test_delete_navigation_back(self):
+    def test_delete_navigation_back(self, handler, item, mock_page):
         """Test delete navigates back to Activity Log."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/comment/123"
+        mock_page.url = COMMENT_URL
+        handler._wait_for_navigation.return_value = False
 
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-        mock_delete_link.click.return_value = None
-
-        item = {"type": "comment", "item_id": "123", "delete_link": mock_delete_link}
+        # URL doesn't contain allactivity, should navigate back
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        mock_page.goto.assert_called_once()
 
-        with patch.object(handler, "_find_delete_link", return_value=mock_delete_link):
-            with patch.object(handler, "_wait_for_confirmation", return_value=False):
-                with patch.object(handler, "_wait_for_navigation", return_value=False):
-                    # URL doesn't contain allactivity, should navigate back
-                    mock_page.url = "https://mbasic.facebook.com/comment/123"
-                    mock_page.goto.return_value = None
-                    success, message = handler.delete(mock_page, item)
-                    assert success is True
-                    mock_page.goto.assert_called_once()
-
-    def test_delete_link_not_found(self):
+    def test_delete_link_not_found(self, handler, mock_page):
         """Test delete fails when delete link not found."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-
         item = {"type": "comment", "item_id": "123"}
 
-        with patch.object(handler, "_find_delete_link", return_value=None):
-            with patch.object(handler, "_navigate_to_context", return_value=False):
-                success, message = handler.delete(mock_page, item)
-                assert success is False
-                assert "could not navigate" in message.lower()
+        handler._find_delete_link = Mock(return_value=None)
+        handler._navigate_to_context = Mock(return_value=False)
 
-    def test_delete_link_not_found_after_context(self):
-        """Test delete fails when delete link not found after context navigation."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
+        success, message = handler.delete(mock_page, item)
+        assert success is False
+        assert "could not navigate" in message.lower()
 
+    def test_delete_link_not_found_after_context(self, handler, mock_page):
+        """Test delete fails when delete link not found after context navigation."""
         item = {"type": "comment", "item_id": "123"}
 
         # First call returns None, context navigation succeeds, second call also returns None
-        with patch.object(handler, "_find_delete_link", side_effect=[None, None]):
-            with patch.object(handler, "_navigate_to_context", return_value=True):
-                success, message = handler.delete(mock_page, item)
-                assert success is False
-                assert "not found after viewing context" in message.lower()
+        handler._find_delete_link = Mock(side_effect=[None, None])
+        handler._navigate_to_context = Mock(return_value=True)
 
-    def test_delete_timeout_error(self):
-        """Test delete handles PlaywrightTimeoutError."""
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
+        success, message = handler.delete(mock_page, item)
+        assert success is False
+        assert "not found after viewing context" in message.lower()
 
-        mock_delete_link = Mock()
+    def test_delete_timeout_error(self, handler, mock_page):
+        """Test delete handles PlaywrightTimeoutError."""
+        mock_delete_link = locator_mock()
         mock_delete_link.click.side_effect = PlaywrightTimeoutError("Timeout")
 
         item = {"type": "comment", "item_id": "123", "delete_link": mock_delete_link}
 
-        with patch.object(handler, "_find_delete_link", return_value=mock_delete_link):
-            success, message = handler.delete(mock_page, item)
-            assert success is False
-            assert "timeout" in message.lower()
-
-    def test_find_delete_link_from_item(self):
-        """Test _find_delete_link uses delete_link from item."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-
-        mock_delete_link = Mock()
-        mock_delete_link.is_visible.return_value = True
-
-        item = {"type": "comment", "delete_link": mock_delete_link}
-
-        result = handler._find_delete_link(mock_page, item)
-        assert result == mock_delete_link
-
-    def test_find_delete_link_in_element(self):
-        """Test _find_delete_link finds link in element."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-
-        mock_link = Mock()
-        mock_link.count.return_value = 1
-        mock_link.is_visible.return_value = True
-        mock_link.first = mock_link
-
-        mock_element = Mock()
-        mock_element.locator.return_value = mock_link
-
-        item = {"type": "comment", "element": mock_element}
-
-        result = handler._find_delete_link(mock_page, item)
-        assert result is not None
-
-    def test_find_delete_link_on_page(self):
-        """Test _find_delete_link finds link on page."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-
-        mock_link = Mock()
-        mock_link.is_visible.return_value = True
-        mock_page.locator.return_value.all.return_value = [mock_link]
+        handler._find_delete_link = Mock(return_value=mock_delete_link)
 
-        item = {"type": "comment"}
-
-        result = handler._find_delete_link(mock_page, item)
-        assert result == mock_link
+        success, message = handler.delete(mock_page, item)
+        assert success is False
+        assert "timeout" in message.lower()
 
-    def test_navigate_to_context_success(self):
+    def test_navigate_to_context_success(self, registered_handlers, mock_page):
         """Test _navigate_to_context successfully navigates."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
-
-        mock_link = Mock()
-        mock_link.count.return_value = 1
-        mock_link.is_visible.return_value = True
-        mock_link.click.return_value = None
-        mock_link.first = mock_link
+        handler = registered_handlers[CommentDeletionHandler]
 
-        mock_element = Mock()
-        mock_element.locator.return_value = mock_link
+        link = FakeLocator(matches=1)
 
-        item = {"type": "comment", "element": mock_element}
+        item = {"type": "comment", "element": FakeElement(locator_result=link)}
 
         result = handler._navigate_to_context(mock_page, item)
         assert result is True
-        mock_link.click.assert_called_once()
+        assert link.clicks == 1
 
-    def test_navigate_to_context_not_found(self):
+    def test_navigate_to_context_not_found(self, registered_handlers, mock_page):
         """Test _navigate_to_context returns False when no context link."""
-        handler = CommentDeletionHandler()
-        mock_page = Mock()
+        handler = registered_handlers[CommentDeletionHandler]
 
-        mock_element = Mock()
-        mock_element.locator.return_value.count.return_value = 0
-
-        item = {"type": "comment", "element": mock_element}
+        item = {"type": "comment", "element": FakeElement()}
 
         result = handler._navigate_to_context(mock_page, item)
         assert result is False
 
 
-@pytest.mark.unit
 class TestReactionRemovalHandler:
     """Test ReactionRemovalHandler."""
 
-    def test_can_handle_reaction(self):
-        """Test can_handle returns True for reactions."""
-        handler = ReactionRemovalHandler()
-        item = {"type": "reaction"}
-        assert handler.can_handle(item) is True
-
-    def test_can_handle_non_reaction(self):
-        """Test can_handle returns False for non-reactions."""
-        handler = ReactionRemovalHandler()
-        item = {"type": "post"}
-        assert handler.can_handle(item) is False
+    @pytest.fixture
+    def handler(self):
+        """Fresh ReactionRemovalHandler; tests assign Mocks onto it."""
+        return ReactionRemovalHandler()
 
-    def test_delete_calls_remove_reaction(self):
+    def test_delete_calls_remove_reaction(self, handler, mock_page):
         """Test delete() delegates to remove_reaction()."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
         item = {"type": "reaction"}
 
-        with patch.object(
-            handler, "remove_reaction", return_value=(True, "Success")
-        ) as mock_remove:
-            success, message = handler.delete(mock_page, item)
-            assert success is True
-            assert message == "Success"
-            mock_remove.assert_called_once_with(mock_page, item)
-
-    def test_remove_reaction_success(self):
-        """Test remove_reaction successfully removes reaction."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
-        mock_page.wait_for_timeout.return_value = None
-
-        mock_unlike_link = Mock()
-        mock_unlike_link.is_visible.side_effect = [True, False]  # Visible then disappears
-        mock_unlike_link.click.return_value = None
+        handler.remove_reaction = Mock(return_value=(True, "Success"))
 
-        item = {"type": "reaction", "item_id": "123"}
-
-        with patch.object(handler, "_find_unlike_link", return_value=mock_unlike_link):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is True
-            assert "success" in message.lower()
-            mock_unlike_link.click.assert_called_once()
-
-    def test_remove_reaction_link_disappears(self):
-        """Test remove_reaction when link disappears after click."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
-        mock_page.wait_for_timeout.return_value = None
-
-        mock_unlike_link = Mock()
-        mock_unlike_link.is_visible.return_value = False  # Already gone
-        mock_unlike_link.click.return_value = None
-
-        item = {"type": "reaction", "item_id": "123"}
-
-        with patch.object(handler, "_find_unlike_link", return_value=mock_unlike_link):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is True
-
-    def test_remove_reaction_network_idle(self):
-        """Test remove_reaction waits for network idle."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
+        success, message = handler.delete(mock_page, item)
+        assert success is True
+        assert message == "Success"
+        handler.remove_reaction.assert_called_once_with(mock_page, item)
+
+    @pytest.mark.parametrize(
+        "visibility,expected_substr,idle_waits",
+        [
+            pytest.param([False], "removed successfully", 0, id="gone_after_click"),
+            pytest.param([True, False], "removed successfully", 1, id="gone_after_idle"),
+            pytest.param([True, True], "attempted", 1, id="still_visible"),
+        ],
+    )
+    def test_remove_reaction_states(
+        self, handler, mock_page, visibility, expected_substr, idle_waits
+    ):
+        """Test remove_reaction outcomes for each post-click visibility sequence."""
         mock_page.wait_for_timeout.return_value = None
-        mock_page.wait_for_load_state.return_value = None
 
-        mock_unlike_link = Mock()
-        # Still visible after first check, disappears after network idle
-        mock_unlike_link.is_visible.side_effect = [True, True, False]
-        mock_unlike_link.click.return_value = None
+        unlike_link = locator_mock()
+        unlike_link.is_visible.side_effect = visibility
 
         item = {"type": "reaction", "item_id": "123"}
 
-        with patch.object(handler, "_find_unlike_link", return_value=mock_unlike_link):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is True
-            mock_page.wait_for_load_state.assert_called_once()
-
-    def test_remove_reaction_link_still_visible(self):
-        """Test remove_reaction when link still visible (ambiguous case)."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
-        mock_page.wait_for_timeout.return_value = None
-        mock_page.wait_for_load_state.return_value = None
-
-        mock_unlike_link = Mock()
-        mock_unlike_link.is_visible.return_value = True  # Still visible
-        mock_unlike_link.click.return_value = None
-
-        item = {"type": "reaction", "item_id": "123"}
+        handler._find_unlike_link = Mock(return_value=unlike_link)
 
-        with patch.object(handler, "_find_unlike_link", return_value=mock_unlike_link):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is True
-            assert "attempted" in message.lower() or "unclear" in message.lower()
+        success, message = handler.remove_reaction(mock_page, item)
+        assert success is True
+        assert expected_substr in message.lower()
+        unlike_link.click.assert_called_once()
+        assert mock_page.wait_for_load_state.call_count == idle_waits
 
-    def test_remove_reaction_link_not_found(self):
+    def test_remove_reaction_link_not_found(self, handler, mock_page):
         """Test remove_reaction when unlike link not found."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
-
         item = {"type": "reaction", "item_id": "123"}
 
-        with patch.object(handler, "_find_unlike_link", return_value=None):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is False
-            assert "not found" in message.lower()
+        handler._find_unlike_link = Mock(return_value=None)
 
-    def test_remove_reaction_timeout(self):
-        """Test remove_reaction handles PlaywrightTimeoutError."""
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
+        success, message = handler.remove_reaction(mock_page, item)
+        assert success is False
+        assert "not found" in message.lower()
 
-        mock_unlike_link = Mock()
+    def test_remove_reaction_timeout(self, handler, mock_page):
+        """Test remove_reaction handles PlaywrightTimeoutError."""
+        mock_unlike_link = locator_mock()
         mock_unlike_link.click.side_effect = PlaywrightTimeoutError("Timeout")
 
         item = {"type": "reaction", "item_id": "123"}
 
-        with patch.object(handler, "_find_unlike_link", return_value=mock_unlike_link):
-            success, message = handler.remove_reaction(mock_page, item)
-            assert success is False
-            assert "timeout" in message.lower()
-
-    def test_find_unlike_link_from_item(self):
-        """Test _find_unlike_link uses delete_link from item."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
+        handler._find_unlike_link = Mock(return_value=mock_unlike_link)
 
-        mock_unlike_link = Mock()
-        mock_unlike_link.is_visible.return_value = True
+        success, message = handler.remove_reaction(mock_page, item)
+        assert success is False
+        assert "timeout" in message.lower()
 
-        item = {"type": "reaction", "delete_link": mock_unlike_link}
 
-        result = handler._find_unlike_link(mock_page, item)
-        assert result == mock_unlike_link
+class TestLinkFinders:
+    """Test the link lookups shared by the comment and reaction handlers."""
 
-    def test_find_unlike_link_in_element(self):
-        """Test _find_unlike_link finds link in element."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
+    @pytest.fixture(
+        params=[
+            pytest.param((CommentDeletionHandler, "_find_delete_link"), id="comment"),
+            pytest.param((ReactionRemovalHandler, "_find_unlike_link"), id="reaction"),
+        ]
+    )
+    def find_link(self, request, registered_handlers):
+        """Bound link-finder method of the registered handler."""
+        handler_cls, method = request.param
+        return getattr(registered_handlers[handler_cls], method)
 
-        mock_link = Mock()
-        mock_link.count.return_value = 1
-        mock_link.is_visible.return_value = True
-        mock_link.first = mock_link
+    def test_find_link_from_item(self, find_link, mock_page):
+        """Test the finder uses delete_link from the item."""
+        link = FakeLocator(matches=1)
 
-        mock_element = Mock()
-        mock_element.locator.return_value = mock_link
+        item = {"delete_link": link}
 
-        item = {"type": "reaction", "element": mock_element}
+        assert find_link(mock_page, item) == link
 
-        result = handler._find_unlike_link(mock_page, item)
-        assert result is not None
+    def test_find_link_in_element(self, find_link, mock_page):
+        """Test the finder finds the link inside the item's element."""
+        link = FakeLocator(matches=1)
 
-    def test_find_unlike_link_on_page(self):
-        """Test _find_unlike_link finds link on page."""
-        handler = ReactionRemovalHandler()
-        mock_page = Mock()
+        item = {"element": FakeElement(locator_result=link)}
 
-        mock_link = Mock()
-        mock_link.is_visible.return_value = True
-        mock_page.locator.return_value.all.return_value = [mock_link]
+        assert find_link(mock_page, item) is not None
 
-        item = {"type": "reaction"}
+    def test_find_link_on_page(self, find_link, mock_page):
+        """Test the finder falls back to searching the page."""
+        link = FakeLocator(matches=1)
+        mock_page.locator.return_value.all.return_value = [link]
 
-        result = handler._find_unlike_link(mock_page, item)
-        assert result == mock_link
+        assert find_link(mock_page, {}) == link
 
 
-@pytest.mark.unit
 class TestItemExtractor:
     """Test ItemExtractor."""
 
     def test_init(self):
         """Test ItemExtractor initialization."""
-        target_date = datetime(2021, 1, 1)
-        extractor = ItemExtractor(target_date)
+        extractor = ItemExtractor(TARGET_DATE)
 
-        assert extractor.target_date == target_date
+        assert extractor.target_date == TARGET_DATE
         assert extractor.date_parser is not None
 
-    def test_extract_items_empty_page(self):
-        """Test extract_items with empty page."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
-        mock_page.locator.return_value.all.return_value = []
-
-        items = extractor.extract_items(mock_page)
-        assert items == []
-
-    def test_determine_item_type_post(self):
-        """Test _determine_item_type identifies posts."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-        mock_element.text_content.return_value = "You posted something"
-
-        item_type = extractor._determine_item_type(mock_element)
-        assert item_type == "post"
-
-    def test_determine_item_type_comment(self):
-        """Test _determine_item_type identifies comments."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-        mock_element.text_content.return_value = "You commented on a post"
-
-        item_type = extractor._determine_item_type(mock_element)
-        assert item_type == "comment"
-
-    def test_determine_item_type_reaction(self):
-        """Test _determine_item_type identifies reactions."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-        mock_element.text_content.return_value = "You liked a post"
-
-        item_type = extractor._determine_item_type(mock_element)
-        assert item_type == "reaction"
-
-    def test_extract_items_with_items(self):
-        """Test extract_items with items found."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
-
-        # Mock elements
-        mock_element1 = Mock()
-        mock_element1.text_content.return_value = "You posted something. November 3, 2020"
-        mock_element1.get_attribute.return_value = None
-        mock_element1.locator.return_value.count.return_value = 0
-
-        mock_element2 = Mock()
-        mock_element2.text_content.return_value = "You commented. 2 years ago"
-        mock_element2.get_attribute.return_value = None
-        mock_element2.locator.return_value.count.return_value = 0
-
-        mock_locator = Mock()
-        mock_locator.all.return_value = [mock_element1, mock_element2]
-        mock_page.locator.return_value = mock_locator
-
-        with patch.object(extractor, "_parse_activity_item") as mock_parse:
-            mock_parse.side_effect = [
-                {
-                    "type": "post",
-                    "date_string": "November 3, 2020",
-                    "date_parsed": datetime(2020, 11, 3),
-                    "delete_link": Mock(),
-                    "item_id": "1",
-                    "element": mock_element1,
-                },
-                {
-                    "type": "comment",
-                    "date_string": "2 years ago",
-                    "date_parsed": datetime(2019, 1, 1),
-                    "delete_link": Mock(),
-                    "item_id": "2",
-                    "element": mock_element2,
-                },
-            ]
-            items = extractor.extract_items(mock_page)
-            assert len(items) == 2
-
-    def test_extract_items_date_filtering(self):
-        """Test extract_items filters items by target_date."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
-
-        mock_element = Mock()
-        mock_element.text_content.return_value = "You posted something. November 3, 2022"
-        mock_element.get_attribute.return_value = None
-        mock_element.locator.return_value.count.return_value = 0
-
-        mock_locator = Mock()
-        mock_locator.all.return_value = [mock_element]
-        mock_page.locator.return_value = mock_locator
-
-        with patch.object(extractor, "_parse_activity_item") as mock_parse:
-            mock_parse.return_value = {
+    @pytest.mark.parametrize(
+        "dates,expected_count",
+        [
+            pytest.param([], 0, id="empty_page"),
+            pytest.param([BEFORE_TARGET, datetime(2019, 1, 1)], 2, id="before_target"),
+            pytest.param([AFTER_TARGET], 0, id="after_target"),
+            pytest.param([None], 1, id="unparseable_date"),
+        ],
+    )
+    def test_extract_items(self, mock_page, item_extractor, dates, expected_count):
+        """Test extract_items keeps items dated before target_date or undated."""
+        elements = [Mock() for _ in dates]
+        mock_page.locator.return_value.all.return_value = elements
+
+        parsed = [
+            {
                 "type": "post",
-                "date_string": "November 3, 2022",
-                "date_parsed": datetime(2022, 11, 3),  # After target_date
-                "delete_link": Mock(),
-                "item_id": "1",
-                "element": mock_element,
+                "date_string": "some date",
+                "date_parsed": date,
+                "delete_link": FakeLocator(matches=1),
+                "item_id": str(index),
+                "element": element,
             }
-            items = extractor.extract_items(mock_page)
-            assert len(items) == 0  # Should be filtered out
-
-    def test_extract_items_unparseable_date(self):
-        """Test extract_items includes items with unparseable dates."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
-
-        mock_element = Mock()
-        mock_element.text_content.return_value = "You posted something"
-        mock_element.get_attribute.return_value = None
-        mock_element.locator.return_value.count.return_value = 0
-
-        mock_locator = Mock()
-        mock_locator.all.return_value = [mock_element]
-        mock_page.locator.return_value = mock_locator
-
-        with patch.object(extractor, "_parse_activity_item") as mock_parse:
-            mock_parse.return_value = {
-                "type": "post",
-                "date_string": "unknown date",
-                "date_parsed": None,  # Unparseable
-                "delete_link": Mock(),
-                "item_id": "1",
-                "element": mock_element,
-            }
-            items = extractor.extract_items(mock_page)
-            assert len(items) == 1  # Should be included
+            for index, (date, element) in enumerate(zip(dates, elements))
+        ]
 
-    def test_extract_items_multiple_selectors(self):
-        """Test extract_items tries multiple selectors."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_page = Mock()
-        mock_page.wait_for_load_state.return_value = None
+        with patch.object(item_extractor, "_parse_activity_item", side_effect=parsed):
+            items = item_extractor.extract_items(mock_page)
 
+        assert len(items) == expected_count
+
+    @pytest.mark.parametrize(
+        "text,expected_type",
+        [
+            ("You posted something", "post"),
+            ("You commented on a post", "comment"),
+            ("You liked a post", "reaction"),
+        ],
+    )
+    def test_determine_item_type(self, item_extractor, text, expected_type):
+        """Test _determine_item_type identifies the item type from its text."""
+        assert item_extractor._determine_item_type(FakeElement(text=text)) == expected_type
+
+    def test_extract_items_multiple_selectors(self, mock_page, item_extractor):
+        """Test extract_items tries multiple selectors."""
         # First selector returns empty, second returns elements
-        mock_locator1 = Mock()
-        mock_locator1.all.return_value = []
-        mock_locator2 = Mock()
-        mock_locator2.all.return_value = [Mock()]
+        mock_locator1 = locator_mock(all=[])
+        mock_locator2 = locator_mock(all=[locator_mock()])
 
         mock_page.locator.side_effect = [mock_locator1, mock_locator2]
 
-        with patch.object(extractor, "_parse_activity_item", return_value=None):
-            extractor.extract_items(mock_page)
+        with patch.object(item_extractor, "_parse_activity_item", return_value=None):
+            item_extractor.extract_items(mock_page)
             # Should try multiple selectors
             assert mock_page.locator.call_count >= 2
 
-    def test_parse_activity_item_success(self):
+    def test_parse_activity_item_success(self, item_extractor, monkeypatch):
         """Test _parse_activity_item successfully parses item."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-
-        with patch.object(extractor, "_extract_date", return_value="November 3, 2020"):
-            with patch.object(
-                extractor.date_parser, "parse_facebook_date", return_value=datetime(2020, 11, 3)
-            ):
-                with patch.object(extractor, "_determine_item_type", return_value="post"):
-                    with patch.object(extractor, "_find_delete_link", return_value=Mock()):
-                        with patch.object(extractor, "_extract_item_id", return_value="123"):
-                            item = extractor._parse_activity_item(mock_element)
-                            assert item is not None
-                            assert item["type"] == "post"
-                            assert item["date_string"] == "November 3, 2020"
-                            assert item["date_parsed"] == datetime(2020, 11, 3)
-                            assert item["item_id"] == "123"
-
-    def test_parse_activity_item_missing_type(self):
-        """Test _parse_activity_item returns None when type missing."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-
-        with patch.object(extractor, "_extract_date", return_value="November 3, 2020"):
-            with patch.object(
-                extractor.date_parser, "parse_facebook_date", return_value=datetime(2020, 11, 3)
-            ):
-                with patch.object(extractor, "_determine_item_type", return_value=None):
-                    item = extractor._parse_activity_item(mock_element)
-                    assert item is None
-
-    def test_extract_date_from_abbr_title(self):
-        """Test _extract_date from abbr title attribute."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-
-        mock_date_elem = Mock()
-        mock_date_elem.count.return_value = 1
-        mock_date_elem.get_attribute.return_value = "November 3, 2020"
-        mock_date_elem.first = mock_date_elem
-
-        mock_element.locator.return_value = mock_date_elem
-
-        date_string = extractor._extract_date(mock_element)
-        assert date_string == "November 3, 2020"
-
-    def test_extract_date_from_text_pattern(self):
-        """Test _extract_date from text patterns."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-
-        # Mock locator to return empty for structured selectors
-        mock_date_elem = Mock()
-        mock_date_elem.count.return_value = 0
-        mock_element.locator.return_value = mock_date_elem
-
-        # Mock text_content to contain date pattern
-        mock_element.text_content.return_value = "You posted something on November 3, 2020"
+        # item_extractor is shared across tests; monkeypatch restores the stubs
+        monkeypatch.setattr(item_extractor, "_extract_date", lambda element: "November 3, 2020")
+        monkeypatch.setattr(
+            item_extractor.date_parser, "parse_facebook_date", lambda text: BEFORE_TARGET
+        )
+        monkeypatch.setattr(item_extractor, "_determine_item_type", lambda element: "post")
+        monkeypatch.setattr(
+            item_extractor, "_find_delete_link", lambda element: FakeLocator(matches=1)
+        )
+        monkeypatch.setattr(item_extractor, "_extract_item_id", lambda element: "123")
 
-        date_string = extractor._extract_date(mock_element)
-        assert date_string is not None
-        assert "November" in date_string or "2020" in date_string
+        item = item_extractor._parse_activity_item(Mock())
 
-    def test_extract_date_not_found(self):
-        """Test _extract_date returns None when no date found."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
+        assert item is not None
+        assert item["type"] == "post"
+        assert item["date_string"] == "November 3, 2020"
+        assert item["date_parsed"] == BEFORE_TARGET
+        assert item["item_id"] == "123"
 
-        mock_date_elem = Mock()
-        mock_date_elem.count.return_value = 0
-        mock_element.locator.return_value = mock_date_elem
-        mock_element.text_content.return_value = "No date here"
+    def test_parse_activity_item_missing_type(self, item_extractor, monkeypatch):
+        """Test _parse_activity_item returns None when type missing."""
+        monkeypatch.setattr(item_extractor, "_extract_date", lambda element: "November 3, 2020")
+        monkeypatch.setattr(
+            item_extractor.date_parser, "parse_facebook_date", lambda text: BEFORE_TARGET
+        )
+        monkeypatch.setattr(item_extractor, "_determine_item_type", lambda element: None)
 
-        date_string = extractor._extract_date(mock_element)
-        assert date_string is None
+        assert item_extractor._parse_activity_item(Mock()) is None
 
-    def test_find_delete_link_various_selectors(self):
-        """Test _find_delete_link tries various selectors."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
+    def test_parse_activity_item_after_target(self, item_extractor, monkeypatch):
+        """Test _parse_activity_item skips the DOM lookups for items after target_date."""
+        determine_item_type = Mock(return_value="post")
+        monkeypatch.setattr(item_extractor, "_extract_date", lambda element: "November 3, 2022")
+        monkeypatch.setattr(
+            item_extractor.date_parser, "parse_facebook_date", lambda text: AFTER_TARGET
+        )
+        monkeypatch.setattr(item_extractor, "_determine_item_type", determine_item_type)
 
-        # First selector fails, second succeeds
-        mock_link1 = Mock()
-        mock_link1.count.return_value = 0
-        mock_link2 = Mock()
-        mock_link2.count.return_value = 1
-        mock_link2.is_visible.return_value = True
-        mock_link2.first = mock_link2
+        assert item_extractor._parse_activity_item(Mock()) is None
+        determine_item_type.assert_not_called()
 
-        mock_element.locator.side_effect = [mock_link1, mock_link2]
+    def test_extract_date_from_abbr_title(self, item_extractor):
+        """Test _extract_date from abbr title attribute."""
+        mock_date_elem = locator_mock(count=1, get_attribute="November 3, 2020")
+        mock_element = locator_mock(locator=mock_date_elem)
 
-        result = extractor._find_delete_link(mock_element)
-        assert result is not None
+        date_string = item_extractor._extract_date(mock_element)
+        assert date_string == "November 3, 2020"
 
-    def test_extract_item_id_from_attributes(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("You posted something on November 3, 2020", "November 3", id="month_day"),
+            pytest.param("You commented 2 years ago", "2 years ago", id="relative"),
+            pytest.param("You liked a post Yesterday", "Yesterday", id="yesterday"),
+            pytest.param("No date here", None, id="not_found"),
+            pytest.param(" \n ", None, id="blank"),
+        ],
+    )
+    def test_extract_date_from_text(self, item_extractor, text, expected):
+        """Test _extract_date falls back to date patterns in the element text."""
+        # No structured date element, so only the text fallback can match
+        assert item_extractor._extract_date(FakeElement(text=text)) == expected
+
+    def test_find_delete_link_single_query(self, item_extractor):
+        """Test _find_delete_link queries all selectors at once when the match is visible."""
+        link = FakeLocator(matches=1)
+        element = FakeElement(locator_result=link)
+
+        assert item_extractor._find_delete_link(element) is link
+        assert element.selectors == [", ".join(DELETE_LINK_SELECTORS)]
+
+    def test_find_delete_link_no_match(self, item_extractor):
+        """Test _find_delete_link stops after the combined query matches nothing."""
+        element = FakeElement()
+
+        assert item_extractor._find_delete_link(element) is None
+        assert len(element.selectors) == 1
+
+    def test_find_delete_link_various_selectors(self, item_extractor):
+        """Test _find_delete_link tries each selector when the first match is hidden."""
+        mock_element = locator_mock()
+
+        # Combined match is hidden; first selector fails, second succeeds
+        hidden = FakeLocator(matches=1, visible=False)
+        mock_link1 = locator_mock(count=0)
+        mock_link2 = locator_mock(count=1, is_visible=True)
+
+        mock_element.locator.side_effect = [hidden, mock_link1, mock_link2]
+
+        assert item_extractor._find_delete_link(mock_element) is mock_link2
+        assert mock_element.locator.call_args_list[2].args == (DELETE_LINK_SELECTORS[1],)
+
+    def test_find_delete_link_prefers_selector_priority(self, item_extractor):
+        """Test _find_delete_link ranks several matches by selector, not document order."""
+        mock_element = locator_mock()
+
+        # Two links match; the lower-priority one comes first in the document
+        both = FakeLocator(matches=2)
+        preferred = locator_mock(count=1, is_visible=True)
+
+        mock_element.locator.side_effect = [both, preferred]
+
+        assert item_extractor._find_delete_link(mock_element) is preferred
+        assert mock_element.locator.call_args_list[1].args == (DELETE_LINK_SELECTORS[0],)
+
+    @pytest.mark.parametrize(
+        "attrs,expected_id",
+        [
+            pytest.param({"id": "item123"}, "item123", id="id"),
+            pytest.param({"data-id": "data456"}, "data456", id="data_id"),
+            pytest.param({"id": "item123", "data-id": "data456"}, "item123", id="id_first"),
+        ],
+    )
+    def test_extract_item_id_from_attributes(self, item_extractor, attrs, expected_id):
         """Test _extract_item_id from id and data-id attributes."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
-
-        # Test id attribute
-        mock_element.get_attribute.side_effect = lambda name: "item123" if name == "id" else None
-        item_id = extractor._extract_item_id(mock_element)
-        assert item_id == "item123"
-
-        # Test data-id attribute
-        mock_element.get_attribute.side_effect = (
-            lambda name: "data456" if name == "data-id" else None
-        )
-        item_id = extractor._extract_item_id(mock_element)
-        assert item_id == "data456"
-
-    def test_extract_item_id_from_href(self):
-        """Test _extract_item_id from href URL parameter."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        mock_element = Mock()
+        assert item_extractor._extract_item_id(FakeElement(attrs)) == expected_id
+
+    @pytest.mark.parametrize(
+        "query,expected_id",
+        [
+            pytest.param("?id=789", "789", id="first_param"),
+            pytest.param("?story=1&id=42", "42", id="later_param"),
+            pytest.param("?uid=5", None, id="other_param"),
+        ],
+    )
+    def test_extract_item_id_from_href(self, item_extractor, query, expected_id):
+        """Test _extract_item_id from the delete link's id URL parameter."""
+        element = FakeElement()
 
         # Mock delete link with href
-        mock_delete_link = Mock()
-        mock_delete_link.get_attribute.return_value = (
-            "https://mbasic.facebook.com/delete.php?id=789"
-        )
-        mock_element.get_attribute.return_value = None
-        mock_element.locator.return_value.first.count.return_value = 1
-        mock_element.locator.return_value.first.is_visible.return_value = True
-
-        with patch.object(extractor, "_find_delete_link", return_value=mock_delete_link):
-            item_id = extractor._extract_item_id(mock_element)
-            assert item_id == "789"
-
-    def test_is_deletable_reaction(self):
-        """Test _is_deletable for reaction (no delete link needed)."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        item = {"type": "reaction"}  # No delete_link
-        assert extractor._is_deletable(item) is True
-
-    def test_is_deletable_requires_link(self):
-        """Test _is_deletable requires delete link for non-reactions."""
-        extractor = ItemExtractor(datetime(2021, 1, 1))
-        # Post without delete link
-        item = {"type": "post"}
-        assert extractor._is_deletable(item) is False
-
-        # Post with delete link
-        item = {"type": "post", "delete_link": Mock()}
-        assert extractor._is_deletable(item) is True
-
-        # No type
-        item = {}
-        assert extractor._is_deletable(item) is False
+        mock_delete_link = locator_mock(get_attribute=f"{DELETE_URL}{query}")
+
+        with patch.object(item_extractor, "_find_delete_link", return_value=mock_delete_link):
+            item_id = item_extractor._extract_item_id(element)
+            assert item_id == expected_id
+
+    @pytest.mark.parametrize(
+        "item,expected",
+        [
+            pytest.param({"type": "reaction"}, True, id="reaction_without_link"),
+            pytest.param({"type": "post"}, False, id="post_without_link"),
+            pytest.param({"type": "post", "delete_link": None}, False, id="post_with_none_link"),
+            pytest.param({"type": "post", "delete_link": FakeLocator(matches=1)}, True, id="post"),
+            pytest.param({"delete_link": FakeLocator(matches=1)}, False, id="no_type"),
+        ],
+    )
+    def test_is_deletable(self, item_extractor, item, expected):
+        """Test _is_deletable needs a type, and a delete link unless the item is a reaction."""
+        assert item_extractor._is_deletable(item) is expected
 
 
-@pytest.mark.unit
 class TestDeletionEngine:
     """Test DeletionEngine."""
 
-    def test_init(self):
-        """Test DeletionEngine initialization."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+    @pytest.fixture
+    def engine(self, mock_page):
+        """DeletionEngine on mock_page with the default handlers."""
+        return DeletionEngine(mock_page)
 
+    def test_init(self, engine, mock_page):
+        """Test DeletionEngine initialization."""
         assert engine.page == mock_page
         assert engine.handlers is not None
         assert len(engine.handlers) > 0
         assert engine.item_extractor is not None
 
-    def test_select_handler_post(self):
-        """Test _select_handler selects post handler."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+    @pytest.mark.parametrize(
+        "item_type,expected_cls",
+        [
+            pytest.param("post", PostDeletionHandler, id="post"),
+            pytest.param("comment", CommentDeletionHandler, id="comment"),
+            pytest.param("reaction", ReactionRemovalHandler, id="reaction"),
+        ],
+    )
+    def test_select_handler(self, engine, item_type, expected_cls):
+        """Test _select_handler picks the default handler for each item type."""
+        assert isinstance(engine._select_handler({"type": item_type}), expected_cls)
+
+    def test_select_handler_no_match(self, engine):
+        """Test _select_handler returns None for unknown type."""
+        assert engine._select_handler({"type": "unknown"}) is None
 
-        item = {"type": "post"}
-        handler = engine._select_handler(item)
+    def test_select_handler_dispatches_on_type(self, engine, mock_handler):
+        """Test typed handlers are found by item type without consulting later untyped ones."""
+        post_handler = PostDeletionHandler()
+        engine.handlers = [post_handler, mock_handler]
 
-        assert handler is not None
-        assert isinstance(handler, PostDeletionHandler)
+        assert engine._select_handler({"type": "post"}) is post_handler
+        mock_handler.can_handle.assert_not_called()
 
-    def test_select_handler_comment(self):
-        """Test _select_handler selects comment handler."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        # Types without a typed handler fall back to can_handle()
+        assert engine._select_handler({"type": "unknown"}) is mock_handler
+        mock_handler.can_handle.assert_called_once_with({"type": "unknown"})
 
-        item = {"type": "comment"}
-        handler = engine._select_handler(item)
+    def test_select_handler_keeps_untyped_priority(self, engine, mock_handler):
+        """Test an untyped handler listed before a typed one is tried first."""
+        post_handler = PostDeletionHandler()
+        engine.handlers = [mock_handler, post_handler]
 
-        assert handler is not None
-        assert isinstance(handler, CommentDeletionHandler)
+        assert engine._select_handler({"type": "post"}) is mock_handler
 
-    def test_select_handler_reaction(self):
-        """Test _select_handler selects reaction handler."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        # The typed handler still wins when the earlier one declines
+        mock_handler.can_handle.return_value = False
+        assert engine._select_handler({"type": "post"}) is post_handler
 
-        item = {"type": "reaction"}
-        handler = engine._select_handler(item)
+    def test_select_handler_asks_narrowing_subclass(self, engine):
+        """Test a subclass that narrows can_handle() is not picked on inherited types."""
 
-        assert handler is not None
-        assert isinstance(handler, ReactionRemovalHandler)
+        class PhotoPostHandler(PostDeletionHandler):
+            def can_handle(self, item):
+                return super().can_handle(item) and item.get("kind") == "photo"
 
-    def test_select_handler_no_match(self):
-        """Test _select_handler returns None for unknown type."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        photo_handler = PhotoPostHandler()
+        post_handler = PostDeletionHandler()
+        engine.handlers = [photo_handler, post_handler]
 
-        item = {"type": "unknown"}
-        handler = engine._select_handler(item)
+        assert engine._select_handler({"type": "post", "kind": "text"}) is post_handler
+        assert engine._select_handler({"type": "post", "kind": "photo"}) is photo_handler
 
-        assert handler is None
+    def test_handlers_are_immutable(self, engine):
+        """Test engine.handlers is a tuple, so in-place edits cannot bypass dispatch."""
+        engine.handlers = [CommentDeletionHandler()]
 
-    def test_delete_item_success(self):
-        """Test delete_item successfully deletes item."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        assert isinstance(engine.handlers, tuple)
+
+    def test_handlers_reassignment_rebuilds_dispatch(self, engine):
+        """Test assigning engine.handlers replaces the type dispatch table."""
+        engine.handlers = [CommentDeletionHandler()]
+
+        assert engine._select_handler({"type": "post"}) is None
+        assert isinstance(engine._select_handler({"type": "comment"}), CommentDeletionHandler)
 
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
+    def test_delete_item_success(self, engine, mock_page, mock_handler):
+        """Test delete_item successfully deletes item."""
         mock_handler.delete.return_value = (True, "Success")
         engine.handlers = [mock_handler]
 
@@ -905,167 +638,142 @@ class TestDeletionEngine:
         assert message == "Success"
         mock_handler.delete.assert_called_once_with(mock_page, item)
 
-    def test_process_page_no_items(self):
+    def test_process_page_no_items(self, engine):
         """Test process_page with no items."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
-        with patch.object(engine.item_extractor, "extract_items", return_value=[]):
-            stats = engine.process_page()
+        engine.item_extractor.extract_items = Mock(return_value=[])
+        stats = engine.process_page()
 
-            assert stats["deleted"] == 0
-            assert stats["failed"] == 0
-            assert stats["skipped"] == 0
+        assert stats["deleted"] == 0
+        assert stats["failed"] == 0
+        assert stats["skipped"] == 0
 
-    def test_process_page_with_items(self):
+    def test_process_page_with_items(self, engine, mock_handler):
         """Test process_page with items found."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         # Mock items
         mock_item1 = {"type": "post", "date_string": "2020-01-01", "item_id": "1"}
         mock_item2 = {"type": "comment", "date_string": "2020-01-02", "item_id": "2"}
 
         # Mock handler
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
         mock_handler.delete.return_value = (True, "Success")
         engine.handlers = [mock_handler]
 
         # Mock item extractor
-        with patch.object(
-            engine.item_extractor, "extract_items", return_value=[mock_item1, mock_item2]
-        ):
-            # Mock rate limiter and block manager
-            engine.rate_limiter.wait_before_action = Mock(return_value=True)
-            engine.block_manager.should_continue = Mock(return_value=True)
-            engine.error_detector.check_for_errors = Mock(return_value=(False, None))
-
-            # Mock state manager
-            engine.state_manager.get_state = Mock(
-                return_value={
-                    "total_deleted": 0,
-                    "deleted_today": 0,
-                    "errors_encountered": 0,
-                    "block_detected": False,
-                    "block_count": 0,
-                }
-            )
-            engine.state_manager.save_state = Mock()
-
-            # Mock delete_item to return success
-            with patch.object(engine, "delete_item", return_value=(True, "Success")):
-                stats = engine.process_page()
-
-                assert stats["deleted"] == 2
-                assert stats["failed"] == 0
-                assert len(stats["errors"]) == 0
-
-    def test_process_page_block_detected(self):
-        """Test process_page stops when block detected."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        engine.item_extractor.extract_items = Mock(return_value=[mock_item1, mock_item2])
+        # Mock rate limiter and block manager
+        engine.rate_limiter.wait_before_action = Mock(return_value=True)
+        engine.block_manager.should_continue = Mock(return_value=True)
+        engine.error_detector.check_for_errors = Mock(return_value=(False, None))
 
+        # Mock state manager
+        engine.state_manager.get_state = Mock(
+            return_value={
+                "total_deleted": 0,
+                "deleted_today": 0,
+                "errors_encountered": 0,
+                "block_detected": False,
+                "block_count": 0,
+            }
+        )
+        engine.state_manager.save_state = Mock()
+
+        # Mock delete_item to return success
+        engine.delete_item = Mock(return_value=(True, "Success"))
+        stats = engine.process_page()
+
+        assert stats["deleted"] == 2
+        assert stats["failed"] == 0
+        assert len(stats["errors"]) == 0
+        # Progress is persisted once per page, not once per item
+        engine.state_manager.save_state.assert_called_once()
+
+    def test_process_page_block_detected(self, engine):
+        """Test process_page stops when block detected."""
         mock_item = {"type": "post", "date_string": "2020-01-01", "item_id": "1"}
 
-        with patch.object(engine.item_extractor, "extract_items", return_value=[mock_item]):
-            engine.block_manager.should_continue = Mock(return_value=False)
+        engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        engine.block_manager.should_continue = Mock(return_value=False)
 
-            stats = engine.process_page()
+        stats = engine.process_page()
 
-            assert stats["deleted"] == 0
-            assert len(stats["errors"]) == 1
-            assert "block" in stats["errors"][0]["error"].lower()
+        assert stats["deleted"] == 0
+        assert len(stats["errors"]) == 1
+        assert "block" in stats["errors"][0]["error"].lower()
 
-    def test_process_page_rate_limit_exceeded(self):
+    def test_process_page_rate_limit_exceeded(self, engine):
         """Test process_page stops when rate limit exceeded."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         mock_item = {"type": "post", "date_string": "2020-01-01", "item_id": "1"}
 
-        with patch.object(engine.item_extractor, "extract_items", return_value=[mock_item]):
-            engine.block_manager.should_continue = Mock(return_value=True)
-            engine.rate_limiter.wait_before_action = Mock(return_value=False)
+        engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        engine.block_manager.should_continue = Mock(return_value=True)
+        engine.rate_limiter.wait_before_action = Mock(return_value=False)
 
-            stats = engine.process_page()
+        stats = engine.process_page()
 
-            assert stats["deleted"] == 0
-            assert len(stats["errors"]) == 1
-            assert "rate limit" in stats["errors"][0]["error"].lower()
+        assert stats["deleted"] == 0
+        assert len(stats["errors"]) == 1
+        assert "rate limit" in stats["errors"][0]["error"].lower()
 
-    def test_process_page_error_detection(self):
+    def test_process_page_error_detection(self, engine):
         """Test process_page detects errors after deletion."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         mock_item = {"type": "post", "date_string": "2020-01-01", "item_id": "1"}
 
-        with patch.object(engine.item_extractor, "extract_items", return_value=[mock_item]):
-            engine.block_manager.should_continue = Mock(return_value=True)
-            engine.rate_limiter.wait_before_action = Mock(return_value=True)
-            engine.error_detector.check_for_errors = Mock(return_value=(True, "Action Blocked"))
-            engine.block_manager.check_and_handle_block = Mock(return_value=True)
-            engine.block_manager.apply_backoff = Mock()
-
-            # Mock state manager
-            engine.state_manager.get_state = Mock(
-                return_value={
-                    "total_deleted": 0,
-                    "deleted_today": 0,
-                    "errors_encountered": 0,
-                    "block_detected": False,
-                    "block_count": 0,
-                }
-            )
-            engine.state_manager.save_state = Mock()
-
-            with patch.object(engine, "delete_item", return_value=(True, "Success")):
-                stats = engine.process_page()
-
-                assert len(stats["errors"]) == 1
-                assert "block" in stats["errors"][0]["error"].lower()
-                engine.block_manager.apply_backoff.assert_called_once()
-
-    def test_process_page_failed_deletions(self):
-        """Test process_page tracks failed deletions."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        engine.block_manager.should_continue = Mock(return_value=True)
+        engine.rate_limiter.wait_before_action = Mock(return_value=True)
+        engine.error_detector.check_for_errors = Mock(return_value=(True, "Action Blocked"))
+        engine.block_manager.check_and_handle_block = Mock(return_value=True)
+        engine.block_manager.apply_backoff = Mock()
+
+        # Mock state manager
+        engine.state_manager.get_state = Mock(
+            return_value={
+                "total_deleted": 0,
+                "deleted_today": 0,
+                "errors_encountered": 0,
+                "block_detected": False,
+                "block_count": 0,
+            }
+        )
+        engine.state_manager.save_state = Mock()
+
+        engine.delete_item = Mock(return_value=(True, "Success"))
+        stats = engine.process_page()
 
+        assert len(stats["errors"]) == 1
+        assert "block" in stats["errors"][0]["error"].lower()
+        engine.block_manager.apply_backoff.assert_called_once()
+
+    def test_process_page_failed_deletions(self, engine):
+        """Test process_page tracks failed deletions."""
         mock_item = {"type": "post", "date_string": "2020-01-01", "item_id": "1"}
 
-        with patch.object(engine.item_extractor, "extract_items", return_value=[mock_item]):
-            engine.block_manager.should_continue = Mock(return_value=True)
-            engine.rate_limiter.wait_before_action = Mock(return_value=True)
-            engine.error_detector.check_for_errors = Mock(return_value=(False, None))
-
-            # Mock state manager
-            engine.state_manager.get_state = Mock(
-                return_value={
-                    "total_deleted": 0,
-                    "deleted_today": 0,
-                    "errors_encountered": 0,
-                    "block_detected": False,
-                    "block_count": 0,
-                }
-            )
-            engine.state_manager.save_state = Mock()
-
-            with patch.object(engine, "delete_item", return_value=(False, "Deletion failed")):
-                stats = engine.process_page()
-
-                assert stats["deleted"] == 0
-                assert stats["failed"] == 1
-                assert len(stats["errors"]) == 1
-                assert "failed" in stats["errors"][0]["error"].lower()
-
-    def test_delete_item_retry_logic(self):
-        """Test delete_item retries on transient errors."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        engine.item_extractor.extract_items = Mock(return_value=[mock_item])
+        engine.block_manager.should_continue = Mock(return_value=True)
+        engine.rate_limiter.wait_before_action = Mock(return_value=True)
+        engine.error_detector.check_for_errors = Mock(return_value=(False, None))
 
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
+        # Mock state manager
+        engine.state_manager.get_state = Mock(
+            return_value={
+                "total_deleted": 0,
+                "deleted_today": 0,
+                "errors_encountered": 0,
+                "block_detected": False,
+                "block_count": 0,
+            }
+        )
+        engine.state_manager.save_state = Mock()
+
+        engine.delete_item = Mock(return_value=(False, "Deletion failed"))
+        stats = engine.process_page()
+
+        assert stats["deleted"] == 0
+        assert stats["failed"] == 1
+        assert len(stats["errors"]) == 1
+        assert "failed" in stats["errors"][0]["error"].lower()
+
+    def test_delete_item_retry_logic(self, engine, mock_page, mock_handler):
+        """Test delete_item retries on transient errors."""
         # First two calls fail with timeout, third succeeds
         mock_handler.delete.side_effect = [
             (False, "Timeout error"),
@@ -1081,13 +789,8 @@ class TestDeletionEngine:
         assert message == "Success"
         assert mock_handler.delete.call_count == 3
 
-    def test_delete_item_max_retries(self):
+    def test_delete_item_max_retries(self, engine, mock_page, mock_handler):
         """Test delete_item stops after max retries."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
         mock_handler.delete.return_value = (False, "Timeout error")
         engine.handlers = [mock_handler]
 
@@ -1098,13 +801,8 @@ class TestDeletionEngine:
         assert "retries" in message.lower() or "timeout" in message.lower()
         assert mock_handler.delete.call_count == 3
 
-    def test_delete_item_non_transient_error(self):
+    def test_delete_item_non_transient_error(self, engine, mock_page, mock_handler):
         """Test delete_item doesn't retry on non-transient errors."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
         mock_handler.delete.return_value = (False, "Permission denied")
         engine.handlers = [mock_handler]
 
@@ -1115,15 +813,28 @@ class TestDeletionEngine:
         assert "permission" in message.lower()
         assert mock_handler.delete.call_count == 1  # No retry
 
-    def test_delete_item_playwright_timeout(self):
-        """Test delete_item handles PlaywrightTimeoutError."""
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    @pytest.mark.parametrize(
+        "message,expected_calls",
+        [
+            pytest.param("Navigation TIMEOUT", 3, id="timeout_any_case"),
+            pytest.param("Network unreachable", 3, id="network"),
+            pytest.param("Delete link not found", 1, id="not_transient"),
+        ],
+    )
+    def test_delete_item_transient_messages(
+        self, engine, mock_page, mock_handler, message, expected_calls
+    ):
+        """Test only timeout and network failure messages are retried."""
+        mock_handler.delete.return_value = (False, message)
+        engine.handlers = [mock_handler]
 
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+        success, _ = engine.delete_item(mock_page, {"type": "post"}, max_retries=3)
 
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
+        assert success is False
+        assert mock_handler.delete.call_count == expected_calls
+
+    def test_delete_item_playwright_timeout(self, engine, mock_page, mock_handler):
+        """Test delete_item handles PlaywrightTimeoutError."""
         mock_handler.delete.side_effect = PlaywrightTimeoutError("Timeout")
         engine.handlers = [mock_handler]
 
@@ -1134,11 +845,8 @@ class TestDeletionEngine:
         assert "timeout" in message.lower()
         assert mock_handler.delete.call_count == 2  # Retried once
 
-    def test_delete_item_handler_not_found(self):
+    def test_delete_item_handler_not_found(self, engine, mock_page):
         """Test delete_item when no handler matches."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         # Empty handlers list
         engine.handlers = []
 
@@ -1148,13 +856,8 @@ class TestDeletionEngine:
         assert success is False
         assert "no handler" in message.lower()
 
-    def test_delete_item_exception_handling(self):
+    def test_delete_item_exception_handling(self, engine, mock_page, mock_handler):
         """Test delete_item handles general exceptions."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
-        mock_handler = Mock()
-        mock_handler.can_handle.return_value = True
         mock_handler.delete.side_effect = ValueError("Unexpected error")
         engine.handlers = [mock_handler]
 
@@ -1165,16 +868,12 @@ class TestDeletionEngine:
         assert "unexpected" in message.lower()
         assert mock_handler.delete.call_count == 1  # No retry for non-transient errors
 
-    def test_select_handler_exception_in_can_handle(self):
+    def test_select_handler_exception_in_can_handle(self, engine, mock_handler_factory):
         """Test _select_handler continues when handler raises exception."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         # First handler raises exception, second succeeds
-        mock_handler1 = Mock()
+        mock_handler1 = mock_handler_factory()
         mock_handler1.can_handle.side_effect = ValueError("Error in can_handle")
-        mock_handler2 = Mock()
-        mock_handler2.can_handle.return_value = True
+        mock_handler2 = mock_handler_factory()
         engine.handlers = [mock_handler1, mock_handler2]
 
         item = {"type": "post"}
@@ -1184,11 +883,8 @@ class TestDeletionEngine:
         assert mock_handler1.can_handle.called
         assert mock_handler2.can_handle.called
 
-    def test_update_progress_state(self):
+    def test_update_progress_state(self, engine):
         """Test _update_progress_state updates state correctly."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
-
         # Mock state manager
         mock_state = {
             "total_deleted": 10,
@@ -1212,11 +908,24 @@ class TestDeletionEngine:
         assert saved_state["deleted_today"] == 8  # 5 + 3
         assert saved_state["errors_encountered"] == 3  # 2 + 1
 
-    def test_update_progress_state_failure(self):
-        """Test _update_progress_state doesn't fail operation on error."""
-        mock_page = Mock()
-        engine = DeletionEngine(mock_page)
+    def test_update_progress_state_reuses_loaded_state(self, mock_page, tmp_path):
+        """Test per-page updates mutate the state loaded once, not a fresh dict."""
+        state_manager = StateManager(tmp_path / "progress.json")
+        state_manager.load_state = Mock(wraps=state_manager.load_state)
+        state_manager.save_state = Mock()
+        engine = DeletionEngine(mock_page, state_manager=state_manager)
+
+        engine._update_progress_state({"deleted": 2, "failed": 0, "errors": []})
+        engine._update_progress_state({"deleted": 3, "failed": 1, "errors": [{"error": "x"}]})
 
+        state_manager.load_state.assert_called_once()
+        first_saved, second_saved = (c.args[0] for c in state_manager.save_state.call_args_list)
+        assert first_saved is second_saved is state_manager.get_state()
+        assert second_saved["total_deleted"] == 5
+        assert second_saved["errors_encountered"] == 1
+
+    def test_update_progress_state_failure(self, engine):
+        """Test _update_progress_state doesn't fail operation on error."""
         # Mock state manager to raise exception
         engine.state_manager.get_state = Mock(side_effect=ValueError("State error"))
         engine.state_manager.save_state = Mock()
@@ -1225,9 +934,8 @@ class TestDeletionEngine:
         # Should not raise exception
         engine._update_progress_state(stats)
 
-    def test_init_with_custom_components(self):
+    def test_init_with_custom_components(self, mock_page):
         """Test DeletionEngine initialization with custom components."""
-        mock_page = Mock()
         mock_rate_limiter = Mock()
         mock_error_detector = Mock()
         mock_block_manager = Mock()
@@ -1246,15 +954,14 @@ class TestDeletionEngine:
 
         assert engine.page == mock_page
         assert engine.target_date == datetime(2020, 1, 1)
-        assert engine.handlers == mock_handlers
+        assert engine.handlers == tuple(mock_handlers)
         assert engine.rate_limiter == mock_rate_limiter
         assert engine.error_detector == mock_error_detector
         assert engine.block_manager == mock_block_manager
         assert engine.state_manager == mock_state_manager
 
-    def test_init_with_block_detected(self):
+    def test_init_with_block_detected(self, mock_page):
         """Test DeletionEngine applies backoff when block detected."""
-        mock_page = Mock()
         mock_block_manager = Mock()
         mock_block_manager.block_detected = True
         mock_rate_limiter = Mock()
@@ -1265,7 +972,6 @@ class TestDeletionEngine:
         mock_block_manager.apply_backoff.assert_called_once_with(mock_rate_limiter)
 
 
-@pytest.mark.unit
 class TestHandlerRegistry:
     """Test handler registry."""
 
@@ -1282,6 +988,21 @@ class TestHandlerRegistry:
         assert "CommentDeletionHandler" in handler_types
         assert "ReactionRemovalHandler" in handler_types
 
+    @pytest.mark.parametrize(
+        "handler_cls,item_type,expected",
+        [
+            (PostDeletionHandler, "post", True),
+            (PostDeletionHandler, "comment", False),
+            (CommentDeletionHandler, "comment", True),
+            (CommentDeletionHandler, "post", False),
+            (ReactionRemovalHandler, "reaction", True),
+            (ReactionRemovalHandler, "post", False),
+        ],
+    )
+    def test_can_handle(self, registered_handlers, handler_cls, item_type, expected):
+        """Test each registered handler claims only its own item type."""
+        assert registered_handlers[handler_cls].can_handle({"type": item_type}) is expected
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,10 +4,38 @@ Cookie-related test fixtures.
 Provides various cookie data structures and cookie file fixtures for testing.
 """
 import json
-from pathlib import Path
+from collections import namedtuple
 
 import pytest
 
+Cookie = namedtuple("Cookie", "name value domain path")
+
+# Built once at import; fixtures expand these into fresh Playwright-format dicts
+VALID_COOKIES = (
+    Cookie("c_user", "123456789", ".facebook.com", "/"),
+    Cookie("xs", "abc123def456", ".facebook.com", "/"),  # pragma: allowlist secret
+    Cookie("datr", "xyz789", ".facebook.com", "/"),
+)
+
+EXPIRED_COOKIES = (
+    Cookie("c_user", "expired123", ".facebook.com", "/"),
+    Cookie("xs", "expired456", ".facebook.com", "/"),  # pragma: allowlist secret
+    Cookie("datr", "expired789", ".facebook.com", "/"),
+)
+
+
+def storage_state(cookies):
+    """
+    Build cookie data in Playwright storage state format.
+
+    Args:
+        cookies: Iterable of Cookie tuples
+
+    Returns:
+        Dictionary with a fresh "cookies" list of dicts and empty "origins"
+    """
+    return {"cookies": [cookie._asdict() for cookie in cookies], "origins": []}
+
 
 @pytest.fixture
 def valid_cookie_data_full():
@@ -22,19 +50,7 @@ def valid_cookie_data_full():
 
     Includes: c_user, xs, datr (all required cookies).
     """
-    return {
-        "cookies": [
-            {"name": "c_user", "value": "123456789", "domain": ".facebook.com", "path": "/"},
-            {
-                "name": "xs",
-                "value": "abc123def456",  # pragma: allowlist secret
-                "domain": ".facebook.com",
-                "path": "/",
-            },
-            {"name": "datr", "value": "xyz789", "domain": ".facebook.com", "path": "/"},
-        ],
-        "origins": [],
-    }
+    return storage_state(VALID_COOKIES)
 
 
 @pytest.fixture
@@ -44,19 +60,7 @@ def minimal_cookie_data():
 
     Useful for testing scenarios where minimal valid data is needed.
     """
-    return {
-        "cookies": [
-            {"name": "c_user", "value": "123456789", "domain": ".facebook.com", "path": "/"},
-            {
-                "name": "xs",
-                "value": "abc123def456",  # pragma: allowlist secret
-                "domain": ".facebook.com",
-                "path": "/",
-            },
-            {"name": "datr", "value": "xyz789", "domain": ".facebook.com", "path": "/"},
-        ],
-        "origins": [],
-    }
+    return storage_state(VALID_COOKIES)
 
 
 @pytest.fixture
@@ -66,19 +70,7 @@ def expired_cookie_data():
 
     Useful for testing cookie validation and expiration scenarios.
     """
-    return {
-        "cookies": [
-            {"name": "c_user", "value": "expired123", "domain": ".facebook.com", "path": "/"},
-            {
-                "name": "xs",
-                "value": "expired456",  # pragma: allowlist secret
-                "domain": ".facebook.com",
-                "path": "/",
-            },
-            {"name": "datr", "value": "expired789", "domain": ".facebook.com", "path": "/"},
-        ],
-        "origins": [],
-    }
+    return storage_state(EXPIRED_COOKIES)
 
 
 @pytest.fixture
@@ -134,6 +126,19 @@ def invalid_cookie_data_wrong_structure():
     }
 
 
+@pytest.fixture
+def invalid_cookie_data_not_list():
+    """
+    Invalid cookie data where "cookies" is not a list.
+
+    Useful for testing validation of the top-level cookie container type.
+    """
+    return {
+        "cookies": "not a list",
+        "origins": [],
+    }
+
+
 @pytest.fixture
 def invalid_cookie_data_empty():
     """
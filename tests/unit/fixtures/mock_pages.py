@@ -2,13 +2,147 @@
 Mock Page objects for different content scenarios.
 
 Provides specialized mock Playwright Page objects configured for specific
-testing scenarios (Activity Log, error pages, confirmation pages, etc.).
+testing scenarios (Activity Log, error pages, confirmation pages, etc.), plus
+FakePage/FakeLocator/FakeElement: plain slotted stand-ins for tests that
+only need a URL, element attributes or text, a locator match count and a
+record of navigation calls.
 """
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 
+class FakeLocator:
+    """Minimal Playwright Locator stand-in that matches `matches` elements."""
+
+    __slots__ = ("matches", "visible", "clicks")
+
+    def __init__(self, matches=0, visible=True):
+        self.matches = matches
+        self.visible = visible
+        self.clicks = 0
+
+    @property
+    def first(self):
+        """Return the locator itself; all matches behave identically."""
+        return self
+
+    def count(self):
+        return self.matches
+
+    def is_visible(self):
+        return self.visible
+
+    def click(self, **kwargs):
+        self.clicks += 1
+
+
+class FakeElement:
+    """
+    Minimal stand-in for the Locator of one Activity Log item.
+
+    get_attribute() reads from `attrs`, text_content() returns `text`, and
+    every selector resolves to the same `locator_result`. Selectors passed to
+    locator() are recorded in `selectors`.
+    """
+
+    __slots__ = ("attrs", "text", "locator_result", "selectors")
+
+    def __init__(self, attrs=None, text="", locator_result=None):
+        self.attrs = attrs or {}
+        self.text = text
+        self.locator_result = locator_result or FakeLocator()
+        self.selectors = []
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def text_content(self):
+        return self.text
+
+    def locator(self, selector):
+        self.selectors.append(selector)
+        return self.locator_result
+
+
+# Locator methods the handler and extractor tests touch
+_LOCATOR_SPEC = (
+    "all",
+    "click",
+    "count",
+    "first",
+    "get_attribute",
+    "is_visible",
+    "locator",
+    "text_content",
+)
+
+
+def locator_mock(**return_values):
+    """
+    Mock restricted to the Locator methods in _LOCATOR_SPEC.
+
+    Cheaper than an autospec'd Locator, but still rejects misspelled
+    attributes. `first` returns the mock itself, like FakeLocator.
+
+    Args:
+        **return_values: Return value for each named method, e.g. count=1
+
+    Returns:
+        Mock built with spec_set=_LOCATOR_SPEC
+    """
+    locator = Mock(spec_set=_LOCATOR_SPEC)
+    locator.first = locator
+    for name, value in return_values.items():
+        getattr(locator, name).return_value = value
+    return locator
+
+
+class FakePage:
+    """
+    Minimal Playwright Page stand-in.
+
+    Every selector resolves to the same `locator_result`. Navigation calls are
+    recorded in `goto_calls` and `load_states`; set `goto_error` to make
+    goto() raise.
+    """
+
+    __slots__ = ("url", "html", "locator_result", "goto_calls", "goto_error", "load_states")
+
+    def __init__(self, url="https://mbasic.facebook.com/allactivity", html="<html></html>"):
+        self.url = url
+        self.html = html
+        self.locator_result = FakeLocator()
+        self.goto_calls = []
+        self.goto_error = None
+        self.load_states = []
+
+    def locator(self, selector):
+        return self.locator_result
+
+    def content(self):
+        return self.html
+
+    def goto(self, url, **kwargs):
+        self.goto_calls.append(url)
+        if self.goto_error is not None:
+            raise self.goto_error
+
+    def wait_for_load_state(self, state="load", **kwargs):
+        self.load_states.append(state)
+
+
+@pytest.fixture
+def fake_page():
+    """
+    Create a FakePage whose locators match nothing.
+
+    Returns:
+        FakePage at the Activity Log URL
+    """
+    return FakePage()
+
+
 @pytest.fixture
 def mock_page_activity_log():
     """
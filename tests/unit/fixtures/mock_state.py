@@ -0,0 +1,109 @@
+"""
+State-related test fixtures.
+
+Provides a StateManager double that keeps saved state in memory, for tests
+that exercise resume/state flow rather than the progress file itself, and an
+in-memory storage for tests of StateManager that need no progress file.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pytest
+
+from src.utils.state_manager import StateManager
+
+
+class InMemoryStorage:
+    """FileStorage stand-in that keeps the progress document in memory."""
+
+    def __init__(self):
+        """Initialize InMemoryStorage with nothing stored."""
+        self.data: Optional[bytes] = None
+        self.writes = 0
+
+    def version(self) -> int:
+        """Return the number of writes so far (raises FileNotFoundError if empty)."""
+        self._require_data()
+        return self.writes
+
+    def read_bytes(self) -> bytes:
+        """Return the stored document (raises FileNotFoundError if empty)."""
+        return self._require_data()
+
+    def write_bytes(self, data: bytes) -> None:
+        """Replace the stored document."""
+        self.data = data
+        self.writes += 1
+
+    def unlink(self) -> None:
+        """Delete the stored document (raises FileNotFoundError if empty)."""
+        self._require_data()
+        self.data = None
+
+    def _require_data(self) -> bytes:
+        """Return the stored document, raising FileNotFoundError like a missing file."""
+        if self.data is None:
+            raise FileNotFoundError("No progress state stored")
+        return self.data
+
+
+class InMemoryStateManager(StateManager):
+    """StateManager that saves to and loads from a dict instead of the progress file."""
+
+    def __init__(self, progress_path):
+        """
+        Initialize InMemoryStateManager.
+
+        Args:
+            progress_path: Path reported as progress_path; never written
+        """
+        super().__init__(progress_path)
+        self._saved: Optional[Dict[str, Any]] = None
+
+    def save_state(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Save a copy of the state in memory (mirrors StateManager.save_state)."""
+        if state is None:
+            state = self.get_state()
+
+        state["last_updated"] = datetime.now().isoformat()
+        self._saved = state.copy()
+        self._state = state.copy()
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        """Return a copy of the last saved state, or None if nothing was saved."""
+        if self._saved is None:
+            return None
+
+        self._state = self._saved.copy()
+        return self._state
+
+    def clear_state(self) -> None:
+        """Forget the saved state (mirrors StateManager.clear_state)."""
+        self._saved = None
+        self._state = None
+
+
+@pytest.fixture
+def fast_state_manager(tmp_path):
+    """
+    Create an InMemoryStateManager for tests that don't exercise file I/O.
+
+    Args:
+        tmp_path: Pytest's temporary directory fixture
+
+    Returns:
+        InMemoryStateManager whose progress_path is never written
+    """
+    return InMemoryStateManager(tmp_path / "progress.json")
+
+
+@pytest.fixture
+def fake_storage():
+    """
+    Create an empty InMemoryStorage to pass as StateManager(storage=...).
+
+    Returns:
+        InMemoryStorage with nothing stored
+    """
+    return InMemoryStorage()
@@ -1,11 +1,13 @@
 """
 Unit tests for safety and rate limiting modules.
 """
-import time
+
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
+from freezegun import freeze_time
 
 from src.safety.block_manager import BlockManager
 from src.safety.error_detector import ErrorDetector
@@ -29,19 +31,34 @@ class TestGaussianDelays:
         delay = human_delay(mean=-10.0, std_dev=1.0, min_delay=2.0)
         assert delay == 2.0
 
-    def test_wait_before_action(self):
-        """Test wait_before_action applies delay."""
-        start = time.time()
+    def test_wait_before_action(self, no_sleep):
+        """Test wait_before_action sleeps for at least min_delay."""
         wait_before_action(mean=0.1, std_dev=0.01, min_delay=0.1)
-        elapsed = time.time() - start
-        assert elapsed >= 0.1
 
-    def test_micro_pause(self):
-        """Test micro_pause applies small delay."""
-        start = time.time()
+        assert len(no_sleep) == 1
+        assert no_sleep[-1] >= 0.1
+
+    def test_micro_pause(self, no_sleep):
+        """Test micro_pause sleeps for a duration within its bounds."""
+        micro_pause(min_pause=0.05, max_pause=0.1)
+
+        assert len(no_sleep) == 1
+        assert 0.05 <= no_sleep[-1] <= 0.1
+
+    def test_micro_pause_sleeps_drawn_value(self, no_sleep, monkeypatch):
+        """Test micro_pause draws from uniform(min, max) and sleeps exactly that long."""
+        draws = []
+
+        def fake_uniform(a, b):
+            draws.append((a, b))
+            return 0.075
+
+        monkeypatch.setattr("src.stealth.behavior.random.uniform", fake_uniform)
+
         micro_pause(min_pause=0.05, max_pause=0.1)
-        elapsed = time.time() - start
-        assert 0.05 <= elapsed <= 0.15  # Allow some overhead
+
+        assert draws == [(0.05, 0.1)]
+        assert no_sleep == [0.075]
 
 
 @pytest.mark.unit
@@ -100,43 +117,167 @@ class TestRateLimiter:
         assert limiter.deleted_count == 0
         assert len(limiter.action_times) == 0
 
+    def test_check_rate_limit_window_slides(self):
+        """Test actions stop counting against the limit once an hour has passed."""
+        limiter = RateLimiter(max_per_hour=2)
+
+        with freeze_time("2024-01-01 12:00:00") as frozen:
+            limiter.record_action()
+            limiter.record_action()
+            assert limiter.check_rate_limit() is False
+
+            frozen.tick(timedelta(minutes=59))
+            assert limiter.check_rate_limit() is False
+
+            frozen.tick(timedelta(minutes=1))
+            assert limiter.check_rate_limit() is True
+
+    def test_large_history_prunes_expired_actions(self):
+        """Test check_rate_limit drops every expired action from a long history."""
+        limiter = RateLimiter(max_per_hour=10)
+        now = datetime.now()
+        expired = [now - timedelta(hours=2, seconds=i) for i in range(limiter.max_per_hour * 10)]
+        limiter.action_times.extend(sorted(expired))
+        limiter.action_times.extend([now - timedelta(minutes=5), now])
+
+        assert limiter.check_rate_limit() is True
+        assert list(limiter.action_times) == [now - timedelta(minutes=5), now]
+        assert limiter.get_stats()["actions_last_hour"] == 2
+
+    def test_rate_limit_sliding_window_boundary(self):
+        """Test the window rolls one action at a time across the hour boundary."""
+        limiter = RateLimiter(max_per_hour=10)
+
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            for _ in range(10):
+                limiter.record_action()
+                frozen.tick(360)
+
+            # The first action is exactly an hour old and no longer counts
+            assert limiter.check_rate_limit() is True
+
+            frozen.tick(1)
+            limiter.record_action()
+            assert limiter.check_rate_limit() is False
+
+            # A fixed hourly bucket would stay full; the sliding window frees
+            # one slot as soon as the next-oldest action ages out
+            frozen.tick(359)
+            assert limiter.check_rate_limit() is True
+            assert len(limiter.action_times) == 9
+
+    def test_rate_limit_prunes_expired_history(self):
+        """Test check_rate_limit drops only the actions that left the window."""
+        limiter = RateLimiter(max_per_hour=100_000)
+
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            for _ in range(10_000):
+                limiter.record_action()
+            frozen.tick(1800)
+            limiter.record_action()
+
+            assert limiter.check_rate_limit() is True
+            assert len(limiter.action_times) == 10_001
+
+            # The first 10k actions age out together; the later one stays
+            frozen.tick(1800)
+            assert limiter.check_rate_limit() is True
+            assert len(limiter.action_times) == 1
+
+    @pytest.mark.benchmark(group="rate_limiter")
+    def test_record_action_throughput(self, benchmark):
+        """Benchmark a record_action + check_rate_limit pair against a 20k pairs/s floor."""
+        limiter = RateLimiter(max_per_hour=1_000_000)
+
+        def record_and_check():
+            limiter.record_action()
+            return limiter.check_rate_limit()
+
+        # Fixed rounds keep the default run short. A pair takes ~5us locally; the
+        # floor leaves room for slow CI runners while still failing if each check
+        # starts rescanning the 10k-entry window
+        assert benchmark.pedantic(record_and_check, rounds=1000, iterations=10) is True
+        assert benchmark.stats["mean"] < 5e-5
+
 
 @pytest.mark.unit
 class TestErrorDetector:
     """Test ErrorDetector class."""
 
-    def test_check_url_for_errors_detected(self):
+    def test_default_pattern_is_shared(self):
+        """Test instances without extra indicators reuse the class-level pattern."""
+        first = ErrorDetector()
+        second = ErrorDetector()
+        assert first._indicator_re is ErrorDetector._INDICATOR_RE
+        assert second._indicator_re is first._indicator_re
+
+    def test_additional_indicators_do_not_touch_shared_pattern(self):
+        """Test extra indicators compile a per-instance pattern."""
+        detector = ErrorDetector(additional_indicators=["Custom block"])
+        assert detector._indicator_re is not ErrorDetector._INDICATOR_RE
+        assert ErrorDetector._INDICATOR_RE.search("custom block") is None
+        assert detector._indicator_re.search("custom block") is not None
+
+    def test_check_url_for_errors_detected(self, error_detector):
         """Test check_url_for_errors detects errors in URL."""
-        detector = ErrorDetector()
-        assert detector.check_url_for_errors("https://facebook.com/error") is True
-        assert detector.check_url_for_errors("https://facebook.com/blocked") is True
+        assert error_detector.check_url_for_errors("https://facebook.com/error") is True
+        assert error_detector.check_url_for_errors("https://facebook.com/blocked") is True
 
-    def test_check_url_for_errors_not_detected(self):
+    def test_check_url_for_errors_not_detected(self, error_detector):
         """Test check_url_for_errors returns False for normal URLs."""
-        detector = ErrorDetector()
-        assert detector.check_url_for_errors("https://facebook.com/allactivity") is False
+        assert error_detector.check_url_for_errors("https://facebook.com/allactivity") is False
 
-    def test_check_for_errors_in_content(self):
+    def test_check_for_errors_in_content(self, error_detector):
         """Test check_for_errors detects errors in page content."""
-        detector = ErrorDetector()
         mock_page = Mock()
         mock_page.url = "https://facebook.com/allactivity"
         mock_page.content.return_value = "You're going too fast. Please slow down."
 
-        error_detected, error_message = detector.check_for_errors(mock_page)
+        error_detected, error_message = error_detector.check_for_errors(mock_page)
         assert error_detected is True
         assert "going too fast" in error_message.lower()
 
-    def test_check_for_errors_no_error(self):
+    def test_check_for_errors_no_error(self, error_detector):
         """Test check_for_errors returns False when no errors."""
-        detector = ErrorDetector()
         mock_page = Mock()
         mock_page.url = "https://facebook.com/allactivity"
         mock_page.content.return_value = "Welcome to Facebook"
 
-        error_detected, error_message = detector.check_for_errors(mock_page)
+        error_detected, error_message = error_detector.check_for_errors(mock_page)
         assert error_detected is False
 
+    def test_check_for_errors_case_insensitive_additional_indicator(self):
+        """Test additional indicators match any case and are reported as configured."""
+        detector = ErrorDetector(additional_indicators=["Account Locked"])
+        mock_page = Mock()
+        mock_page.url = "https://facebook.com/allactivity"
+        mock_page.content.return_value = "<p>ACCOUNT LOCKED for review</p>"
+
+        error_detected, error_message = detector.check_for_errors(mock_page)
+        assert error_detected is True
+        assert error_message == "Error message detected: 'Account Locked'"
+
+    def test_check_for_errors_reports_highest_priority_indicator(self, error_detector):
+        """Test the earliest configured indicator is reported, not the earliest in the page."""
+        mock_page = Mock()
+        mock_page.url = "https://facebook.com/allactivity"
+        mock_page.content.return_value = "Something went wrong. Action Blocked."
+
+        error_detected, error_message = error_detector.check_for_errors(mock_page)
+        assert error_detected is True
+        assert error_message == "Error message detected: 'Action Blocked'"
+
+    def test_check_for_errors_unusual_case_match_does_not_hide_indicator(self, error_detector):
+        """Test a match that lower() cannot map back to its indicator does not fail open."""
+        mock_page = Mock()
+        mock_page.url = "https://facebook.com/allactivity"
+        # U+017F (long s) matches "s" under IGNORECASE
+        mock_page.content.return_value = "Action Blocked. \u017fomething went wrong"
+
+        error_detected, error_message = error_detector.check_for_errors(mock_page)
+        assert error_detected is True
+        assert error_message == "Error message detected: 'Action Blocked'"
+
 
 @pytest.mark.unit
 class TestBlockManager:
@@ -149,28 +290,26 @@ class TestBlockManager:
         assert manager.block_detected is False
         assert manager.block_count == 0
 
-    def test_check_and_handle_block_detected(self):
+    def test_check_and_handle_block_detected(self, error_detector):
         """Test check_and_handle_block detects block."""
         manager = BlockManager()
         mock_page = Mock()
         mock_page.url = "https://facebook.com/allactivity"
         mock_page.content.return_value = "Action Blocked"
 
-        error_detector = ErrorDetector()
         block_detected = manager.check_and_handle_block(mock_page, error_detector)
 
         assert block_detected is True
         assert manager.block_detected is True
         assert manager.block_count == 1
 
-    def test_check_and_handle_block_not_detected(self):
+    def test_check_and_handle_block_not_detected(self, error_detector):
         """Test check_and_handle_block returns False when no block."""
         manager = BlockManager()
         mock_page = Mock()
         mock_page.url = "https://facebook.com/allactivity"
         mock_page.content.return_value = "Normal page content"
 
-        error_detector = ErrorDetector()
         block_detected = manager.check_and_handle_block(mock_page, error_detector)
 
         assert block_detected is False
@@ -181,35 +320,55 @@ class TestBlockManager:
         manager = BlockManager()
         assert manager.should_continue() is True
 
+    @freeze_time("2024-01-02 00:00:00")
     def test_should_continue_block_recent(self):
         """Test should_continue returns False for recent block."""
         manager = BlockManager(block_wait_hours=24)
         manager.block_detected = True
-        manager.last_block_time = datetime.now()  # Just now
+        manager.last_block_time = datetime(2024, 1, 1, 23, 0, 0)  # 1 hour ago
 
         assert manager.should_continue() is False
 
+    @freeze_time("2024-01-02 00:00:00")
     def test_should_continue_block_old(self):
         """Test should_continue returns True for old block."""
         manager = BlockManager(block_wait_hours=24)
         manager.block_detected = True
-        manager.last_block_time = datetime.now() - timedelta(hours=25)  # 25 hours ago
+        manager.last_block_time = datetime(2023, 12, 31, 23, 0, 0)  # 25 hours ago
 
         assert manager.should_continue() is True
 
+    def test_should_continue_block_wait_expires(self):
+        """Test should_continue flips exactly when block_wait_hours have passed."""
+        manager = BlockManager(block_wait_hours=24)
+        manager.block_detected = True
+        manager.last_block_time = datetime(2024, 1, 1, 0, 0, 0)
+
+        with freeze_time("2024-01-01 23:59:59"):
+            assert manager.should_continue() is False
+        with freeze_time("2024-01-02 00:00:00"):
+            assert manager.should_continue() is True
+
+    @pytest.mark.parametrize(
+        "block_count,expected",
+        [(0, (1.0, 1.0)), (1, (1.5, 1.2)), (2, (2.25, 1.2))],
+    )
+    def test_compute_multipliers(self, block_count, expected):
+        """Test compute_multipliers grows the mean factor with each block."""
+        manager = BlockManager(backoff_multiplier=1.5)
+        manager.block_count = block_count
+
+        assert manager.compute_multipliers() == expected
+
     def test_apply_backoff(self):
-        """Test apply_backoff increases delays."""
+        """Test apply_backoff scales the limiter's delays by compute_multipliers."""
         manager = BlockManager(backoff_multiplier=1.5)
         manager.block_count = 1
-
-        limiter = RateLimiter(mean_delay=5.0, std_dev=1.5)
-        old_mean = limiter.mean_delay
-        old_std_dev = limiter.std_dev
+        limiter = RateLimiter(mean_delay=4.0, std_dev=1.5)
 
         manager.apply_backoff(limiter)
 
-        assert limiter.mean_delay > old_mean
-        assert limiter.std_dev > old_std_dev
+        assert (limiter.mean_delay, limiter.std_dev) == pytest.approx((6.0, 1.8))
 
     def test_get_block_info(self):
         """Test get_block_info returns block information."""
@@ -231,10 +390,9 @@ class TestStateManager:
         manager = StateManager(progress_path)
         assert manager.progress_path == progress_path
 
-    def test_get_state_default(self, tmp_path):
-        """Test get_state returns default state when file doesn't exist."""
-        progress_path = tmp_path / "progress.json"
-        manager = StateManager(progress_path)
+    def test_get_state_default(self, fake_storage):
+        """Test get_state returns default state when nothing is stored."""
+        manager = StateManager(Path("progress.json"), storage=fake_storage)
         state = manager.get_state()
 
         assert "total_deleted" in state
@@ -242,7 +400,7 @@ class TestStateManager:
         assert state["total_deleted"] == 0
 
     def test_save_and_load_state(self, tmp_path):
-        """Test save_state and load_state."""
+        """Test save_state and load_state round-trip through the progress file."""
         progress_path = tmp_path / "progress.json"
         manager = StateManager(progress_path)
 
@@ -256,29 +414,28 @@ class TestStateManager:
         assert loaded_state is not None
         assert loaded_state["total_deleted"] == 10
 
-    def test_update_state(self, tmp_path):
-        """Test update_state updates specific fields."""
-        progress_path = tmp_path / "progress.json"
-        manager = StateManager(progress_path)
-
-        manager.update_state(total_deleted=5, errors_encountered=2)
-        state = manager.get_state()
+    def test_update_state(self, fake_storage):
+        """Test update_state updates specific fields and persists them."""
+        progress_path = Path("progress.json")
+        StateManager(progress_path, storage=fake_storage).update_state(
+            total_deleted=5, errors_encountered=2
+        )
 
+        # A fresh manager reads the fields back from storage
+        state = StateManager(progress_path, storage=fake_storage).get_state()
         assert state["total_deleted"] == 5
         assert state["errors_encountered"] == 2
 
-    def test_clear_state(self, tmp_path):
-        """Test clear_state deletes file."""
-        progress_path = tmp_path / "progress.json"
-        manager = StateManager(progress_path)
-
-        # Save state first
-        manager.save_state(manager.get_state())
-        assert progress_path.exists()
+    def test_clear_state(self, fake_storage):
+        """Test clear_state removes the stored state and drops cached state."""
+        manager = StateManager(Path("progress.json"), storage=fake_storage)
+        manager.update_state(total_deleted=5)
+        assert fake_storage.data is not None
 
-        # Clear state
         manager.clear_state()
-        assert not progress_path.exists()
+        assert fake_storage.data is None
+        assert manager.load_state() is None
+        assert manager.get_state()["total_deleted"] == 0
 
     def test_load_state_corrupted(self, tmp_path):
         """Test load_state handles corrupted JSON."""
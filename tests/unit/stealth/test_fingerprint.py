@@ -1,7 +1,6 @@
 """
 Unit tests for fingerprint/stealth module.
 """
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -1,26 +1,29 @@
 """
 Unit tests for traversal engine modules.
 """
+import time
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
+from freezegun import freeze_time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from src.traversal.date_parser import DateParser
+from src.traversal.date_parser import _now_for_second
 from src.traversal.pagination import PaginationHandler
 from src.traversal.traversal_engine import TraversalEngine
 from src.traversal.url_builder import URLBuilder
+from tests.unit.fixtures.mock_pages import FakeLocator
 
 
 @pytest.mark.unit
 class TestURLBuilder:
     """Test URLBuilder class."""
 
-    def test_init_valid_username(self):
+    def test_init_valid_username(self, url_builder):
         """Test initialization with valid username."""
-        builder = URLBuilder("testuser")
-        assert builder.username == "testuser"
-        assert "testuser" in builder.base_url
+        assert url_builder.username == "testuser"
+        assert "testuser" in url_builder.base_url
 
     def test_init_empty_username(self):
         """Test initialization with empty username raises error."""
@@ -28,258 +31,215 @@ class TestURLBuilder:
             URLBuilder("")
         assert "empty" in str(exc_info.value).lower()
 
-    def test_build_year_url(self):
-        """Test building URL for specific year."""
-        builder = URLBuilder("testuser")
-        url = builder.build_year_url(2020)
-
-        assert "mbasic.facebook.com" in url
-        assert "testuser" in url
-        assert "allactivity" in url
-        assert "year_2020" in url
-
-    def test_build_month_url(self):
-        """Test building URL with year and month."""
-        builder = URLBuilder("testuser")
-        url = builder.build_month_url(2020, 11)
-
-        assert "year_2020" in url
-        assert "month=11" in url
-
-    def test_build_category_url(self):
-        """Test building URL with category filter."""
-        builder = URLBuilder("testuser")
-        url = builder.build_category_url(2020, "cluster_11")
-
-        assert "year_2020" in url
-        assert "cluster_11" in url
-
-    def test_build_activity_log_url_all_filters(self):
-        """Test building URL with all filters."""
-        builder = URLBuilder("testuser")
-        url = builder.build_activity_log_url(2020, month=11, category="cluster_11")
-
-        assert "year_2020" in url
-        assert "month=11" in url
-        assert "cluster_11" in url
-
-    def test_validate_year_too_old(self):
-        """Test year validation with year before 2004."""
-        builder = URLBuilder("testuser")
-        with pytest.raises(ValueError) as exc_info:
-            builder.build_year_url(2000)
-        assert "2004" in str(exc_info.value)
-
-    def test_validate_year_too_new(self):
-        """Test year validation with year after 2030."""
-        builder = URLBuilder("testuser")
-        with pytest.raises(ValueError) as exc_info:
-            builder.build_year_url(2031)
-        assert "2030" in str(exc_info.value)
-
-    def test_validate_month_too_low(self):
-        """Test month validation with month < 1."""
-        builder = URLBuilder("testuser")
+    @pytest.mark.parametrize(
+        "method,args,kwargs,expected_parts",
+        [
+            pytest.param(
+                "build_year_url",
+                (2020,),
+                {},
+                ["mbasic.facebook.com", "testuser", "allactivity", "year_2020"],
+                id="year",
+            ),
+            pytest.param("build_month_url", (2020, 11), {}, ["year_2020", "month=11"], id="month"),
+            pytest.param(
+                "build_category_url",
+                (2020, "cluster_11"),
+                {},
+                ["year_2020", "cluster_11"],
+                id="category",
+            ),
+            pytest.param(
+                "build_activity_log_url",
+                (2020,),
+                {"month": 11, "category": "cluster_11"},
+                ["year_2020", "month=11", "cluster_11"],
+                id="all_filters",
+            ),
+        ],
+    )
+    def test_build_url(self, url_builder, method, args, kwargs, expected_parts):
+        """Test each builder method includes its filters in the URL."""
+        url = getattr(url_builder, method)(*args, **kwargs)
+
+        for part in expected_parts:
+            assert part in url
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_query",
+        [
+            pytest.param({}, "log_filter=year_2020", id="year"),
+            pytest.param({"month": 3}, "log_filter=year_2020&month=3", id="month"),
+            pytest.param(
+                {"category": "cluster_15"},
+                "log_filter=year_2020&log_filter=cluster_15",
+                id="category",
+            ),
+            pytest.param(
+                {"month": 3, "category": "cluster_15"},
+                "log_filter=year_2020&month=3&log_filter=cluster_15",
+                id="all_filters",
+            ),
+        ],
+    )
+    def test_build_activity_log_url_exact(self, url_builder, kwargs, expected_query):
+        """Test the full URL, including parameter order, is unchanged."""
+        url = url_builder.build_activity_log_url(2020, **kwargs)
+
+        assert url == f"https://mbasic.facebook.com/testuser/allactivity?{expected_query}"
+
+    @pytest.mark.parametrize(
+        "method,args,expected_substr",
+        [
+            pytest.param("build_year_url", (2000,), "2004", id="year_too_old"),
+            pytest.param("build_year_url", (2031,), "2030", id="year_too_new"),
+            pytest.param("build_month_url", (2020, 0), "1", id="month_too_low"),
+            pytest.param("build_month_url", (2020, 13), "12", id="month_too_high"),
+        ],
+    )
+    def test_validate_out_of_range(self, url_builder, method, args, expected_substr):
+        """Test year/month validation rejects out-of-range values."""
         with pytest.raises(ValueError) as exc_info:
-            builder.build_month_url(2020, 0)
-        assert "1" in str(exc_info.value)
-
-    def test_validate_month_too_high(self):
-        """Test month validation with month > 12."""
-        builder = URLBuilder("testuser")
-        with pytest.raises(ValueError) as exc_info:
-            builder.build_month_url(2020, 13)
-        assert "12" in str(exc_info.value)
+            getattr(url_builder, method)(*args)
+        assert expected_substr in str(exc_info.value)
 
 
 @pytest.mark.unit
 class TestDateParser:
     """Test DateParser class."""
 
-    def test_parse_today(self):
+    def test_parse_today(self, date_parser):
         """Test parsing 'today'."""
-        parser = DateParser()
-        result = parser.parse_facebook_date("today")
+        result = date_parser.parse_facebook_date("today")
 
         assert result is not None
         assert result.date() == datetime.now().date()
 
-    def test_parse_yesterday(self):
-        """Test parsing 'yesterday'."""
-        parser = DateParser()
-        result = parser.parse_facebook_date("yesterday")
-
-        assert result is not None
-        yesterday = datetime.now() - timedelta(days=1)
-        assert result.date() == yesterday.date()
-
-    def test_parse_relative_years_ago(self):
-        """Test parsing '2 years ago'."""
-        parser = DateParser()
-        reference = datetime(2024, 1, 1)
-        result = parser.parse_facebook_date("2 years ago", reference)
-
-        assert result is not None
-        # Should be approximately 2 years before reference
-        assert result.year <= 2022
-
-    def test_parse_relative_months_ago(self):
-        """Test parsing '3 months ago'."""
-        parser = DateParser()
-        reference = datetime(2024, 6, 1)
-        result = parser.parse_facebook_date("3 months ago", reference)
-
-        assert result is not None
-        # Should be approximately 3 months before reference
-        assert result.month <= 3 or result.year < 2024
-
-    def test_parse_absolute_date_with_year(self):
-        """Test parsing absolute date with year."""
-        parser = DateParser()
-        result = parser.parse_facebook_date("November 3, 2020")
-
-        assert result is not None
-        assert result.year == 2020
-        assert result.month == 11
-        assert result.day == 3
-
-    def test_parse_absolute_date_without_year(self):
-        """Test parsing absolute date without year."""
-        parser = DateParser()
-        reference = datetime(2024, 6, 1)
-        result = parser.parse_facebook_date("November 3", reference)
-
-        assert result is not None
-        assert result.month == 11
-        assert result.day == 3
-        # Should be in past relative to reference
-        assert result.year <= 2024
+    @freeze_time("2024-05-01 10:00:00")
+    def test_parse_today_caches_now(self, date_parser):
+        """Test the default reference time is computed once per second."""
+        assert _now_for_second(int(time.time())) is _now_for_second(int(time.time()))
 
-    def test_parse_date_with_time(self):
-        """Test parsing date with time component."""
-        parser = DateParser()
-        result = parser.parse_facebook_date("November 3, 2020 at 4:00pm")
+        first = date_parser.parse_facebook_date("today")
+        second = date_parser.parse_facebook_date("today")
 
-        assert result is not None
-        assert result.year == 2020
-        assert result.month == 11
-        assert result.day == 3
-        assert result.hour == 16  # 4:00 PM = 16:00
+        assert first == second == datetime(2024, 5, 1)
 
-    def test_parse_relative_with_time(self):
-        """Test parsing relative date with time."""
-        parser = DateParser()
-        reference = datetime(2024, 1, 1, 12, 0, 0)
-        result = parser.parse_facebook_date("2 years ago at 3:30pm", reference)
+    def test_parse_yesterday(self, date_parser):
+        """Test parsing 'yesterday'."""
+        result = date_parser.parse_facebook_date("yesterday")
 
         assert result is not None
-        assert result.hour == 15  # 3:30 PM = 15:30
-        assert result.minute == 30
+        yesterday = datetime.now() - timedelta(days=1)
+        assert result.date() == yesterday.date()
 
-    def test_parse_invalid_date(self):
+    @pytest.mark.parametrize(
+        "date_string,reference,expected",
+        [
+            pytest.param(
+                "2 years ago", datetime(2024, 1, 1), datetime(2022, 1, 1), id="relative_years"
+            ),
+            pytest.param(
+                "3 months ago", datetime(2024, 6, 1), datetime(2024, 3, 3), id="relative_months"
+            ),
+            pytest.param("November 3, 2020", None, datetime(2020, 11, 3), id="absolute_with_year"),
+            # No year: most recent November 3 on or before the reference
+            pytest.param(
+                "November 3", datetime(2024, 6, 1), datetime(2023, 11, 3), id="absolute_no_year"
+            ),
+            pytest.param(
+                "November 3, 2020 at 4:00pm",
+                None,
+                datetime(2020, 11, 3, 16, 0),
+                id="absolute_with_time",
+            ),
+            pytest.param(
+                "2 years ago at 3:30pm",
+                datetime(2024, 1, 1, 12, 0, 0),
+                datetime(2022, 1, 1, 15, 30),
+                id="relative_with_time",
+            ),
+        ],
+    )
+    def test_parse_facebook_date(self, date_parser, date_string, reference, expected):
+        """Test parsing relative and absolute dates, with and without times."""
+        assert date_parser.parse_facebook_date(date_string, reference) == expected
+
+    def test_parse_invalid_date(self, date_parser):
         """Test parsing invalid date string."""
-        parser = DateParser()
-        result = parser.parse_facebook_date("not a date")
+        result = date_parser.parse_facebook_date("not a date")
 
         assert result is None
 
-    def test_is_before_target_true(self):
+    def test_is_before_target_true(self, date_parser):
         """Test is_before_target with date before target."""
-        parser = DateParser()
         target = datetime(2021, 1, 1)
 
-        assert parser.is_before_target("November 3, 2020", target) is True
-        assert parser.is_before_target("2 years ago", datetime(2024, 1, 1)) is True
+        assert date_parser.is_before_target("November 3, 2020", target) is True
+        assert date_parser.is_before_target("2 years ago", datetime(2024, 1, 1)) is True
 
-    def test_is_before_target_false(self):
+    def test_is_before_target_false(self, date_parser):
         """Test is_before_target with date after target."""
-        parser = DateParser()
         target = datetime(2020, 1, 1)
 
-        assert parser.is_before_target("November 3, 2021", target) is False
+        assert date_parser.is_before_target("November 3, 2021", target) is False
 
 
 @pytest.mark.unit
 class TestPaginationHandler:
     """Test PaginationHandler class."""
 
-    def test_has_more_pages_found(self):
+    def test_has_more_pages_found(self, fake_page):
         """Test has_more_pages when link exists."""
         handler = PaginationHandler()
-        mock_page = Mock()
 
-        # Mock locator that finds a link
-        mock_locator = Mock()
-        mock_locator.count.return_value = 1
-        mock_locator.first.is_visible.return_value = True
-        mock_page.locator.return_value = mock_locator
+        # Locator that finds a visible link
+        fake_page.locator_result = FakeLocator(matches=1)
 
-        assert handler.has_more_pages(mock_page) is True
+        assert handler.has_more_pages(fake_page) is True
 
-    def test_has_more_pages_not_found(self):
+    def test_has_more_pages_not_found(self, fake_page):
         """Test has_more_pages when link doesn't exist."""
         handler = PaginationHandler()
-        mock_page = Mock()
-
-        # Mock locator that finds nothing
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
 
-        assert handler.has_more_pages(mock_page) is False
+        # fake_page locators find nothing by default
+        assert handler.has_more_pages(fake_page) is False
 
-    def test_click_see_more_success(self):
+    def test_click_see_more_success(self, fake_page):
         """Test successful click_see_more."""
         handler = PaginationHandler()
-        mock_page = Mock()
-        mock_page.url = "https://mbasic.facebook.com/test"
-
-        # Mock locator
-        mock_locator = Mock()
-        mock_locator.count.return_value = 1
-        mock_link = Mock()
-        mock_link.is_visible.return_value = True
-        mock_link.click.return_value = None
-        mock_locator.first = mock_link
-        mock_page.locator.return_value = mock_locator
-
-        # Mock wait_for_page_load
-        with patch.object(handler, "wait_for_page_load", return_value=None):
-            result = handler.click_see_more(mock_page)
-            assert result is True
-            mock_link.click.assert_called_once()
-
-    def test_click_see_more_not_found(self):
+        fake_page.url = "https://mbasic.facebook.com/test"
+        link = FakeLocator(matches=1)
+        fake_page.locator_result = link
+
+        result = handler.click_see_more(fake_page)
+        assert result is True
+        assert link.clicks == 1
+        assert fake_page.load_states == ["networkidle"]
+
+    def test_click_see_more_not_found(self, fake_page):
         """Test click_see_more when link not found."""
         handler = PaginationHandler()
-        mock_page = Mock()
-
-        # Mock locator that finds nothing
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
 
-        result = handler.click_see_more(mock_page)
+        result = handler.click_see_more(fake_page)
         assert result is False
 
-    def test_wait_for_page_load(self):
+    def test_wait_for_page_load(self, fake_page):
         """Test wait_for_page_load."""
         handler = PaginationHandler()
-        mock_page = Mock()
 
         # Should not raise exception
-        handler.wait_for_page_load(mock_page)
-        mock_page.wait_for_load_state.assert_called()
+        handler.wait_for_page_load(fake_page)
+        assert fake_page.load_states == ["networkidle"]
 
 
 @pytest.mark.unit
 class TestTraversalEngine:
     """Test TraversalEngine class."""
 
-    def test_init(self):
+    def test_init(self, fake_page):
         """Test TraversalEngine initialization."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser", target_year=2021, start_year=2020)
+        engine = TraversalEngine(fake_page, "testuser", target_year=2021, start_year=2020)
 
         assert engine.username == "testuser"
         assert engine.target_year == 2021
@@ -288,18 +248,16 @@ class TestTraversalEngine:
         assert engine.pagination_handler is not None
         assert engine.date_parser is not None
 
-    def test_traverse_page_builds_url(self):
-        """Test traverse_page builds correct URL."""
-        mock_page = Mock()
-        mock_page.goto.return_value = None
-        mock_page.url = "https://mbasic.facebook.com/test"
-        mock_page.wait_for_load_state.return_value = None
-
-        engine = TraversalEngine(mock_page, "testuser")
+    @pytest.fixture
+    def engine(self, fake_page):
+        """TraversalEngine on fake_page with page-load waits stubbed out."""
+        engine = TraversalEngine(fake_page, "testuser")
+        engine.pagination_handler.wait_for_page_load = Mock()
+        return engine
 
-        # Mock pagination handler
+    def test_traverse_page_builds_url(self, engine, fake_page):
+        """Test traverse_page builds correct URL."""
         engine.pagination_handler.has_more_pages = Mock(return_value=False)
-        engine.pagination_handler.wait_for_page_load = Mock()
 
         # Get first item from generator
         page_info = next(engine.traverse_page(2020, month=11), None)
@@ -308,20 +266,13 @@ class TestTraversalEngine:
         assert page_info["year"] == 2020
         assert page_info["month"] == 11
         assert page_info["is_pagination"] is False
-        mock_page.goto.assert_called_once()
+        assert len(fake_page.goto_calls) == 1
 
-    def test_traverse_page_handles_pagination(self):
+    def test_traverse_page_handles_pagination(self, engine):
         """Test traverse_page handles pagination."""
-        mock_page = Mock()
-        mock_page.goto.return_value = None
-        mock_page.url = "https://mbasic.facebook.com/test"
-
-        engine = TraversalEngine(mock_page, "testuser")
-
         # Mock pagination: first call returns True, second returns False
         engine.pagination_handler.has_more_pages = Mock(side_effect=[True, False])
         engine.pagination_handler.click_see_more = Mock(return_value=True)
-        engine.pagination_handler.wait_for_page_load = Mock()
 
         # Collect all pages
         pages = list(engine.traverse_page(2020, month=11))
@@ -331,11 +282,10 @@ class TestTraversalEngine:
         assert pages[1]["is_pagination"] is True
         assert pages[1]["page_number"] == 2
 
-    def test_traverse_years_multiple_years(self):
+    def test_traverse_years_multiple_years(self, fake_page):
         """Test traverse_years iterates through multiple years."""
-        mock_page = Mock()
         engine = TraversalEngine(
-            mock_page, "testuser", target_year=2021, start_year=2020, min_year=2018
+            fake_page, "testuser", target_year=2021, start_year=2020, min_year=2018
         )
 
         # Mock traverse_months to yield pages
@@ -345,7 +295,7 @@ class TestTraversalEngine:
                     {
                         "year": 2020,
                         "month": 12,
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -357,11 +307,10 @@ class TestTraversalEngine:
             # Should iterate 2020, 2019, 2018 (3 years)
             assert mock_traverse_months.call_count == 3
 
-    def test_traverse_years_resume_state(self):
+    def test_traverse_years_resume_state(self, fake_page):
         """Test traverse_years resumes from state."""
-        mock_page = Mock()
         engine = TraversalEngine(
-            mock_page, "testuser", target_year=2021, start_year=2020, min_year=2018
+            fake_page, "testuser", target_year=2021, start_year=2020, min_year=2018
         )
 
         resume_state = {"current_year": 2019, "current_month": 6}
@@ -372,7 +321,7 @@ class TestTraversalEngine:
                     {
                         "year": 2019,
                         "month": 6,
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -384,11 +333,10 @@ class TestTraversalEngine:
             # Should start from 2019 (resume year)
             assert mock_traverse_months.call_count >= 1
 
-    def test_traverse_years_exception_handling(self):
+    def test_traverse_years_exception_handling(self, fake_page):
         """Test traverse_years handles exceptions in year loop."""
-        mock_page = Mock()
         engine = TraversalEngine(
-            mock_page, "testuser", target_year=2021, start_year=2020, min_year=2018
+            fake_page, "testuser", target_year=2021, start_year=2020, min_year=2018
         )
 
         with patch.object(engine, "traverse_months") as mock_traverse_months:
@@ -400,7 +348,7 @@ class TestTraversalEngine:
                         {
                             "year": 2019,
                             "month": 12,
-                            "page": mock_page,
+                            "page": fake_page,
                             "url": "test",
                             "is_pagination": False,
                             "page_number": 1,
@@ -412,7 +360,7 @@ class TestTraversalEngine:
                         {
                             "year": 2018,
                             "month": 12,
-                            "page": mock_page,
+                            "page": fake_page,
                             "url": "test",
                             "is_pagination": False,
                             "page_number": 1,
@@ -425,10 +373,9 @@ class TestTraversalEngine:
             # Should continue after exception
             assert len(pages) == 2  # 2019 and 2018
 
-    def test_traverse_months_all_months(self):
+    def test_traverse_months_all_months(self, fake_page):
         """Test traverse_months iterates through all months."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser")
+        engine = TraversalEngine(fake_page, "testuser")
 
         with patch.object(engine, "traverse_page") as mock_traverse_page:
             mock_traverse_page.return_value = iter(
@@ -436,7 +383,7 @@ class TestTraversalEngine:
                     {
                         "year": 2020,
                         "month": 12,
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -448,10 +395,9 @@ class TestTraversalEngine:
             # Should iterate 12 months (December to January)
             assert mock_traverse_page.call_count == 12
 
-    def test_traverse_months_resume_month(self):
+    def test_traverse_months_resume_month(self, fake_page):
         """Test traverse_months resumes from specific month."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser")
+        engine = TraversalEngine(fake_page, "testuser")
 
         with patch.object(engine, "traverse_page") as mock_traverse_page:
             mock_traverse_page.return_value = iter(
@@ -459,7 +405,7 @@ class TestTraversalEngine:
                     {
                         "year": 2020,
                         "month": 6,
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -471,23 +417,18 @@ class TestTraversalEngine:
             # Should start from month 6
             assert mock_traverse_page.call_count == 6  # Months 6, 5, 4, 3, 2, 1
 
-    def test_traverse_page_timeout(self):
+    def test_traverse_page_timeout(self, fake_page):
         """Test traverse_page handles PlaywrightTimeoutError."""
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-
-        mock_page = Mock()
-        mock_page.goto.side_effect = PlaywrightTimeoutError("Timeout")
-        engine = TraversalEngine(mock_page, "testuser")
+        fake_page.goto_error = PlaywrightTimeoutError("Timeout")
+        engine = TraversalEngine(fake_page, "testuser")
 
         with pytest.raises(PlaywrightTimeoutError):
             list(engine.traverse_page(2020, month=11))
 
-    def test_traverse_page_pagination_failure(self):
+    def test_traverse_page_pagination_failure(self, fake_page):
         """Test traverse_page handles pagination failure."""
-        mock_page = Mock()
-        mock_page.goto.return_value = None
-        mock_page.url = "https://mbasic.facebook.com/test"
-        engine = TraversalEngine(mock_page, "testuser")
+        fake_page.url = "https://mbasic.facebook.com/test"
+        engine = TraversalEngine(fake_page, "testuser")
 
         engine.pagination_handler.has_more_pages = Mock(return_value=True)
         engine.pagination_handler.click_see_more = Mock(return_value=False)  # Pagination fails
@@ -497,12 +438,10 @@ class TestTraversalEngine:
         # Should only return first page when pagination fails
         assert len(pages) == 1
 
-    def test_traverse_page_with_category(self):
+    def test_traverse_page_with_category(self, fake_page):
         """Test traverse_page with category filter."""
-        mock_page = Mock()
-        mock_page.goto.return_value = None
-        mock_page.url = "https://mbasic.facebook.com/test"
-        engine = TraversalEngine(mock_page, "testuser")
+        fake_page.url = "https://mbasic.facebook.com/test"
+        engine = TraversalEngine(fake_page, "testuser")
 
         engine.pagination_handler.has_more_pages = Mock(return_value=False)
         engine.pagination_handler.wait_for_page_load = Mock()
@@ -515,20 +454,18 @@ class TestTraversalEngine:
             2020, month=11, category="cluster_11"
         )
 
-    def test_apply_resume_state_adjusts_start_year(self):
+    def test_apply_resume_state_adjusts_start_year(self, fake_page):
         """Test _apply_resume_state adjusts start_year."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser", start_year=2020)
+        engine = TraversalEngine(fake_page, "testuser", start_year=2020)
 
         resume_state = {"current_year": 2019, "current_month": 6}
         engine._apply_resume_state(resume_state)
 
         assert engine.start_year == 2019
 
-    def test_apply_resume_state_warning(self):
+    def test_apply_resume_state_warning(self, fake_page):
         """Test _apply_resume_state warns when resume year after start_year."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser", start_year=2020)
+        engine = TraversalEngine(fake_page, "testuser", start_year=2020)
 
         resume_state = {"current_year": 2021, "current_month": 6}
         original_start_year = engine.start_year
@@ -537,10 +474,22 @@ class TestTraversalEngine:
         # Should not change start_year (resume year is after start_year)
         assert engine.start_year == original_start_year
 
-    def test_traverse_by_category_specific_year_month(self):
+    @pytest.mark.parametrize(
+        "resume_state,expected",
+        [
+            pytest.param({"current_year": 2019, "current_month": 6}, 2019, id="resume_earlier"),
+            pytest.param({"current_year": 2021, "current_month": 6}, 2020, id="resume_later"),
+            pytest.param({"current_year": 2019, "current_month": None}, 2020, id="no_month"),
+            pytest.param(None, 2020, id="no_state"),
+        ],
+    )
+    def test_compute_start_year(self, resume_state, expected):
+        """Test compute_start_year applies the same rule as _apply_resume_state."""
+        assert TraversalEngine.compute_start_year(resume_state, 2020) == expected
+
+    def test_traverse_by_category_specific_year_month(self, fake_page):
         """Test traverse_by_category with specific year and month."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser")
+        engine = TraversalEngine(fake_page, "testuser")
 
         with patch.object(engine, "traverse_page") as mock_traverse_page:
             mock_traverse_page.return_value = iter(
@@ -549,7 +498,7 @@ class TestTraversalEngine:
                         "year": 2020,
                         "month": 11,
                         "category": "cluster_11",
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -561,10 +510,9 @@ class TestTraversalEngine:
             assert len(pages) == 1
             mock_traverse_page.assert_called_once_with(2020, month=11, category="cluster_11")
 
-    def test_traverse_by_category_all_years(self):
+    def test_traverse_by_category_all_years(self, fake_page):
         """Test traverse_by_category traverses all years."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser", start_year=2020, min_year=2018)
+        engine = TraversalEngine(fake_page, "testuser", start_year=2020, min_year=2018)
 
         with patch.object(engine, "traverse_page") as mock_traverse_page:
             mock_traverse_page.return_value = iter(
@@ -573,7 +521,7 @@ class TestTraversalEngine:
                         "year": 2020,
                         "month": 12,
                         "category": "cluster_11",
-                        "page": mock_page,
+                        "page": fake_page,
                         "url": "test",
                         "is_pagination": False,
                         "page_number": 1,
@@ -585,12 +533,11 @@ class TestTraversalEngine:
             # Should traverse all years and months
             assert mock_traverse_page.call_count > 0
 
-    def test_get_activity_items(self):
+    def test_get_activity_items(self, fake_page):
         """Test get_activity_items returns empty list (placeholder)."""
-        mock_page = Mock()
-        engine = TraversalEngine(mock_page, "testuser")
+        engine = TraversalEngine(fake_page, "testuser")
 
-        items = engine.get_activity_items(mock_page)
+        items = engine.get_activity_items(fake_page)
         assert items == []
 
 
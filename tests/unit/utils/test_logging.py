@@ -3,7 +3,7 @@ Tests for logging utility module.
 """
 import logging
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
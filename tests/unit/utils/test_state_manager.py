@@ -3,11 +3,11 @@ Tests for StateManager class.
 """
 import json
 from datetime import datetime
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.utils.state_manager import StateManager
+from src.utils.state_manager import FileStorage, StateManager, _loads
 
 
 @pytest.mark.unit
@@ -23,6 +23,15 @@ class TestStateManagerInit:
 
         assert progress_file.parent.exists()
 
+    def test_init_defaults_to_file_storage(self, tmp_path):
+        """Test stores state in progress_path unless another storage is given."""
+        progress_file = tmp_path / "progress.json"
+
+        manager = StateManager(progress_file)
+
+        assert isinstance(manager.storage, FileStorage)
+        assert manager.storage.path == progress_file
+
     def test_init_initializes_progress_path(self, tmp_path):
         """Test initializes with correct progress_path."""
         progress_file = tmp_path / "progress.json"
@@ -139,6 +148,25 @@ class TestStateManagerGetState:
             assert field in state, f"Missing field: {field}"
 
 
+@pytest.mark.unit
+class TestStateManagerPeek:
+    """Test StateManager.peek() method."""
+
+    def test_peek_returns_field(self, tmp_path):
+        """Test returns the current value of a state field."""
+        manager = StateManager(tmp_path / "progress.json")
+        manager.update_state(current_year=2020)
+
+        assert manager.peek("current_year") == 2020
+        assert manager.peek("total_deleted") == 0
+
+    def test_peek_missing_field_returns_none(self, tmp_path):
+        """Test returns None for fields not in state."""
+        manager = StateManager(tmp_path / "progress.json")
+
+        assert manager.peek("nonexistent") is None
+
+
 @pytest.mark.unit
 class TestStateManagerLoadState:
     """Test StateManager.load_state() method."""
@@ -184,6 +212,15 @@ class TestStateManagerLoadState:
 
         assert state is None
 
+    def test_load_state_not_utf8(self, tmp_path):
+        """Test returns None when the file is not UTF-8 text."""
+        progress_file = tmp_path / "progress.json"
+        progress_file.write_bytes(b"\xff\xfe{")
+
+        manager = StateManager(progress_file)
+
+        assert manager.load_state() is None
+
     def test_load_state_invalid_structure(self, tmp_path):
         """Test validates state structure (returns None for invalid structure)."""
         progress_file = tmp_path / "progress.json"
@@ -199,6 +236,33 @@ class TestStateManagerLoadState:
         # Should return None because no expected fields are present
         assert state is None
 
+    def test_load_state_unchanged_file_parsed_once(self, tmp_path):
+        """Test reuses the parsed state while the file is unchanged."""
+        progress_file = tmp_path / "progress.json"
+        progress_file.write_text(json.dumps({"total_deleted": 7}))
+
+        manager = StateManager(progress_file)
+        with patch("src.utils.state_manager._loads", wraps=_loads) as mock_load:
+            first = manager.load_state()
+            second = manager.load_state()
+
+        assert mock_load.call_count == 1
+        assert first == second == {"total_deleted": 7}
+        # Callers get independent copies
+        first["total_deleted"] = 99
+        assert manager.load_state()["total_deleted"] == 7
+
+    def test_load_state_changed_file_reparsed(self, tmp_path):
+        """Test re-reads the file after it changes on disk."""
+        progress_file = tmp_path / "progress.json"
+        progress_file.write_text(json.dumps({"total_deleted": 7}))
+
+        manager = StateManager(progress_file)
+        manager.load_state()
+        manager.update_state(total_deleted=8)
+
+        assert manager.load_state()["total_deleted"] == 8
+
     def test_load_state_updates_state_attribute(self, tmp_path):
         """Test updates _state after successful load."""
         progress_file = tmp_path / "progress.json"
@@ -241,6 +305,31 @@ class TestStateManagerSaveState:
         assert loaded["total_deleted"] == 25
         assert "last_updated" in loaded
 
+    def test_save_state_roundtrip_without_orjson(self, tmp_path):
+        """Test falls back to stdlib json when orjson is not installed."""
+        progress_file = tmp_path / "progress.json"
+
+        manager = StateManager(progress_file)
+        with patch("src.utils.state_manager.orjson", None):
+            manager.save_state({"total_deleted": 3, "last_url": "https://mbasic.facebook.com/é"})
+            loaded = StateManager(progress_file).load_state()
+
+        assert loaded["total_deleted"] == 3
+        assert loaded["last_url"] == "https://mbasic.facebook.com/é"
+
+    def test_save_state_unserializable_leaves_file_untouched(self, tmp_path):
+        """Test a state that cannot be serialized does not modify existing files."""
+        progress_file = tmp_path / "progress.json"
+        manager = StateManager(progress_file)
+        manager.save_state({"total_deleted": 1})
+        original = progress_file.read_bytes()
+
+        manager.save_state({"total_deleted": 2, "bad": object()})
+
+        assert progress_file.read_bytes() == original
+        assert not (tmp_path / "progress.json.bak").exists()
+        assert not (tmp_path / "progress.json.tmp").exists()
+
     def test_save_state_creates_backup(self, tmp_path):
         """Test creates backup (.json.bak) if file exists."""
         progress_file = tmp_path / "progress.json"
@@ -409,14 +498,30 @@ class TestStateManagerClearState:
         assert manager._state is None
 
     def test_clear_state_no_file_no_error(self, tmp_path):
-        """Test doesn't raise error if file doesn't exist."""
+        """Test doesn't raise or report a clear if file doesn't exist."""
         progress_file = tmp_path / "progress.json"
 
         manager = StateManager(progress_file)
 
         # Should not raise
-        manager.clear_state()
+        with patch("src.utils.state_manager.logger") as mock_logger:
+            manager.clear_state()
+
         assert manager._state is None
+        mock_logger.info.assert_not_called()
+
+    def test_clear_state_idempotent(self, tmp_path):
+        """Test clearing twice in a row removes the file once and never raises."""
+        progress_file = tmp_path / "progress.json"
+
+        manager = StateManager(progress_file)
+        manager.save_state()
+
+        manager.clear_state()
+        manager.clear_state()
+
+        assert not progress_file.exists()
+        assert manager.load_state() is None
 
 
 @pytest.mark.unit
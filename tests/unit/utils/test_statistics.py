@@ -2,7 +2,7 @@
 Tests for StatisticsReporter class.
 """
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 